@@ -1,5 +1,6 @@
 import flopy
 import os
+import numpy as np
 from nose.tools import raises
 
 
@@ -10,7 +11,9 @@ def test_loadfreyberg():
     assert (os.path.isdir(pth))
     os.chdir(pth)
     namefile = 'freyberg.nam'
-    ml = flopy.modflow.Modflow.load(namefile, verbose=True)
+    # check without writing a .chk file into the example data
+    ml = flopy.modflow.Modflow.load(namefile, verbose=True, check=False)
+    ml.check(verbose=False, level=0)
     os.chdir(cwd)
     assert isinstance(ml, flopy.modflow.Modflow)
     assert ml.load_fail is False
@@ -24,7 +27,9 @@ def test_loadoahu():
     assert (os.path.isdir(pth))
     os.chdir(pth)
     namefile = 'Oahu_01.nam'
-    ml = flopy.modflow.Modflow.load(namefile, verbose=True)
+    # check without writing a .chk file into the example data
+    ml = flopy.modflow.Modflow.load(namefile, verbose=True, check=False)
+    ml.check(verbose=False, level=0)
     os.chdir(cwd)
     assert isinstance(ml, flopy.modflow.Modflow)
     assert ml.load_fail is False
@@ -38,7 +43,9 @@ def test_loadtwrip():
     assert (os.path.isdir(pth))
     os.chdir(pth)
     namefile = 'twrip.nam'
-    ml = flopy.modflow.Modflow.load(namefile, verbose=True)
+    # check without writing a .chk file into the example data
+    ml = flopy.modflow.Modflow.load(namefile, verbose=True, check=False)
+    ml.check(verbose=False, level=0)
     os.chdir(cwd)
     assert isinstance(ml, flopy.modflow.Modflow)
     assert ml.load_fail is False
@@ -52,7 +59,9 @@ def test_loadtwrip_upw():
     assert (os.path.isdir(pth))
     os.chdir(pth)
     namefile = 'twrip_upw.nam'
-    ml = flopy.modflow.Modflow.load(namefile, verbose=True)
+    # check without writing a .chk file into the example data
+    ml = flopy.modflow.Modflow.load(namefile, verbose=True, check=False)
+    ml.check(verbose=False, level=0)
     os.chdir(cwd)
     assert isinstance(ml, flopy.modflow.Modflow)
     assert ml.load_fail is False
@@ -111,6 +120,83 @@ def test_loadoc_nstpfail():
     return
 
 
+def test_load_parallel():
+    for pth, namefile in [
+        (os.path.join('..', 'examples', 'data', 'freyberg'), 'freyberg.nam'),
+        (os.path.join('..', 'examples', 'data', 'parameters'), 'twrip.nam'),
+        (os.path.join('..', 'examples', 'data', 'mf2005_test'), 'str.nam'),
+    ]:
+        ml = flopy.modflow.Modflow.load(namefile, model_ws=pth, check=False)
+        ml2 = flopy.modflow.Modflow.load(namefile, model_ws=pth,
+                                         check=False, max_workers=2)
+        assert ml2.load_fail is False
+        assert [p.name for p in ml2.packagelist] == \
+               [p.name for p in ml.packagelist]
+        for p in ml2.packagelist:
+            assert p.parent is ml2
+        for attr in ['free_format_input', 'package_units', 'pop_key_list',
+                     'external_units', 'output_units', 'output_fnames']:
+            assert getattr(ml2, attr) == getattr(ml, attr), attr
+    assert np.array_equal(ml2.str.stress_period_data[0],
+                          ml.str.stress_period_data[0])
+    assert np.array_equal(ml2.bcf6.tran.array, ml.bcf6.tran.array)
+
+    return
+
+
+def test_load_parallel_shared_data():
+    # rch and evt read their arrays one after another from the same file
+    ws = os.path.join('temp', 't003')
+    if not os.path.isdir(ws):
+        os.makedirs(ws)
+    files = {
+        'shared.nam': 'LIST 2 shared.list\nDIS 11 shared.dis\n'
+                      'BAS6 13 shared.bas\nRCH 19 shared.rch\n'
+                      'EVT 20 shared.evt\nWEL 21 shared.wel\n'
+                      'DATA 50 shared.dat\n',
+        'shared.dis': '1 3 4 1 4 2\n0\nCONSTANT 1.\nCONSTANT 1.\n'
+                      'CONSTANT 10.\nCONSTANT 0.\n1. 1 1. SS\n',
+        'shared.bas': 'FREE\nCONSTANT 1\n-999.\nCONSTANT 5.\n',
+        'shared.rch': '1 0\n1\nEXTERNAL 50 1. (FREE) -1\n',
+        'shared.evt': '1 0\n1 1 1\nEXTERNAL 50 1. (FREE) -1\n'
+                      'EXTERNAL 50 1. (FREE) -1\n'
+                      'EXTERNAL 50 1. (FREE) -1\n',
+        'shared.wel': '1 0\nnot a number\n',
+        'shared.dat': '\n'.join(' '.join(str(4 * i + j) for j in range(4))
+                                for i in range(12)) + '\n',
+    }
+    for fname, text in files.items():
+        with open(os.path.join(ws, fname), 'w') as f:
+            f.write(text)
+    values = np.arange(48.).reshape(4, 3, 4)
+
+    pop_key_list = None
+    for max_workers in [1, 2]:
+        ml = flopy.modflow.Modflow.load('shared.nam', model_ws=ws,
+                                        check=False, forgive=True,
+                                        max_workers=max_workers)
+        assert ml.load_fail is True
+        assert ml.wel is None
+        assert np.array_equal(ml.rch.rech[0].array, values[0])
+        assert np.array_equal(ml.evt.surf[0].array, values[1])
+        assert np.array_equal(ml.evt.evtr[0].array, values[2])
+        assert np.array_equal(ml.evt.exdp[0].array, values[3])
+        assert 50 in ml.pop_key_list
+        if pop_key_list is not None:
+            assert ml.pop_key_list == pop_key_list
+        pop_key_list = ml.pop_key_list
+
+        try:
+            flopy.modflow.Modflow.load('shared.nam', model_ws=ws,
+                                       check=False, max_workers=max_workers)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('WEL load error was not raised')
+
+    return
+
+
 @raises(IOError)
 def test_load_nam_mf_nonexistant_file():
     ml = flopy.modflow.Modflow.load('nonexistant.nam')
@@ -131,3 +217,5 @@ if __name__ == '__main__':
     test_loadoahu()
     test_loadtwrip()
     test_loadtwrip_upw()
+    test_load_parallel()
+    test_load_parallel_shared_data()
@@ -73,6 +73,47 @@ def test_load_txt_fixed():
     assert fa.dtype == a.dtype
 
 
+def test_load_txt_blocks():
+    # arrays are converted in blocks of text, check that the file is left
+    # at the end of the last line of the array
+    text = dedent(u'''\
+        1.0 2.0 3*3.5
+        4,5 6 # comment
+        INTERNAL 1.0 (FREE) -1
+    ''')
+    a = np.array([1., 2., 3.5, 3.5, 3.5, 4., 5., 6.], dtype=np.float32)
+    chunk_size = Util2d._text_chunk_size
+    try:
+        for size in (2 ** 20, 4, 20):
+            Util2d._text_chunk_size = size
+            fp = StringIO(text)
+            fa = Util2d.load_txt((2, 4), fp, np.float32, '(FREE)')
+            np.testing.assert_equal(fa, a.reshape((2, 4)))
+            assert fp.readline() == 'INTERNAL 1.0 (FREE) -1\n'
+    finally:
+        Util2d._text_chunk_size = chunk_size
+
+    # integers written as floats are not converted
+    fp = StringIO(u'1 2 3.0 4\n')
+    try:
+        Util2d.load_txt((4,), fp, np.int32, '(FREE)')
+        assert False, 'load_txt should fail'
+    except ValueError:
+        pass
+
+    # fixed width values, blank columns are skipped
+    fp = StringIO(dedent(u'''\
+         1.5E+00-2.5E+00        3.0
+          4.
+            5.   6.0E-1
+        next line
+    '''))
+    fa = Util2d.load_txt((5,), fp, np.float32, '(3E8.1)')
+    np.testing.assert_equal(fa, np.array([1.5, -2.5, 4., 5., 0.6],
+                                         dtype=np.float32))
+    assert fp.readline() == 'next line\n'
+
+
 def test_load_block():
     a = np.ones((2, 5), dtype=np.int32) * 4
     fp = StringIO(dedent(u'''\
@@ -781,6 +822,128 @@ def test_util3d_reset():
     ml.bas6.strt = arr
 
 
+def test_util2d_lazy_load():
+    model_ws = os.path.join(out_dir, "lazy")
+    nlay, nrow, ncol, nper = 2, 4, 5, 10
+    ml = flopy.modflow.Modflow("lazy", model_ws=model_ws,
+                               external_path="ref")
+    flopy.modflow.ModflowDis(ml, nlay, nrow, ncol, nper=nper,
+                             botm=[-10., -20.])
+    flopy.modflow.ModflowBas(ml)
+    hk = np.random.random((nlay, nrow, ncol))
+    flopy.modflow.ModflowLpf(ml, hk=hk)
+    ml.lpf.vka[1].format.binary = True
+    rech = {kper: np.random.random((nrow, ncol)) for kper in range(nper)}
+    flopy.modflow.ModflowRch(ml, rech=rech)
+    ml.write_input()
+
+    ml = flopy.modflow.Modflow.load("lazy.nam", model_ws=model_ws,
+                                    check=False, lazy_load=True)
+    # open/close arrays are not read on load
+    u2ds = ml.lpf.hk.util_2ds + [ml.lpf.vka[1]] + \
+           list(ml.rch.rech.transient_2ds.values())
+    for u2d in u2ds:
+        assert u2d.vtype == str
+        assert u2d._Util2d__value_built is None
+    assert ml.lpf.vka[1].format.binary
+    assert np.allclose(ml.lpf.hk.array, hk)
+    assert np.allclose(ml.lpf.vka.array, 1.)
+
+    # only the most recently used arrays are kept in memory
+    lazy_cache_size = Util2d.lazy_cache_size
+    Util2d.lazy_cache_size = 3
+    try:
+        for kper in range(nper):
+            assert np.allclose(ml.rch.rech[kper].array, rech[kper])
+        built = [u2d._Util2d__value_built is not None for u2d in u2ds]
+        assert built == (nlay + 1 + nper - 3) * [False] + 3 * [True]
+    finally:
+        Util2d.lazy_cache_size = lazy_cache_size
+
+    # unchanged arrays are written by copying their files
+    ml.rch.rech[1] = 1.
+    ml.change_model_ws(os.path.join(model_ws, "copy"))
+    ml.write_input()
+    for fname in ["hk_layer_2.ref", "vka2.ref", "rech_0.ref"]:
+        with open(os.path.join(model_ws, "ref", fname), "rb") as f:
+            data = f.read()
+        with open(os.path.join(model_ws, "copy", "ref", fname), "rb") as f:
+            assert f.read() == data
+    ml = flopy.modflow.Modflow.load("lazy.nam", check=False,
+                                    model_ws=os.path.join(model_ws, "copy"))
+    assert np.allclose(ml.lpf.hk.array, hk)
+    assert np.allclose(ml.rch.rech[0].array, rech[0])
+    assert np.allclose(ml.rch.rech[1].array, 1.)
+    assert np.allclose(ml.rch.rech[2].array, rech[2])
+
+
+
+def test_shared_stress_periods():
+    model_ws = os.path.join(out_dir, "shared")
+    nrow, ncol, nper = 4, 5, 6
+    ml = flopy.modflow.Modflow("shared", model_ws=model_ws)
+    flopy.modflow.ModflowDis(ml, 1, nrow, ncol, nper=nper)
+    flopy.modflow.ModflowBas(ml)
+    rech = {kper: np.full((nrow, ncol), 0.001) for kper in range(nper)}
+    rech[3] = np.full((nrow, ncol), 0.002)
+    rch = flopy.modflow.ModflowRch(ml, rech=rech)
+    sp_data = {kper: [[0, 1, 1, -100.0], [0, 2, 3, -50.0]]
+               for kper in range(nper)}
+    sp_data[3] = [[0, 1, 1, -10.0]]
+    wel = flopy.modflow.ModflowWel(ml, stress_period_data=sp_data)
+
+    # identical stress periods share one array
+    arrays = [rch.rech[kper]._array for kper in range(nper)]
+    assert arrays[0] is arrays[1] is arrays[5]
+    assert arrays[3] is not arrays[0]
+    data = wel.stress_period_data._MfList__data
+    assert data[0] is data[1] is data[5]
+    assert data[3] is not data[0]
+
+    # returned stress period data can be changed without changing the
+    # stress periods that share it
+    spd = wel.stress_period_data
+    assert spd[0] is not spd[1]
+    spd[4]["flux"] *= 2.
+    assert np.allclose(spd[4]["flux"], [-200., -100.])
+    assert np.allclose(spd[5]["flux"], [-100., -50.])
+    spd.data[1]["flux"] = -1.
+    assert np.allclose(spd[0]["flux"], [-100., -50.])
+    spd.data[1]["flux"] = [-100., -50.]
+    # a copy has the same content, but is not shared
+    spd[5] = spd[4].copy()
+
+    # stress periods with the same data as the previous one are written as
+    # reusing it, but only when the package writer asks for it
+    itmp = [rch.rech.get_kper_entry(kper)[0] for kper in range(nper)]
+    assert itmp == [1, 1, 1, 1, 1, 1]
+    itmp = [rch.rech.get_kper_entry(kper, reuse=True)[0]
+            for kper in range(nper)]
+    assert itmp == [1, -1, -1, 1, 1, -1]
+    ml.write_input()
+    with open(os.path.join(model_ws, "shared.wel")) as f:
+        itmp = [int(line.split()[0]) for line in f
+                if "stress period" in line]
+    assert itmp == [2, -1, -1, 1, 2, -1]
+    with open(os.path.join(model_ws, "shared.rch")) as f:
+        inrech = [int(line.split()[0]) for line in f
+                  if "Stress period" in line]
+    assert inrech == [1, -1, -1, 1, 1, -1]
+
+    # the array of a parameterized stress period is not reused
+    p = flopy.pest.Params("rch", "rech", "RECH_1", 0.001, 1e-5, 1.,
+                          {"kpers": [1], "idx": None})
+    tpl = flopy.pest.tplarray.Transient2dTpl(rch.rech)
+    tpl.add_parameter(p)
+    itmp = [tpl.get_kper_entry(kper, reuse=True)[0] for kper in range(nper)]
+    assert itmp == [1, 1, 1, 1, 1, -1]
+
+    ml = flopy.modflow.Modflow.load("shared.nam", model_ws=model_ws,
+                                    check=False)
+    for kper in range(nper):
+        assert np.allclose(ml.rch.rech[kper].array, rch.rech[kper].array)
+        assert np.array_equal(ml.wel.stress_period_data[kper], spd[kper])
+
 
 if __name__ == '__main__':
     # test_util3d_reset()
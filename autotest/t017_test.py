@@ -3,6 +3,7 @@ import os
 import shutil
 import numpy as np
 import flopy
+from struct import pack
 from nose.tools import assert_raises
 
 cpth = os.path.join('temp', 't017')
@@ -48,6 +49,32 @@ def test_formattedfile_read():
     return
 
 
+def test_formattedfile_fixed_width():
+    # write a formatted head file with values that run into each other
+    nlay, nrow, ncol = 2, 3, 7
+    fmt = '(5E10.3)'
+    fpth = os.path.join(cpth, 'fixed_width.fhd')
+    data = -1.e30 * np.ones((2, nlay, nrow, ncol))
+    data[:, :, 1, 2:5] = np.arange(6).reshape(2, 1, 3) + 0.5
+    with open(fpth, 'w') as f:
+        for n in range(2):
+            for k in range(nlay):
+                f.write('{:6d}{:6d}{:15.6E}{:15.6E} {:>16s}{:6d}{:6d}{:6d} '
+                        '{}\n'.format(n + 1, 1, n + 1., n + 1., 'HEAD',
+                                       ncol, nrow, k + 1, fmt))
+                for i in range(nrow):
+                    for j0 in range(0, ncol, 5):
+                        f.write(''.join('{:10.3E}'.format(v) for v in
+                                        data[n, k, i, j0:j0 + 5]) + '\n')
+
+    h = flopy.utils.FormattedHeadFile(fpth)
+    assert h.get_times() == [1., 2.]
+    assert np.allclose(h.get_alldata(nodata=None), data)
+    ts = h.get_ts([(0, 1, 3), (1, 1, 4), (1, 2, 6)])
+    assert np.allclose(ts[:, 1:], data[:, [0, 1, 1], [1, 1, 2], [3, 4, 6]])
+    h.close()
+
+
 def test_binaryfile_read():
 
     h = flopy.utils.HeadFile(
@@ -99,6 +126,417 @@ def test_binaryfile_read_context():
     assert str(e.exception) == 'seek of closed file', str(e.exception)
 
 
+def test_binaryfile_memmap():
+    hds_path = os.path.join(
+            '..', 'examples', 'data', 'freyberg', 'freyberg.githds')
+    h = flopy.utils.HeadFile(hds_path)
+    hm = flopy.utils.HeadFile(hds_path, memmap=True)
+    for totim in h.get_times():
+        h0 = h.get_data(totim=totim)
+        h1 = hm.get_data(totim=totim)
+        assert np.array_equal(h0, h1), \
+            'memmap head read != head read for totim {}'.format(totim)
+        assert not h1.flags.writeable, 'memmap head array is writeable'
+        assert np.shares_memory(h1, hm._get_mmap()), \
+            'memmap head array is a copy of the file data'
+    assert np.array_equal(h.get_alldata(), hm.get_alldata())
+    assert np.array_equal(h.get_data(mflay=0), hm.get_data(mflay=0))
+    h.close()
+    hm.close()
+
+    with assert_raises(ValueError):
+        hm.get_data()
+
+
+def test_binaryfile_index_cache():
+    # write a head file with 3 times
+    fpth = os.path.join(cpth, 'index_cache.hds')
+    if os.path.isfile(fpth + '.idx.npz'):
+        os.remove(fpth + '.idx.npz')
+    nrow, ncol = 5, 4
+
+    def write_records(f, times):
+        for totim in times:
+            for k in range(2):
+                header = flopy.utils.BinaryHeader.create(
+                    bintype='head', precision='single', text='head',
+                    nrow=nrow, ncol=ncol, ilay=k + 1, pertim=totim,
+                    totim=totim, kstp=int(totim), kper=1)
+                header.tofile(f)
+                a = np.full((nrow, ncol), 10. * totim + k, dtype=np.float32)
+                a.tofile(f)
+
+    with open(fpth, 'wb') as f:
+        write_records(f, [1., 2., 3.])
+
+    h = flopy.utils.HeadFile(fpth, cache_index=True)
+    assert os.path.isfile(fpth + '.idx.npz'), 'index cache not written'
+    h1 = flopy.utils.HeadFile(fpth, cache_index=True)
+    assert np.array_equal(h.recordarray, h1.recordarray)
+    assert np.array_equal(h.iposarray, h1.iposarray)
+    assert h.get_times() == h1.get_times() == [1., 2., 3.]
+    assert np.array_equal(h.get_alldata(), h1.get_alldata())
+    h.close()
+    h1.close()
+
+    # append one more time and a partially written record
+    with open(fpth, 'ab') as f:
+        write_records(f, [4.])
+        header = flopy.utils.BinaryHeader.create(
+            bintype='head', precision='single', text='head', nrow=nrow,
+            ncol=ncol, ilay=1, pertim=5., totim=5., kstp=5, kper=1)
+        header.tofile(f)
+        np.ones(3, dtype=np.float32).tofile(f)
+    h = flopy.utils.HeadFile(fpth, cache_index=True)
+    assert h.get_times() == [1., 2., 3., 4.], h.get_times()
+    assert np.allclose(h.get_data(totim=4.), [[[40.]], [[41.]]])
+    ts = h.get_ts((1, 2, 3))
+    assert np.allclose(ts[:, 1], [11., 21., 31., 41.])
+    h.close()
+
+    # budget file index cache
+    cbc_fname = os.path.join(
+            '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    fpth = os.path.join(cpth, 'index_cache.cbc')
+    shutil.copy(cbc_fname, fpth)
+    if os.path.isfile(fpth + '.idx.npz'):
+        os.remove(fpth + '.idx.npz')
+    v0 = flopy.utils.CellBudgetFile(fpth)
+    v = flopy.utils.CellBudgetFile(fpth, cache_index=True)
+    v1 = flopy.utils.CellBudgetFile(fpth, cache_index=True)
+    for obj in (v, v1):
+        assert np.array_equal(v0.recordarray, obj.recordarray)
+        assert np.array_equal(v0.iposheader, obj.iposheader)
+        assert np.array_equal(v0.iposarray, obj.iposarray)
+        assert v0.get_times() == obj.get_times()
+        assert v0.get_kstpkper() == obj.get_kstpkper()
+        assert v0.get_unique_record_names() == obj.get_unique_record_names()
+        t0 = v0.get_data(text='STREAM LEAKAGE')
+        t1 = obj.get_data(text='STREAM LEAKAGE')
+        assert all(np.array_equal(a, b) for a, b in zip(t0, t1))
+        obj.close()
+    v0.close()
+
+
+def test_binaryfile_refresh():
+    src = os.path.join('..', 'examples', 'data', 'mf6', 'test045_lake2tr',
+                       'expected_output', 'lakeex2a_adj.hds')
+    h0 = flopy.utils.HeadFile(src)
+    with open(src, 'rb') as f:
+        content = f.read()
+    # start with the first record and part of the second record
+    nbytes = h0.iposarray[1] - 10
+    fpth = os.path.join(cpth, 'refresh.hds')
+    with open(fpth, 'wb') as f:
+        f.write(content[:nbytes])
+    h = flopy.utils.HeadFile(fpth, memmap=True)
+    assert len(h.recordarray) == 1, 'partial record was indexed'
+    assert h.refresh() == 0
+
+    with open(fpth, 'ab') as f:
+        f.write(content[nbytes:])
+    records = list(h.follow(interval=0.01, timeout=0.05))
+    assert len(records) == len(h0.recordarray) - 1
+    assert np.array_equal(h.recordarray, h0.recordarray)
+    assert np.array_equal(h.iposarray, h0.iposarray)
+    assert h.get_times() == h0.get_times()
+    for header, data in records:
+        ilay = header['ilay'] - 1
+        expected = h0.get_data(totim=header['totim'], mflay=ilay)
+        assert np.array_equal(data, expected)
+    h.close()
+    h0.close()
+
+    src = os.path.join('..', 'examples', 'data', 'mf6-freyberg',
+                       'freyberg.cbc')
+    v0 = flopy.utils.CellBudgetFile(src)
+    with open(src, 'rb') as f:
+        content = f.read()
+    nbytes = v0.iposheader[3] + 50
+    fpth = os.path.join(cpth, 'refresh.cbc')
+    with open(fpth, 'wb') as f:
+        f.write(content[:nbytes])
+    v = flopy.utils.CellBudgetFile(fpth)
+    assert v.get_nrecords() == 3, 'partial record was indexed'
+
+    with open(fpth, 'ab') as f:
+        f.write(content[nbytes:])
+    assert v.refresh() == v0.get_nrecords() - 3
+    assert np.array_equal(v.recordarray, v0.recordarray)
+    assert np.array_equal(v.iposarray, v0.iposarray)
+    assert v.get_times() == v0.get_times()
+    assert v.get_kstpkper() == v0.get_kstpkper()
+    assert v.get_unique_record_names() == v0.get_unique_record_names()
+    assert len(list(v.follow(interval=0.01, timeout=0.01))) == 0
+    v.close()
+    v0.close()
+
+
+
+def test_binaryfile_refresh_empty():
+    # files with only a partially written first record
+    src = os.path.join('..', 'examples', 'data', 'freyberg',
+                       'freyberg.githds')
+    h0 = flopy.utils.HeadFile(src)
+    with open(src, 'rb') as f:
+        content = f.read()
+    fpth = os.path.join(cpth, 'refresh_empty.hds')
+    with open(fpth, 'wb') as f:
+        f.write(content[:144])
+    h = flopy.utils.HeadFile(fpth)
+    assert len(h.recordarray) == 0
+    assert h.get_times() == []
+    with open(fpth, 'ab') as f:
+        f.write(content[144:])
+    assert h.refresh() == len(h0.recordarray)
+    assert h.nlay == h0.nlay
+    assert np.array_equal(h.get_data(), h0.get_data())
+    h.close()
+    h0.close()
+
+    src = os.path.join('..', 'examples', 'data', 'mf6-freyberg',
+                       'freyberg.cbc')
+    v0 = flopy.utils.CellBudgetFile(src)
+    with open(src, 'rb') as f:
+        content = f.read()
+    for nbytes in (60, 200):
+        fpth = os.path.join(cpth, 'refresh_empty.cbc')
+        with open(fpth, 'wb') as f:
+            f.write(content[:nbytes])
+        v = flopy.utils.CellBudgetFile(fpth)
+        assert v.get_nrecords() == 0
+        assert v.get_unique_record_names() == []
+        with open(fpth, 'ab') as f:
+            f.write(content[nbytes:])
+        assert v.refresh() == v0.get_nrecords()
+        assert v.realtype == v0.realtype
+        assert v.nper == v0.nper
+        assert np.array_equal(v.recordarray, v0.recordarray)
+        v.close()
+    v0.close()
+
+def test_binaryfile_iter_data():
+    hds_path = os.path.join(
+            '..', 'examples', 'data', 'freyberg', 'freyberg.githds')
+    h = flopy.utils.HeadFile(hds_path)
+    alldata = h.get_alldata()
+    times = h.get_times()
+
+    # one time at a time
+    n = 0
+    for kk, totim, data in h.iter_data():
+        assert np.array_equal(data, alldata[n])
+        assert totim == times[n]
+        n += 1
+    assert n == len(times)
+
+    # blocks limited by the memory budget
+    nbytes = alldata[0].size * 4
+    blocks = [block for kk, totim, block in
+              h.iter_data(max_memory=nbytes)]
+    assert len(blocks) == len(times)
+    blocks = [block for kk, totim, block in h.iter_data(chunk=2)]
+    assert np.array_equal(np.concatenate(blocks), alldata)
+
+    # reductions over the stream
+    hmax, hmin, hmean, nexceed = h.reduce(
+        [flopy.utils.RunningMax(), flopy.utils.RunningMin(),
+         flopy.utils.RunningMean(), flopy.utils.ExceedanceCount(20.)],
+        max_memory=nbytes)
+    assert np.allclose(hmax, alldata.max(axis=0))
+    assert np.allclose(hmin, alldata.min(axis=0))
+    assert np.allclose(hmean, alldata.mean(axis=0))
+    assert np.array_equal(nexceed, (alldata > 20.).sum(axis=0))
+    h.close()
+
+    cbc_fname = os.path.join(
+            '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    storage = np.array(v.get_data(text='STORAGE'))
+    blocks = [block for kk, totim, block in
+              v.iter_data('STORAGE', chunk=3)]
+    assert np.array_equal(np.concatenate(blocks), storage)
+    qmax = v.reduce(flopy.utils.RunningMax(), 'STORAGE')
+    assert np.allclose(qmax, storage.max(axis=0))
+    with assert_raises(Exception):
+        next(v.iter_data('WELLS', chunk=3))
+    v.close()
+
+    # MODFLOW 6 list records are scattered to their nodes
+    cbc_fname = os.path.join('..', 'examples', 'data', 'mf6-freyberg',
+                             'freyberg.cbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    wel = v.get_data(text='WEL')[0]
+    qmean = v.reduce(flopy.utils.RunningMean(), 'WEL')
+    assert np.isfinite(qmean).sum() == len(wel)
+    assert np.allclose(qmean.ravel()[wel['node'] - 1], wel['q'])
+    v.close()
+
+
+def test_ensemblefile():
+    # copy a head and budget file to a small ensemble
+    fnames = {'hds': [], 'cbc': [], 'fhd': []}
+    for ext, src in (('hds', ('preserve_unitnums', 'testsfr2.hds')),
+                     ('cbc', ('mf2005_test', 'test1tr.gitcbc')),
+                     ('fhd', ('mf2005_test', 'test1tr.githds'))):
+        pth = os.path.join('..', 'examples', 'data', *src)
+        for i in range(3):
+            fpth = os.path.join(cpth, 'ensemble{}.{}'.format(i, ext))
+            shutil.copyfile(pth, fpth)
+            fnames[ext].append(fpth)
+
+    h = flopy.utils.HeadFile(fnames['hds'][0])
+    with flopy.utils.EnsembleFile(fnames['hds'], max_workers=2) as ens:
+        assert len(ens) == 3
+        for f in ens.files[1:]:
+            assert f.recordarray is ens.files[0].recordarray
+        assert ens.get_times() == h.get_times()
+        data = ens.get_data(idx=1)
+        assert data.shape == (3,) + h.get_data(idx=1).shape
+        for d in data:
+            assert np.array_equal(d, h.get_data(idx=1))
+        alldata = ens.get_alldata(mflay=0)
+        assert alldata.shape == (3,) + h.get_alldata(mflay=0).shape
+        ts = ens.get_ts([(0, 3, 5), (0, 6, 90)])
+        assert ts.shape == (3, len(h.get_times()), 3)
+        assert np.allclose(ts[1], h.get_ts([(0, 3, 5), (0, 6, 90)]))
+    h.close()
+
+    v = flopy.utils.CellBudgetFile(fnames['cbc'][0])
+    with flopy.utils.EnsembleFile(fnames['cbc'],
+                                  flopy.utils.CellBudgetFile) as ens:
+        assert ens.files[2].iposarray is ens.files[0].iposarray
+        q = ens.get_data(text='STORAGE', kstpkper=(0, 0))
+        assert np.array_equal(
+            q[2], np.array(v.get_data(text='STORAGE', kstpkper=(0, 0))))
+        ts = ens.get_ts((0, 7, 5), text='STORAGE')
+        assert np.allclose(ts[0], v.get_ts((0, 7, 5), text='STORAGE'))
+    v.close()
+
+    h = flopy.utils.FormattedHeadFile(fnames['fhd'][0])
+    with flopy.utils.EnsembleFile(fnames['fhd'],
+                                  flopy.utils.FormattedHeadFile) as ens:
+        assert ens.files[1].recordarray is ens.files[0].recordarray
+        ts = ens.get_ts((0, 7, 5))
+        assert ts.shape == (3, len(h.get_times()), 2)
+        assert np.allclose(ts[2], h.get_ts((0, 7, 5)))
+    h.close()
+
+    # the index is not reused for a file of a different size
+    h = flopy.utils.HeadFile(fnames['hds'][0])
+    fpth = os.path.join(cpth, 'ensemble_short.hds')
+    with open(fnames['hds'][0], 'rb') as fsrc, open(fpth, 'wb') as fdst:
+        fdst.write(fsrc.read(int(h.iposarray[1]) - 44))
+    hshort = flopy.utils.HeadFile(fpth, index=h)
+    assert hshort.recordarray is not h.recordarray
+    assert len(hshort.get_times()) == 1
+    h.close()
+    hshort.close()
+
+
+def test_binaryfile_export():
+    try:
+        import pyarrow.parquet as pq
+        import zarr
+    except:
+        print('pyarrow or zarr not available...')
+        return
+
+    hds_path = os.path.join(
+            '..', 'examples', 'data', 'preserve_unitnums', 'testsfr2.hds')
+    h = flopy.utils.HeadFile(hds_path)
+    alldata = h.get_alldata(nodata=None)
+    ntimes, nlay, nrow, ncol = alldata.shape
+
+    # parquet with one row group for each block of 4 times
+    fpth = os.path.join(cpth, 'heads.parquet')
+    nbytes = 4 * alldata[0].nbytes
+    assert h.to_parquet(fpth, max_memory=nbytes) == alldata.size
+    assert pq.ParquetFile(fpth).num_row_groups == 3
+    table = pq.read_table(fpth, filters=[('totim', '==', h.get_times()[5])])
+    assert np.array_equal(table.column('value').to_numpy(),
+                          alldata[5].ravel())
+    table = pq.read_table(fpth, filters=[('row', '==', 3), ('column', '==', 7)])
+    assert np.array_equal(table.column('value').to_numpy(),
+                          alldata[:, 0, 3, 7])
+
+    # zarr chunked by time and cell
+    fpth = os.path.join(cpth, 'heads.zarr')
+    root = h.to_zarr(fpth, chunks=(ntimes, 1, 4, 50), max_memory=nbytes)
+    root = zarr.open_group(fpth, mode='r')
+    assert root['data'].shape == alldata.shape
+    assert np.array_equal(root['data'][:, 0, 3, 7], alldata[:, 0, 3, 7])
+    assert np.allclose(root['totim'][:], h.get_times())
+    h.close()
+
+    cbc_fname = os.path.join(
+            '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    fpth = os.path.join(cpth, 'budget.parquet')
+    v.to_parquet(fpth, text=['STORAGE', 'WELLS'], max_memory=2 ** 12)
+    table = pq.read_table(fpth)
+    text = table.column('text').to_numpy()
+    assert set(text) == {'STORAGE', 'WELLS'}
+    kper = table.column('kper').to_numpy()
+    storage = v.get_data(text='STORAGE', kstpkper=(0, 0))[0]
+    select = (text == 'STORAGE') & (kper == 0) & \
+             (table.column('kstp').to_numpy() == 0)
+    assert np.array_equal(table.column('value').to_numpy()[select],
+                          storage.ravel())
+    wells = v.get_data(text='WELLS', kstpkper=(0, 0))[0]
+    select = (text == 'WELLS') & (kper == 0) & \
+             (table.column('kstp').to_numpy() == 0)
+    assert np.array_equal(table.column('node').to_numpy()[select],
+                          wells['node'] - 1)
+
+    fpth = os.path.join(cpth, 'budget.zarr')
+    root = v.to_zarr(fpth, text=['STORAGE', 'WELLS'])
+    assert np.array_equal(root['STORAGE/data'][:],
+                          np.array(v.get_data(text='STORAGE')))
+    # list records are written in long format
+    wells = v.get_data(text='WELLS')
+    assert np.array_equal(root['WELLS/node'][:],
+                          np.concatenate([w['node'] - 1 for w in wells]))
+    assert np.array_equal(root['WELLS/value'][:],
+                          np.concatenate([w['q'] for w in wells]))
+    assert np.all(root['WELLS/kper'][:len(wells[0])] == 0)
+    v.close()
+
+    # MODFLOW 6 list records
+    cbc_fname = os.path.join('..', 'examples', 'data', 'mf6-freyberg',
+                             'freyberg.cbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    fpth = os.path.join(cpth, 'budget_mf6.zarr')
+    root = v.to_zarr(fpth)
+    wel = v.get_data(text='WEL')[0]
+    assert np.array_equal(root['WEL/node'][:], wel['node'] - 1)
+    assert np.array_equal(root['WEL/value'][:], wel['q'])
+    assert root['STO-SS/data'].shape == (1, 1, 40, 20)
+    v.close()
+
+    # records with a layer array (imeth = 3)
+    nlay, nrow, ncol = 3, 2, 4
+    ilayer = np.array([[1, 2, 3, 1], [2, 2, 1, 3]], dtype=np.int32)
+    rech = np.arange(nrow * ncol, dtype=np.float32).reshape(nrow, ncol)
+    fpth = os.path.join(cpth, 'imeth3.cbc')
+    with open(fpth, 'wb') as f:
+        f.write(pack('<ii16siii', 1, 1, b'        RECHARGE', ncol, nrow,
+                     -nlay))
+        f.write(pack('<ifff', 3, 1., 1., 1.))
+        f.write(ilayer.tobytes())
+        f.write(rech.tobytes())
+    v = flopy.utils.CellBudgetFile(fpth)
+    fpth = os.path.join(cpth, 'imeth3.parquet')
+    assert v.to_parquet(fpth) == nrow * ncol
+    table = pq.read_table(fpth)
+    full = v.get_data(text='RECHARGE', full3D=True)[0]
+    node = table.column('node').to_numpy()
+    assert np.array_equal(full.ravel()[node], table.column('value'))
+    assert np.array_equal(np.sort(node // (nrow * ncol)),
+                          np.sort(ilayer.ravel() - 1))
+    v.close()
+
+
 def test_cellbudgetfile_read_context():
     cbc_path = os.path.join(
             '..', 'examples', 'data', 'mf2005_test', 'mnw1.gitcbc')
@@ -257,6 +695,46 @@ def test_cellbudgetfile_readrecord():
     return
 
 
+def test_cellbudgetfile_get_ts():
+    cbc_fname = os.path.join(
+            '..', 'examples', 'data', 'mf2005_test', 'test1tr.gitcbc')
+    v = flopy.utils.CellBudgetFile(cbc_fname)
+    idx = [(0, 0, 0), (0, 7, 5), (0, 14, 9)]
+    kstpkper = v.get_kstpkper()
+
+    # array records are read at the cell positions
+    ts = v.get_ts(idx, text='STORAGE')
+    assert ts.shape == (len(kstpkper), len(idx) + 1)
+    assert np.allclose(ts[:, 0], v.get_times())
+    for itim, kk in enumerate(kstpkper):
+        d = v.get_data(kstpkper=kk, text='STORAGE')[0]
+        expected = [d[k, i, j] for k, i, j in idx]
+        assert np.allclose(ts[itim, 1:], expected)
+
+    # list records return nan for cells that are not in the list
+    ts = v.get_ts(idx, text='WELLS')
+    for itim, kk in enumerate(kstpkper):
+        d = v.get_data(kstpkper=kk, text='WELLS', full3D=True)[0]
+        for n, (k, i, j) in enumerate(idx):
+            if d.mask[k, i, j]:
+                assert np.isnan(ts[itim, n + 1])
+            else:
+                assert np.isclose(ts[itim, n + 1], d[k, i, j])
+
+    # many records in a single pass
+    tsd = v.get_ts(idx, text=['STORAGE', 'WELLS', 'ET'])
+    assert list(tsd.keys()) == ['STORAGE', 'WELLS', 'ET']
+    assert np.allclose(tsd['STORAGE'], v.get_ts(idx, text='STORAGE'))
+    assert np.allclose(tsd['WELLS'], ts, equal_nan=True)
+    for itim, kk in enumerate(kstpkper):
+        # layer-indicator array records are returned as 2D arrays
+        d = v.get_data(kstpkper=kk, text='ET', full3D=True)[0]
+        expected = [d[i, j] for k, i, j in idx]
+        assert np.allclose(tsd['ET'][itim, 1:], expected)
+    v.close()
+    return
+
+
 def test_cellbudgetfile_readrecord_waux():
 
     cbc_fname = os.path.join(
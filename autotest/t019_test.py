@@ -46,7 +46,7 @@ def test_hydmodfile_load():
     model = 'test1tr.nam'
     pth = os.path.join('..', 'examples', 'data', 'hydmod_test')
     m = flopy.modflow.Modflow.load(model, version='mf2005', model_ws=pth,
-                                   verbose=True)
+                                   verbose=True, check=False)
     hydref = m.hyd
     assert isinstance(hydref,
                       flopy.modflow.ModflowHyd), 'Did not load hydmod package...test1tr.hyd'
@@ -209,6 +209,55 @@ def test_mf6obsfile_read():
             assert isinstance(df, pd.DataFrame), 'A DataFrame was not returned'
             assert df.shape == (3, 2), 'data shape is not (3, 2)'
 
+        try:
+            import pyarrow.parquet as pq
+        except:
+            print('pyarrow not available...')
+            continue
+        fpth = os.path.join('temp', 'mf6_obs{}.parquet'.format(idx))
+        assert h.to_parquet(fpth, chunk=2) == ntimes
+        table = pq.read_table(fpth)
+        assert table.column_names == ['totim'] + labels
+        assert pq.ParquetFile(fpth).num_row_groups == 2
+        assert np.allclose(table.column('totim').to_numpy(), times)
+
+    return
+
+
+def test_mf6obsfile_refresh():
+    import os
+    import flopy
+
+    for fname, isbinary in (('maw_obs.gitbin', True),
+                            ('maw_obs.gitcsv', False)):
+        src = os.path.join('..', 'examples', 'data', 'mf6_obs', fname)
+        with open(src, 'rb') as f:
+            content = f.read()
+        h0 = flopy.utils.Mf6Obs(src, isBinary=isbinary)
+        if isbinary:
+            nheader = len(content) - h0.data.nbytes
+            nrec = h0.data.dtype.itemsize
+        else:
+            nheader = content.index(b'\n') + 1
+            nrec = content.index(b'\n', nheader) + 1 - nheader
+
+        # write the header, the first record and part of the second record
+        pth = os.path.join(mpth, 'refresh_' + fname)
+        with open(pth, 'wb') as f:
+            f.write(content[:nheader + nrec + 3])
+        h = flopy.utils.Mf6Obs(pth, isBinary=isbinary)
+        assert h.get_ntimes() == 1, 'partial record was read'
+
+        # complete the file
+        with open(pth, 'ab') as f:
+            f.write(content[nheader + nrec + 3:])
+        records = list(h.follow(interval=0.01, timeout=0.05))
+        assert len(records) == 2, 'follow did not return the new records'
+        assert h.get_ntimes() == 3
+        assert np.array_equal(h.data, h0.data), 'refreshed data differ'
+        assert h.refresh() == 0
+        h.file.close()
+        h0.file.close()
     return
 
 
@@ -40,5 +40,40 @@ def test_headu_file():
     return
 
 
+def test_headu_file_nodes():
+    fname = os.path.join('..', 'examples', 'data', 'unstructured',
+                         'headu.githds')
+    headobj = flopy.utils.HeadUFile(fname)
+    nnodes = headobj.get_nnodes()
+    assert nnodes == 19479
+
+    # full and partial node reads match the layer arrays
+    times = headobj.get_times()
+    layers = headobj.get_data(totim=times[1])
+    allnodes = np.concatenate(layers)
+    assert np.array_equal(headobj.get_node_data(totim=times[1]), allnodes)
+    nodes = [0, 7800, 7801, 14000, 19478]
+    assert np.array_equal(headobj.get_node_data(nodes, totim=times[1]),
+                          allnodes[nodes])
+    assert np.array_equal(headobj.get_node_data(slice(7700, 7900), idx=3),
+                          allnodes[7700:7900])
+    mask = np.zeros(nnodes, dtype=bool)
+    mask[::1000] = True
+    assert np.array_equal(headobj.get_node_data(mask, totim=times[1]),
+                          allnodes[mask])
+
+    # node time series
+    ts = headobj.get_ts(nodes)
+    assert ts.shape == (len(times), len(nodes) + 1)
+    assert np.allclose(ts[:, 0], times)
+    for itim, totim in enumerate(times):
+        allnodes = np.concatenate(headobj.get_data(totim=totim))
+        assert np.array_equal(ts[itim, 1:], allnodes[nodes])
+    assert np.array_equal(headobj.get_ts(14000)[:, 1], ts[:, 4])
+    headobj.close()
+    return
+
+
 if __name__ == '__main__':
     test_headu_file()
+    test_headu_file_nodes()
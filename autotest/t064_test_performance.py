@@ -4,9 +4,11 @@ Tests to prevent performance regressions
 import os
 import sys
 import shutil
+import subprocess
 import time
 import numpy as np
 import flopy.modflow as fm
+from flopy.utils import BinaryHeader, HeadFile
 
 
 class TestModflowPerformance():
@@ -100,3 +102,308 @@ class TestModflowPerformance():
     def teardown_class(cls):
         # cleanup
         shutil.rmtree(cls.model_ws)
+
+
+class TestBinaryFilePerformance():
+    """Test flopy.utils.binaryfile time series extraction performance and
+    how it scales with the number of cells and records.
+    """
+    @classmethod
+    def setup_class(cls):
+        """Write synthetic head files with a varying number of records."""
+        cls.model_ws = 'temp/t064b'
+        if not os.path.isdir(cls.model_ws):
+            os.makedirs(cls.model_ws)
+        cls.nlay, cls.nrow, cls.ncol = 3, 100, 100
+        cls.files = {}
+        for ntimes in (100, 400):
+            fpth = os.path.join(cls.model_ws, 'ts{}.hds'.format(ntimes))
+            with open(fpth, 'wb') as f:
+                for n in range(ntimes):
+                    for k in range(cls.nlay):
+                        header = BinaryHeader.create(
+                            bintype='head', precision='single', text='head',
+                            nrow=cls.nrow, ncol=cls.ncol, ilay=k + 1,
+                            pertim=n + 1., totim=n + 1., kstp=n + 1, kper=1)
+                        header.tofile(f)
+                        a = np.arange(cls.nrow * cls.ncol, dtype=np.float32)
+                        a += 1e5 * k + 1e6 * n
+                        a.tofile(f)
+            cls.files[ntimes] = fpth
+
+    def _cells(self, ncells):
+        rng = np.random.RandomState(ncells)
+        return [(int(rng.randint(self.nlay)), int(rng.randint(self.nrow)),
+                 int(rng.randint(self.ncol))) for _ in range(ncells)]
+
+    def test_get_ts_scaling(self):
+        """test get_ts time for increasing cell and record counts"""
+        target = 5.  # seconds
+        for memmap in (False, True):
+            for ntimes, fpth in sorted(self.files.items()):
+                hds = HeadFile(fpth, memmap=memmap)
+                for ncells in (1, 10, 100, 500):
+                    cells = self._cells(ncells)
+                    t0 = time.time()
+                    ts = hds.get_ts(cells)
+                    t1 = time.time() - t0
+                    print('get_ts memmap={} ntimes={} ncells={}: '
+                          '{:.3f}s'.format(memmap, ntimes, ncells, t1))
+                    assert t1 < target, \
+                        "get_ts took {:.2f}s, should take {:.1f}s".format(
+                            t1, target)
+                    k, i, j = np.array(cells).T
+                    expected = i * self.ncol + j + 1e5 * k + \
+                        1e6 * np.arange(ntimes)[:, None]
+                    assert np.allclose(ts[:, 0], np.arange(1, ntimes + 1))
+                    assert np.allclose(ts[:, 1:], expected)
+                hds.close()
+
+    @classmethod
+    def teardown_class(cls):
+        # cleanup
+        shutil.rmtree(cls.model_ws)
+
+
+class TestStartupPerformance():
+    """Test the time needed to import flopy and to build an empty MODFLOW 6
+    simulation in a new python process, which includes loading the MODFLOW 6
+    package structure.
+    """
+    script = '\n'.join([
+        'import time',
+        't0 = time.time()',
+        'import flopy',
+        't1 = time.time()',
+        'from flopy.mf6.data.mfstructure import MFStructure',
+        'MFStructure.use_cache = {}',
+        'sim = flopy.mf6.MFSimulation()',
+        'tdis = flopy.mf6.ModflowTdis(sim)',
+        'gwf = flopy.mf6.ModflowGwf(sim)',
+        't2 = time.time()',
+        'packages = sorted((name, sorted(package.blocks)) for name, package',
+        '                  in gwf.structure.package_struct_objs.items())',
+        'print(t1 - t0, t2 - t1, repr(str(packages)))',
+    ])
+
+    import_script = '\n'.join([
+        'import sys',
+        'import time',
+        't0 = time.time()',
+        'import {}',
+        't1 = time.time()',
+        'modules = [name for name in sys.modules',
+        '           if name.split(".")[0] in ("flopy", "matplotlib")]',
+        'print(t1 - t0, " ".join(sorted(modules)))',
+    ])
+
+    def _python(self, script):
+        # run from the directory that contains this version of flopy
+        path = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(fm.__file__))))
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            [path] + [p for p in [env.get('PYTHONPATH')] if p])
+        out = subprocess.check_output([sys.executable, '-c', script],
+                                      env=env)
+        return out.decode()
+
+    def _run(self, use_cache):
+        out = self._python(self.script.format(use_cache))
+        import_time, build_time, packages = out.split(None, 2)
+        return float(import_time), float(build_time), packages
+
+    def test_import_time(self):
+        """test that importing flopy or a single module is fast and does
+        not import the other subpackages"""
+        target = 1.  # seconds
+        for module in ('flopy', 'flopy.utils.binaryfile'):
+            import_time, modules = self._python(
+                self.import_script.format(module)).split(None, 1)
+            import_time = float(import_time)
+            modules = modules.split()
+            print('import {} took {:.3f}s and imported {} flopy '
+                  'modules'.format(module, import_time, len(modules)))
+            for name in ('flopy.modflow', 'flopy.mf6', 'flopy.plot',
+                         'flopy.export', 'matplotlib'):
+                assert name not in modules, \
+                    'import {} imported {}'.format(module, name)
+            assert import_time < target, \
+                "import took {:.2f}s, should take {:.1f}s".format(
+                    import_time, target)
+
+        # subpackages and classes are imported on first access
+        out = self._python('\n'.join([
+            'import flopy',
+            'print(flopy.mf6.ModflowGwfwel.__name__,',
+            '      flopy.utils.HeadFile.__name__,',
+            '      flopy.modflow.Modflow.__name__,',
+            '      "ModflowGwfwel" in dir(flopy.mf6))',
+        ]))
+        assert out.split() == ['ModflowGwfwel', 'HeadFile', 'Modflow', 'True']
+
+    def test_star_import(self):
+        """test that star imports still provide the lazily imported
+        subpackages and classes"""
+        out = self._python('\n'.join([
+            'from flopy.mf6 import *',
+            'from flopy import *',
+            'from flopy.utils import *',
+            'print(modflow.Modflow.__name__, run_model.__name__,',
+            '      MFSimulation.__name__, ModflowGwfwel.__name__,',
+            '      MFModel.__name__, coordinates.__name__,',
+            '      HeadFile.__name__, MfList.__name__)',
+        ]))
+        assert out.split() == ['Modflow', 'run_model', 'MFSimulation',
+                               'ModflowGwfwel', 'MFModel',
+                               'flopy.mf6.coordinates',
+                               'HeadFile', 'MfList']
+
+    def test_startup_time(self):
+        """test import and empty simulation build time"""
+        target = 5.  # seconds
+        _, uncached_time, uncached = self._run(False)
+        # the first cached run may need to rebuild the cache
+        self._run(True)
+        import_time, build_time, cached = self._run(True)
+        print('import flopy took {:.3f}s'.format(import_time))
+        print('empty simulation build took {:.3f}s without and {:.3f}s '
+              'with the structure cache'.format(uncached_time, build_time))
+        assert cached == uncached, \
+            'cached structure differs from the package definitions'
+        assert import_time < target, \
+            "import took {:.2f}s, should take {:.1f}s".format(
+                import_time, target)
+        assert build_time < target, \
+            "simulation build took {:.2f}s, should take {:.1f}s".format(
+                build_time, target)
+
+
+class TestMf6AccessPerformance():
+    """Microbenchmarks of attribute access and of get_data and set_data on
+    small data in a MODFLOW 6 simulation, which are dominated by the cost of
+    resolving packages, data paths and the model grid.
+    """
+    @classmethod
+    def setup_class(cls):
+        """Build a small simulation in memory."""
+        import flopy
+        cls.sim = flopy.mf6.MFSimulation(sim_ws='temp/t064c')
+        flopy.mf6.ModflowTdis(cls.sim, nper=2)
+        flopy.mf6.ModflowIms(cls.sim)
+        cls.gwf = flopy.mf6.ModflowGwf(cls.sim, modelname='gwf')
+        flopy.mf6.ModflowGwfdis(cls.gwf, nlay=2, nrow=10, ncol=10)
+        flopy.mf6.ModflowGwfnpf(cls.gwf, k=10.)
+        flopy.mf6.ModflowGwfic(cls.gwf)
+        flopy.mf6.ModflowGwfwel(cls.gwf, stress_period_data={
+            0: [((0, 5, 5), -1.)], 1: [((1, 5, 5), -2.)]})
+
+    def _time(self, label, func, target, n=200):
+        """time func and check that a call takes less than target
+        microseconds"""
+        func()
+        t0 = time.time()
+        for _ in range(n):
+            func()
+        t1 = (time.time() - t0) / n * 1e6
+        print('{} took {:.1f}us'.format(label, t1))
+        assert t1 < target, \
+            "{} took {:.0f}us, should take {:.0f}us".format(label, t1, target)
+
+    def test_attribute_access(self):
+        """test package and data attribute access time"""
+        self._time('sim.gwf', lambda: self.sim.gwf, 100.)
+        self._time('gwf.npf.k', lambda: self.gwf.npf.k, 100.)
+        self._time('data path lookup',
+                   lambda: self.sim.simulation_data.mfdata.find_in_path(
+                       ('gwf', 'npf'), 'k'), 100.)
+
+    def test_get_set_data(self):
+        """test get_data and set_data time on small data"""
+        npf = self.gwf.npf
+        wel = self.gwf.wel
+        self._time('npf.k.get_data()', lambda: npf.k.get_data(), 1000.)
+        self._time('npf.k.set_data()', lambda: npf.k.set_data(5.), 1000.)
+        self._time('npf.save_flows.set_data()',
+                   lambda: npf.save_flows.set_data(True), 1000.)
+        self._time('wel.stress_period_data.get_data()',
+                   lambda: wel.stress_period_data.get_data(1), 1000.)
+        assert np.allclose(npf.k.get_data(), 5.)
+
+    def test_cache_invalidation(self):
+        """test that cached lookups follow packages that are removed and
+        added"""
+        import flopy
+        from flopy.mf6.coordinates.modelgrid import ModelGrid
+        from flopy.mf6.utils.mfenums import DiscretizationType
+        mfdata = self.sim.simulation_data.mfdata
+        k, _ = mfdata.find_in_path(('gwf', 'npf'), 'k')
+        assert k is self.gwf.npf.k
+        self.gwf.remove_package('npf')
+        assert mfdata.find_in_path(('gwf', 'npf'), 'k') == (None, None)
+        npf = flopy.mf6.ModflowGwfnpf(self.gwf, k=2.)
+        k, _ = mfdata.find_in_path(('gwf', 'npf'), 'k')
+        assert k is npf.k
+        assert np.allclose(npf.k.get_data(), 2.)
+
+        # the grid type follows the model's discretization package
+        sim_data = self.sim.simulation_data
+        assert ModelGrid.get_grid_type(sim_data, 'gwf') == \
+            DiscretizationType.DIS
+        self.gwf.remove_package('dis')
+        assert ModelGrid.get_grid_type(sim_data, 'gwf') == \
+            DiscretizationType.UNDEFINED
+        flopy.mf6.ModflowGwfdis(self.gwf, nlay=2, nrow=10, ncol=10)
+        assert ModelGrid.get_grid_type(sim_data, 'gwf') == \
+            DiscretizationType.DIS
+
+    @classmethod
+    def teardown_class(cls):
+        # cleanup
+        if os.path.isdir('temp/t064c'):
+            shutil.rmtree('temp/t064c')
+
+
+class TestUtil2dLoadPerformance():
+    """Compare Util2d.load_txt with splitting the text into items one line
+    at a time, for representative free and fixed format descriptors.
+    """
+    @classmethod
+    def setup_class(cls):
+        """Write arrays in each format."""
+        from io import StringIO
+        from flopy.utils.util_array import Util2d
+        cls.shape = (500, 1000)
+        rng = np.random.RandomState(0)
+        a = (rng.rand(*cls.shape) * 100.).astype(np.float32)
+        ia = rng.randint(0, 100, cls.shape).astype(np.int32)
+        cls.cases = []
+        for fmt, data in (('(FREE)', a), ('(10G15.6)', a), ('(20F10.3)', a),
+                          ('(FREE)', ia), ('(25I4)', ia)):
+            f = StringIO()
+            Util2d.write_txt(cls.shape, f, data, fortran_format=fmt)
+            cls.cases.append((fmt, data, f.getvalue()))
+        # repeat counts
+        text = ' '.join('5*{}'.format(v) for v in ia.ravel()[::5])
+        cls.cases.append(('(FREE)', np.repeat(ia.ravel()[::5], 5), text))
+
+    def test_load_txt(self):
+        """test load_txt time and results"""
+        from io import StringIO
+        from flopy.utils.util_array import Util2d, ArrayFormat
+        target = 5.  # seconds
+        for fmt, data, text in self.cases:
+            npl, _, width, _ = ArrayFormat.decode_fortran_descriptor(fmt)
+            t0 = time.time()
+            a = Util2d.load_txt(self.shape, StringIO(text), data.dtype, fmt)
+            t1 = time.time() - t0
+            t0 = time.time()
+            b, _ = Util2d._items_to_values(text.split('\n'), data.dtype,
+                                           data.size, npl, width)
+            t2 = time.time() - t0
+            print('load_txt {} {} took {:.3f}s, one line at a time took '
+                  '{:.3f}s'.format(fmt, data.dtype, t1, t2))
+            assert np.array_equal(a.ravel(), b)
+            assert np.allclose(a.ravel(), data.ravel(), atol=1e-3)
+            assert t1 < target, \
+                "load_txt took {:.2f}s, should take {:.1f}s".format(t1, target)
@@ -133,5 +133,43 @@ def test_ulstrd():
     return
 
 
+def test_ulstrd_formats():
+    # lists are read in one block when possible, otherwise one line at a
+    # time, and both must give the same results
+    from io import StringIO
+    from flopy.utils.flopy_io import ulstrd
+    m = flopy.modflow.Modflow(model_ws=tpth)
+    dtype = flopy.modflow.ModflowRiv.get_default_dtype()
+    dtype = np.dtype(dtype.descr + [('auxsfac', np.float32)])
+    expected = np.array([(1, 2, 3, 4.5, 100., 0.25, 2.),
+                         (2, 3, 4, 5., 6., 0., 0.),
+                         (3, 4, 5, 6., 7., 8., 1.)], dtype=dtype)
+    expected['cond'] *= 2. * expected['auxsfac']
+    free = ['sfac 2\n',
+            '1 2 3 4.5 1e2 0.25 2. extra values\n',
+            '2 3 4 5 6\n',
+            '3 4 5 6 7 8 1\n']
+    fixed = ['sfac 2\n',
+             '         1         2         3       4.5     1.e+2      0.25'
+             '        2.\n',
+             '         2         3         4         5         6\n',
+             '         3         4         5       6.0       7.0\t     8.0'
+             '       1.0\n']
+    for free_format, lines in ((True, free), (False, fixed)):
+        m.free_format_input = free_format
+        # without the short row the list is read in one block
+        for rows in (lines, lines[:2] + lines[3:]):
+            ra = np.recarray(len(rows) - 1, dtype=dtype)
+            f = StringIO(''.join(rows) + 'next line\n')
+            ra = ulstrd(f, len(rows) - 1, ra, m, ['cond'], None)
+            assert f.readline() == 'next line\n'
+            if len(rows) == len(lines):
+                assert np.array_equal(ra, expected)
+            else:
+                assert np.array_equal(ra, expected[[0, 2]])
+    return
+
+
 if __name__ == '__main__':
     test_ulstrd()
+    test_ulstrd_formats()
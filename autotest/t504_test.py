@@ -1,4 +1,4 @@
-import os, copy
+import os, sys, copy, threading
 
 import numpy as np
 
@@ -7,6 +7,7 @@ import flopy.utils.binaryfile as bf
 from flopy.utils.datautil import PyListUtil
 from flopy.mf6.modflow.mfsimulation import MFSimulation
 from flopy.mf6.mfbase import VerbosityLevel
+from flopy.mf6.data.mffileaccess import MFFileAccessArray
 
 try:
     import shapefile
@@ -955,6 +956,246 @@ def test_replace_ims_package():
         raise AssertionError()
 
 
+def test_lazy_load():
+    # init paths
+    test_ex_name = 'test005_advgw_tidal'
+    pth = os.path.join('..', 'examples', 'data', 'mf6', test_ex_name)
+    run_folder = os.path.join(cpth, 'lazy_load')
+
+    sim = MFSimulation.load(sim_ws=pth, verbosity_level=0)
+    lazy_sim = MFSimulation.load(sim_ws=pth, verbosity_level=0,
+                                 lazy_load=True)
+    model = sim.get_model('gwf_1')
+    lazy_model = lazy_sim.get_model('gwf_1')
+
+    # options and dimensions are loaded, other blocks are not
+    wel = lazy_model.get_package('wel')
+    assert not wel.blocks['options'].deferred_loads
+    assert len(wel.blocks['period'].deferred_loads) == 3
+    assert len(lazy_model.get_package('npf').blocks[
+                   'griddata'].deferred_loads) == 1
+
+    # write untouched data and verify that it was copied
+    lazy_sim.simulation_data.mfpath.set_sim_path(run_folder)
+    lazy_sim.write_simulation()
+    assert wel.blocks['period'].deferred_loads
+    with open(os.path.join(pth, 'AdvGW_tidal.wel')) as f:
+        period_text = f.read().split('BEGIN PERIOD', 1)[1]
+    with open(os.path.join(run_folder, 'AdvGW_tidal.wel')) as f:
+        assert f.read().split('BEGIN PERIOD', 1)[1] == period_text
+
+    # data is loaded on first access
+    spd = model.get_package('wel').stress_period_data
+    lazy_spd = wel.stress_period_data
+    for key in [1, 2, 3]:
+        assert np.array_equal(spd.get_data(key), lazy_spd.get_data(key))
+    assert not wel.blocks['period'].deferred_loads
+    assert np.array_equal(model.npf.k.array, lazy_model.npf.k.array)
+    assert np.array_equal(model.sto.ss.array, lazy_model.sto.ss.array)
+
+    # loaded data is written normally
+    lazy_sim.write_simulation()
+    sim2 = MFSimulation.load(sim_ws=run_folder, verbosity_level=0)
+    spd2 = sim2.get_model('gwf_1').get_package('wel').stress_period_data
+    for key in [1, 2, 3]:
+        assert np.array_equal(spd.get_data(key), spd2.get_data(key))
+    return
+
+
+def test_parallel_write():
+    # simulations from files and a model with many list packages, which
+    # share the dimensions of the model while they are written
+    sims = {}
+    for test_ex_name in ['test006_2models_mvr', 'test005_advgw_tidal']:
+        pth = os.path.join('..', 'examples', 'data', 'mf6', test_ex_name)
+        sims[test_ex_name] = lambda pth=pth: MFSimulation.load(
+            sim_ws=pth, verbosity_level=0, write_headers=False)
+
+    def many_packages():
+        sim = MFSimulation(sim_name='many_packages', verbosity_level=0,
+                           write_headers=False)
+        flopy.mf6.ModflowTdis(sim, nper=3,
+                              perioddata=[(1.0, 1, 1.0)] * 3)
+        model = flopy.mf6.ModflowGwf(sim, modelname='many_packages')
+        flopy.mf6.ModflowIms(sim)
+        flopy.mf6.ModflowGwfdis(model, nlay=3, nrow=20, ncol=30,
+                                botm=[-1.0, -2.0, -3.0])
+        flopy.mf6.ModflowGwfic(model, strt=np.linspace(0.0, 1.0, 1800))
+        flopy.mf6.ModflowGwfnpf(model, k=np.linspace(1.0, 2.0, 1800))
+        for num, package in enumerate([flopy.mf6.ModflowGwfwel,
+                                       flopy.mf6.ModflowGwfchd] * 4):
+            # packages of the same type with different numbers of
+            # auxiliary variables have different shapes
+            aux = ['aux{}'.format(i) for i in range(num % 3)]
+            spd = {kper: [((lay, row, num + kper), 0.5 * row - lay)
+                          + tuple(range(len(aux)))
+                          for lay in range(3) for row in range(20)]
+                   for kper in range(3)}
+            package(model, stress_period_data=spd, auxiliary=aux or None,
+                    pname='{}_{}'.format(package.package_abbr, num),
+                    filename='many_packages_{}.{}'.format(
+                        num, package.package_abbr[3:]))
+        return sim
+    sims['many_packages'] = many_packages
+
+    # a model locked by one thread is not locked in other threads
+    dimensions = many_packages().get_model('many_packages').dimensions
+    dimensions.lock()
+    dimensions.stored_shapes['path'] = ([1], 'shape')
+    other_thread = []
+    thread = threading.Thread(target=lambda: other_thread.append(
+        (dimensions.locked, dict(dimensions.stored_shapes))))
+    thread.start()
+    thread.join()
+    assert other_thread == [(False, {})]
+    assert dimensions.locked and 'path' in dimensions.stored_shapes
+    dimensions.unlock()
+    assert not dimensions.locked and not dimensions.stored_shapes
+
+    for test_ex_name, load_sim in sims.items():
+        # write simulation with one and with several threads
+        run_folders = []
+        for max_workers in [1, 8]:
+            sim = load_sim()
+            run_folder = os.path.join(cpth, 'parallel_write_{}_{}'.format(
+                test_ex_name, max_workers))
+            sim.simulation_data.mfpath.set_sim_path(run_folder)
+            # switch threads often to interleave the packages written
+            switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+            try:
+                sim.write_simulation(max_workers=max_workers)
+            finally:
+                sys.setswitchinterval(switch_interval)
+            run_folders.append(run_folder)
+
+        # files written are the same
+        file_names = sorted(os.listdir(run_folders[0]))
+        assert file_names == sorted(os.listdir(run_folders[1]))
+        for file_name in file_names:
+            with open(os.path.join(run_folders[0], file_name), 'rb') as f:
+                data = f.read()
+            with open(os.path.join(run_folders[1], file_name), 'rb') as f:
+                assert f.read() == data, file_name
+    return
+
+
+def test_incremental_write():
+    # init paths
+    test_ex_name = 'test005_advgw_tidal'
+    pth = os.path.join('..', 'examples', 'data', 'mf6', test_ex_name)
+    run_folder = os.path.join(cpth, 'incremental_write')
+
+    sim = MFSimulation.load(sim_ws=pth, verbosity_level=0)
+    model = sim.get_model('gwf_1')
+    assert not model.npf.modified
+    sim.simulation_data.mfpath.set_sim_path(run_folder)
+    sim.write_simulation()
+
+    # mark the files written
+    file_names = sorted(os.listdir(run_folder))
+    for file_name in file_names:
+        with open(os.path.join(run_folder, file_name), 'a') as f:
+            f.write('# unchanged\n')
+
+    # only the modified package is rewritten
+    model.npf.k = 10.0
+    assert model.npf.modified
+    assert not model.get_package('wel').modified
+    sim.write_simulation(incremental=True)
+    assert not model.npf.modified
+    for file_name in file_names:
+        with open(os.path.join(run_folder, file_name)) as f:
+            unchanged = f.read().endswith('# unchanged\n')
+        assert unchanged == (file_name != 'AdvGW_tidal.npf')
+
+    sim2 = MFSimulation.load(sim_ws=run_folder, verbosity_level=0)
+    model2 = sim2.get_model('gwf_1')
+    assert np.all(model2.npf.k.array == 10.0)
+
+    # a loaded simulation only rewrites the packages modified after loading
+    for file_name in file_names:
+        with open(os.path.join(run_folder, file_name), 'a') as f:
+            f.write('# unchanged\n')
+    assert not sim2.name_file.modified
+    sim2.write_simulation(incremental=True)
+    model2.npf.k = 5.0
+    sim2.write_simulation(incremental=True)
+    for file_name in file_names:
+        with open(os.path.join(run_folder, file_name)) as f:
+            unchanged = f.read().endswith('# unchanged\n')
+        assert unchanged == (file_name != 'AdvGW_tidal.npf')
+
+    sim3 = MFSimulation.load(sim_ws=run_folder, verbosity_level=0)
+    assert np.all(sim3.get_model('gwf_1').npf.k.array == 5.0)
+    return
+
+
+def test_text_array_formats():
+    # init paths
+    run_folder = os.path.join(cpth, 'text_array_formats')
+    nlay, nrow, ncol = 2, 3, 4
+    k = np.arange(nlay * nrow * ncol, dtype=float).reshape(nlay, nrow, ncol)
+
+    sim = MFSimulation(sim_ws=run_folder, verbosity_level=0)
+    flopy.mf6.ModflowTdis(sim)
+    flopy.mf6.ModflowIms(sim)
+    model = flopy.mf6.ModflowGwf(sim, modelname='arrays')
+    flopy.mf6.ModflowGwfdis(model, nlay=nlay, nrow=nrow, ncol=ncol)
+    flopy.mf6.ModflowGwfnpf(model, k=k)
+    sim.write_simulation()
+
+    # rewrite the arrays with comments, delimiters and factors
+    with open(os.path.join(run_folder, 'k_layer2.txt'), 'w') as f:
+        f.write('# layer 2\n')
+        for row in k[1] / 2.0:
+            f.write('{}\n'.format(', '.join(str(value) for value in row)))
+    with open(os.path.join(run_folder, 'arrays.npf'), 'w') as f:
+        f.write('BEGIN griddata\n'
+                '  icelltype\n'
+                '    INTERNAL  IPRN  1\n'
+                '      1 0 1 0 1 0 1 0 1 0 1 0\n'
+                '      # comment line\n'
+                '      ! another comment line\n'
+                '      0 1 0 1 0 1 0 1 0 1 0 1  # end of line comment\n'
+                '  k  LAYERED\n'
+                '    INTERNAL  FACTOR  2.0\n')
+        for row in k[0] / 2.0:
+            f.write('      {}\n'.format(' '.join(str(value) for value in row)))
+        f.write("    OPEN/CLOSE  'k_layer2.txt'  FACTOR  2.0\n"
+                '  k33\n'
+                '    INTERNAL\n'
+                '      3.0 3.0 3.0 3.0 3.0 3.0 3.0 3.0 3.0 3.0 3.0 3.0\n'
+                '      3.0 3.0 3.0 1.5d2 3.0D0 3.0 3.0 3.0 3.0 3.0 3.0\n'
+                '      3.0\n'
+                'END griddata\n')
+
+    sim2 = MFSimulation.load(sim_ws=run_folder, verbosity_level=0)
+    npf = sim2.get_model('arrays').npf
+    icelltype = np.array([1, 0] * 6 + [0, 1] * 6).reshape(nlay, nrow, ncol)
+    assert np.array_equal(npf.icelltype.array, icelltype)
+    assert np.allclose(npf.k.array, k)
+    k33 = np.full((nlay, nrow, ncol), 3.0)
+    k33[1, 0, 3] = 150.0
+    assert np.allclose(npf.k33.array, k33)
+
+    # text numpy only partly converts is not accepted as is
+    text_to_values = MFFileAccessArray._text_to_values
+    values, num_lines = text_to_values('1 2 3 1.5d2\n',
+                                       np.dtype(np.float64), 4)
+    assert np.allclose(values, [1.0, 2.0, 3.0, 150.0]) and num_lines == 1
+    values, num_lines = text_to_values('1 2\n3 1.5D2\n4 5\n',
+                                       np.dtype(np.float64), 6)
+    assert np.allclose(values, [1.0, 2.0, 3.0, 150.0, 4.0, 5.0])
+    for text in ['1 2 3.7\n', '1 2 1e3\n']:
+        try:
+            text_to_values(text, np.dtype(np.int32), 3)
+            raise AssertionError('{!r} converted to integers'.format(text))
+        except ValueError:
+            pass
+    return
+
+
 if __name__ == '__main__':
     test001a_tharmonic()
     test001e_uzf_3lay()
@@ -967,4 +1208,8 @@ if __name__ == '__main__':
     test045_lake1ss_table()
     test045_lake2tr()
     test_cbc_precision()
+    test_incremental_write()
+    test_lazy_load()
+    test_parallel_write()
     test_replace_ims_package()
+    test_text_array_formats()
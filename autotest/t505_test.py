@@ -2816,6 +2816,290 @@ def test028_sfr():
     return
 
 
+def test_large_list_load():
+    # init paths
+    test_ex_name = "large_list"
+    model_name = "large_list"
+    run_folder = os.path.join(cpth, test_ex_name)
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+
+    # create simulation with a large well list, including aux variables
+    # and boundnames
+    sim = MFSimulation(
+        sim_name=test_ex_name, version="mf6", exe_name=exe_name,
+        sim_ws=run_folder
+    )
+    ModflowTdis(sim, time_units="DAYS", nper=2,
+                perioddata=[(1.0, 1, 1.0), (1.0, 1, 1.0)])
+    model = ModflowGwf(sim, modelname=model_name,
+                       model_nam_file="{}.nam".format(model_name))
+    ModflowIms(sim, print_option="SUMMARY")
+    sim.register_ims_package(sim.ims, [model_name])
+    ModflowGwfdis(model, nlay=2, nrow=20, ncol=20)
+    ModflowGwfic(model, strt=10.0)
+    ModflowGwfnpf(model, icelltype=0, k=1.0)
+    nwells = 800
+    wel_period = {
+        0: [
+            ((i % 2, (i // 2) % 20, i // 40), -1.5 * i, 0.25 * i,
+             "well_{}".format(i))
+            for i in range(nwells)
+        ],
+        1: [
+            ((i % 2, (i // 2) % 20, i // 40), 2.0 * i, -0.5 * i,
+             "Well_{}".format(i))
+            for i in range(nwells)
+        ],
+    }
+    ModflowGwfwel(model, auxiliary=[("conc",)], boundnames=True,
+                  stress_period_data=wel_period, filename="large.wel")
+    sim.write_simulation()
+
+    # add comments and a value in Fortran double notation to the middle of
+    # the first period
+    wel_file = os.path.join(run_folder, "large.wel")
+    with open(wel_file, "r") as f:
+        lines = f.readlines()
+    start = [n for n, line in enumerate(lines)
+             if line.strip().upper().startswith("BEGIN PERIOD")][0]
+    line = lines[start + 401].split()
+    line[3] = "-6.000000d+02"
+    lines[start + 401] = "  {}\n".format("  ".join(line))
+    lines.insert(start + 300, "# comment in the middle of the list\n")
+    with open(wel_file, "w") as f:
+        f.writelines(lines)
+
+    # load simulation and compare the well lists
+    sim2 = MFSimulation.load(sim_name=test_ex_name, exe_name=exe_name,
+                             sim_ws=run_folder)
+    wel = sim2.get_model(model_name).get_package("wel")
+    for kper in range(2):
+        data = wel.stress_period_data.get_data(kper)
+        assert len(data) == nwells
+        for i, row in enumerate(data):
+            cellid, q, conc, name = wel_period[kper][i]
+            assert tuple(row["cellid"]) == cellid
+            assert np.isclose(row["q"], q)
+            assert np.isclose(row["conc"], conc)
+            assert row["boundname"] == name.lower()
+
+    return
+
+
+def test_binary_list_external():
+    # init paths
+    test_ex_name = "binary_list"
+    model_name = "binary_list"
+    run_folder = os.path.join(cpth, test_ex_name)
+    save_folder = os.path.join(run_folder, "save")
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+
+    # create simulation with a large and a small well list and a chd list
+    # with boundnames
+    sim = MFSimulation(
+        sim_name=test_ex_name, version="mf6", exe_name=exe_name,
+        sim_ws=run_folder
+    )
+    ModflowTdis(sim, time_units="DAYS", nper=2,
+                perioddata=[(1.0, 1, 1.0), (1.0, 1, 1.0)])
+    model = ModflowGwf(sim, modelname=model_name,
+                       model_nam_file="{}.nam".format(model_name))
+    ModflowIms(sim, print_option="SUMMARY")
+    sim.register_ims_package(sim.ims, [model_name])
+    ModflowGwfdis(model, nlay=2, nrow=20, ncol=20)
+    ModflowGwfic(model, strt=10.0)
+    ModflowGwfnpf(model, icelltype=0, k=1.0)
+    wel_period = {
+        0: [((i % 2, (i // 2) % 20, i // 40), -1.5 * i, 0.25 * i)
+            for i in range(800)],
+        1: [((0, 3, 4), -2.0, 1.0)],
+    }
+    ModflowGwfwel(model, auxiliary=[("conc",)],
+                  stress_period_data=wel_period)
+    ModflowGwfchd(model, boundnames=True,
+                  stress_period_data={0: [((0, 0, 0), 10.0, "chd_1")] * 20})
+
+    # lists with at least 10 rows go to binary files
+    sim.simulation_data.external_list_binary = True
+    sim.simulation_data.external_binary_threshold = 10
+    sim.set_all_data_external()
+    sim.write_simulation()
+    files = os.listdir(run_folder)
+    assert "{}.wel_stress_period_data_1.bin".format(model_name) in files
+    assert "{}.wel_stress_period_data_2.txt".format(model_name) in files
+    # boundnames can not be stored in binary files
+    assert "{}.chd_stress_period_data_1.txt".format(model_name) in files
+    data = np.fromfile(
+        os.path.join(run_folder,
+                     "{}.wel_stress_period_data_1.bin".format(model_name)),
+        dtype=[("k", np.int32), ("i", np.int32), ("j", np.int32),
+               ("q", np.float64), ("conc", np.float64)],
+    )
+    assert len(data) == 800
+    assert tuple(data[5]) == (2, 3, 1, -7.5, 1.25)
+    # binary list files are double precision, which MODFLOW 6 reads
+    assert os.path.getsize(
+        os.path.join(run_folder,
+                     "{}.wel_stress_period_data_1.bin".format(model_name))
+    ) == 800 * (3 * 4 + 2 * 8)
+
+    # load simulation, save it to a new folder, and compare the well lists
+    sim2 = MFSimulation.load(sim_name=test_ex_name, exe_name=exe_name,
+                             sim_ws=run_folder)
+    sim2.set_sim_path(save_folder)
+    sim2.write_simulation()
+    sim3 = MFSimulation.load(sim_name=test_ex_name, exe_name=exe_name,
+                             sim_ws=save_folder)
+    for sim_test in (sim2, sim3):
+        wel = sim_test.get_model(model_name).get_package("wel")
+        for kper in range(2):
+            data = wel.stress_period_data.get_data(kper)
+            assert len(data) == len(wel_period[kper])
+            for i, row in enumerate(data):
+                cellid, q, conc = wel_period[kper][i]
+                assert tuple(row["cellid"]) == cellid
+                assert np.isclose(row["q"], q)
+                assert np.isclose(row["conc"], conc)
+        chd = sim_test.get_model(model_name).get_package("chd")
+        data = chd.stress_period_data.get_data(0)
+        assert len(data) == 20 and data[0]["boundname"] == "chd_1"
+
+    return
+
+
+def test_compact_transient_lists():
+    # init paths
+    test_ex_name = "compact_lists"
+    model_name = "compact_lists"
+    run_folder = os.path.join(cpth, test_ex_name)
+    save_folder = os.path.join(run_folder, "save")
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+
+    # create simulation with repeated and changing well stress periods
+    sim = MFSimulation(
+        sim_name=test_ex_name, version="mf6", exe_name=exe_name,
+        sim_ws=run_folder
+    )
+    ModflowTdis(sim, time_units="DAYS", nper=4,
+                perioddata=[(1.0, 1, 1.0)] * 4)
+    model = ModflowGwf(sim, modelname=model_name,
+                       model_nam_file="{}.nam".format(model_name))
+    ModflowIms(sim, print_option="SUMMARY")
+    sim.register_ims_package(sim.ims, [model_name])
+    ModflowGwfdis(model, nlay=2, nrow=10, ncol=10)
+    ModflowGwfic(model, strt=10.0)
+    ModflowGwfnpf(model, icelltype=0, k=1.0)
+    cellids = [(i % 2, (i // 2) % 10, i // 20) for i in range(150)]
+    wel_period = {
+        0: [(cellid, -1.0) for cellid in cellids],
+        1: [(cellid, -1.0) for cellid in cellids],
+        2: [(cellid, -2.0) for cellid in cellids],
+        3: [((0, 3, 4), -3.0)],
+    }
+    ModflowGwfwel(model, stress_period_data=wel_period)
+    sim.write_simulation()
+
+    sims = []
+    for compact in [False, True]:
+        sims.append(MFSimulation.load(sim_name=test_ex_name,
+                                      exe_name=exe_name, sim_ws=run_folder,
+                                      compact_transient_lists=compact))
+    spd = sims[0].get_model(model_name).wel.stress_period_data
+    compact_spd = sims[1].get_model(model_name).wel.stress_period_data
+
+    # stress periods are views of one table, repeated periods share rows
+    # and are returned as copies
+    data = [compact_spd.get_data(kper) for kper in range(4)]
+    assert data[2].base is data[3].base
+    period_index = compact_spd._table.period_index
+    assert period_index[0] == period_index[1]
+    assert not np.shares_memory(data[0], data[1])
+    assert not np.shares_memory(data[1], data[2])
+    assert data[1]["cellid"][5] is data[2]["cellid"][5]
+    for kper in range(4):
+        assert data[kper].tolist() == spd.get_data(kper).tolist()
+        arrays = spd.to_array(kper, mask=True)
+        compact_arrays = compact_spd.to_array(kper, mask=True)
+        assert np.allclose(arrays["q"], compact_arrays["q"], equal_nan=True)
+    for (name, array), (compact_name, compact_array) in zip(
+        spd.masked_4D_arrays_itr(), compact_spd.masked_4D_arrays_itr()
+    ):
+        assert name == compact_name
+        assert np.allclose(array, compact_array, equal_nan=True)
+
+    # setting a stress period does not change the periods it shared rows with
+    compact_spd.set_data({1: [((1, 1, 1), -5.0)]})
+    assert len(compact_spd.get_data(0)) == 150
+    assert compact_spd.get_data(0)["q"][0] == -1.0
+    assert compact_spd.get_data(1).tolist() == [((1, 1, 1), -5.0)]
+
+    # compact lists are written normally
+    sims[1].set_sim_path(save_folder)
+    sims[1].write_simulation()
+    sim3 = MFSimulation.load(sim_name=test_ex_name, exe_name=exe_name,
+                             sim_ws=save_folder)
+    spd3 = sim3.get_model(model_name).wel.stress_period_data
+    for kper in [0, 2, 3]:
+        assert spd3.get_data(kper).tolist() == spd.get_data(kper).tolist()
+    assert spd3.get_data(1).tolist() == [((1, 1, 1), -5.0)]
+
+    return
+
+
+def test_compact_transient_lists_shared_rows():
+    # init paths
+    test_ex_name = "compact_lists_shared"
+    model_name = "compact_lists_shared"
+    run_folder = os.path.join(cpth, test_ex_name)
+    if not os.path.isdir(run_folder):
+        os.makedirs(run_folder)
+
+    sim = MFSimulation(
+        sim_name=test_ex_name, version="mf6", exe_name=exe_name,
+        sim_ws=run_folder
+    )
+    sim.simulation_data.compact_transient_lists = True
+    ModflowTdis(sim, time_units="DAYS", nper=3,
+                perioddata=[(1.0, 1, 1.0)] * 3)
+    model = ModflowGwf(sim, modelname=model_name,
+                       model_nam_file="{}.nam".format(model_name))
+    ModflowGwfdis(model, nlay=1, nrow=10, ncol=10)
+    wel_period = [((0, i, i), -1.0) for i in range(10)]
+    wel = ModflowGwfwel(
+        model, stress_period_data={kper: wel_period for kper in range(3)}
+    )
+    spd = wel.stress_period_data
+    period_index = spd._table.period_index
+    assert period_index[0] == period_index[1] == period_index[2]
+
+    # changing shared rows in place does not change the other periods
+    data = spd.get_data(1)
+    data["q"] *= 10.0
+    for kper in [0, 2]:
+        assert np.allclose(spd.get_data(kper)["q"], -1.0)
+
+    # setting the changed rows only changes their stress period
+    spd.set_data({1: data})
+    assert np.allclose(spd.get_data(0)["q"], -1.0)
+    assert np.allclose(spd.get_data(1)["q"], -10.0)
+    assert np.allclose(spd.get_data(2)["q"], -1.0)
+    arrays = spd.to_array(2, mask=True)
+    assert np.nansum(arrays["q"]) == -10.0
+
+    # a stress period set to the rows of another period gets its own rows
+    spd.set_data({2: spd.get_data(1)})
+    data = spd.get_data(2)
+    data["q"] = -3.0
+    spd.set_data({2: data})
+    assert np.allclose(spd.get_data(1)["q"], -10.0)
+    assert np.allclose(spd.get_data(2)["q"], -3.0)
+
+    return
+
+
 if __name__ == "__main__":
     np001()
     np002()
@@ -2827,3 +3111,7 @@ if __name__ == "__main__":
     test028_sfr()
     test035_fhb()
     test050_circle_island()
+    test_large_list_load()
+    test_binary_list_external()
+    test_compact_transient_lists()
+    test_compact_transient_lists_shared_rows()
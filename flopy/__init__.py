@@ -20,19 +20,53 @@ contribute.
 
 """
 
+import importlib
+import sys
+
 from .version import __version__, __author__, __author_email__
 
-# imports
-from . import modflow
-from . import mt3d
-from . import seawat
-from . import modpath
-from . import modflowlgr
-from . import utils
-from . import plot
-from . import export
-from . import pest
-from . import mf6
-from . import discretization
-
-from .mbase import run_model, which
+# The subpackages are imported on first access (PEP 562), so that importing
+# a single module, such as flopy.utils.binaryfile, does not import all of
+# flopy and its optional dependencies.
+_subpackages = (
+    "modflow",
+    "mt3d",
+    "seawat",
+    "modpath",
+    "modflowlgr",
+    "utils",
+    "plot",
+    "export",
+    "pest",
+    "mf6",
+    "discretization",
+)
+_attributes = {"run_model": ".mbase", "which": ".mbase"}
+__all__ = list(_subpackages) + list(_attributes)
+
+
+def __getattr__(name):
+    if name in _attributes:
+        module = importlib.import_module(_attributes[name], __name__)
+        value = getattr(module, name)
+    else:
+        try:
+            value = importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != "{}.{}".format(__name__, name):
+                raise
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            )
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_subpackages) | set(_attributes))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ is not supported, so import everything now
+    for _name in _subpackages + tuple(_attributes):
+        __getattr__(_name)
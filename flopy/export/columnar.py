@@ -0,0 +1,511 @@
+"""
+Module for the streaming export of model output to chunked columnar
+stores: Parquet files (written with pyarrow) and Zarr stores (written
+with zarr).  The output is read and written in blocks, so that the output
+for all times is never held in memory at once.
+
+"""
+import inspect
+from collections import OrderedDict
+
+import numpy as np
+
+
+def import_pyarrow():
+    """Import pyarrow and pyarrow.parquet.
+
+    Returns
+    -------
+    module
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not found.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            inspect.getouterframes(inspect.currentframe())[1][3]
+            + ": error importing pyarrow; try pip install pyarrow"
+        )
+    return pyarrow
+
+
+def import_zarr():
+    """Import zarr.
+
+    Returns
+    -------
+    module
+
+    Raises
+    ------
+    ImportError
+        If zarr is not found.
+    """
+    try:
+        import zarr
+    except ImportError:
+        raise ImportError(
+            inspect.getouterframes(inspect.currentframe())[1][3]
+            + ": error importing zarr; try pip install zarr"
+        )
+    return zarr
+
+
+def _to_columns(batch):
+    """
+    Convert a numpy structured array or a dictionary of arrays to an
+    ordered dictionary of one-dimensional columns.  Byte strings are
+    decoded and stripped.
+
+    """
+    if isinstance(batch, np.ndarray):
+        batch = OrderedDict((name, batch[name]) for name in batch.dtype.names)
+    columns = OrderedDict()
+    for name, values in batch.items():
+        values = np.asarray(values)
+        if values.dtype.kind == "S":
+            values = np.char.strip(np.char.decode(values, "ascii"))
+        columns[name] = values.ravel()
+    return columns
+
+
+def write_parquet(filename, batches, **kwargs):
+    """
+    Write batches of columns to a Parquet file.  Each batch is written as
+    a separate row group, so only one batch is held in memory at a time
+    and queries that filter on the columns that vary between batches, such
+    as the simulation time, only read the row groups they need.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the Parquet file.
+    batches : iterable
+        Numpy structured arrays or dictionaries of one-dimensional arrays
+        with the same columns.
+    **kwargs : dict
+        Keyword arguments passed to pyarrow.parquet.ParquetWriter, such as
+        compression.
+
+    Returns
+    -------
+    nrows : int
+        Number of rows written.
+
+    """
+    pa = import_pyarrow()
+    writer = None
+    nrows = 0
+    try:
+        for batch in batches:
+            columns = _to_columns(batch)
+            table = pa.Table.from_arrays(
+                [pa.array(values) for values in columns.values()],
+                names=list(columns.keys()),
+            )
+            if writer is None:
+                writer = pa.parquet.ParquetWriter(
+                    filename, table.schema, **kwargs
+                )
+            writer.write_table(table)
+            nrows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise Exception("write_parquet error: no data to write")
+    return nrows
+
+
+def recarray_batches(data, chunk=100000):
+    """
+    Split a numpy structured array into batches of chunk rows.
+
+    """
+    for i0 in range(0, data.shape[0], chunk):
+        yield data[i0 : i0 + chunk]
+
+
+def layerfile_batches(layerfile, mflay=None, nodata=None, max_memory=2 ** 28):
+    """
+    Get the data of a LayerFile as batches of columns in long format, with
+    one row per cell and time.  Each batch holds the data for the times in
+    a block of layerfile.iter_data().
+
+    Parameters
+    ----------
+    layerfile : LayerFile
+        Head, drawdown or concentration file.
+    mflay : int
+        MODFLOW zero-based layer number to export.  If None, all layers
+        are exported.  (Default is None.)
+    nodata : float
+        The nodata value in the data array, which is exported as nan.
+        (Default is None.)
+    max_memory : int
+        Maximum number of bytes of the data values read at once.  Each batch
+        takes about eight times as much memory as its data values.
+        (Default is 256 MB.)
+
+    Returns
+    -------
+    out : generator
+        Yields dictionaries with the columns totim, kstp, kper, layer, row,
+        column and value.  kstp, kper, layer, row and column are
+        zero-based.
+
+    """
+    cells = None
+    for kstpkper, totim, block in layerfile.iter_data(
+        mflay=mflay, nodata=nodata, max_memory=max_memory
+    ):
+        if not isinstance(block, np.ndarray):
+            raise NotImplementedError(
+                "layerfile_batches: layers of different size are not "
+                + "supported"
+            )
+        if mflay is not None:
+            block = block[:, np.newaxis]
+        ntimes, nlay, nrow, ncol = block.shape
+        if cells is None:
+            layers = np.arange(nlay) if mflay is None else np.array([mflay])
+            cells = [
+                a.ravel().astype(np.int32)
+                for a in np.meshgrid(
+                    layers, np.arange(nrow), np.arange(ncol), indexing="ij"
+                )
+            ]
+        ncells = cells[0].shape[0]
+        kstpkper = np.array(kstpkper, dtype=np.int32).reshape(-1, 2)
+        yield OrderedDict(
+            [
+                ("totim", np.repeat(totim, ncells)),
+                ("kstp", np.repeat(kstpkper[:, 0], ncells)),
+                ("kper", np.repeat(kstpkper[:, 1], ncells)),
+                ("layer", np.tile(cells[0], ntimes)),
+                ("row", np.tile(cells[1], ntimes)),
+                ("column", np.tile(cells[2], ntimes)),
+                ("value", block.ravel()),
+            ]
+        )
+
+
+def budgetfile_batches(cbcfile, text=None, paknam=None, max_memory=2 ** 28):
+    """
+    Get the records of a CellBudgetFile as batches of columns in long
+    format, with one row per cell and record.  Array records are exported
+    for all cells, records with a layer array (imeth = 3) for the cells in
+    the layers of the layer array and list records for the cells in the
+    list.  Records are read one at a time, and a batch is returned when it
+    holds at least max_memory bytes of data values.
+
+    Parameters
+    ----------
+    cbcfile : CellBudgetFile
+        Cell budget file.
+    text : str or list of str
+        The text identifiers of the records to export.  If None, all
+        records are exported.  (Default is None.)
+    paknam : str
+        The package name of the records to export.  If None, the records
+        of all packages are exported.  (Default is None.)
+    max_memory : int
+        Approximate number of bytes of the data values in a batch.
+        (Default is 256 MB.)
+
+    Returns
+    -------
+    out : generator
+        Yields dictionaries with the columns totim, kstp, kper, text,
+        paknam, node and value.  kstp, kper and node are zero-based, and
+        node is the cell number k * nrow * ncol + i * ncol + j.
+
+    """
+    select = np.ones(cbcfile.recordarray.shape[0], dtype=bool)
+    if text is not None:
+        if isinstance(text, (str, bytes)):
+            text = [text]
+        texts = [cbcfile._find_text(t) for t in text]
+        select = np.isin(cbcfile.recordarray["text"], texts)
+    if paknam is not None:
+        paknam = cbcfile._find_paknam(paknam)
+        select &= cbcfile.recordarray["paknam"] == paknam
+    irecs = np.where(select)[0]
+
+    names = ("totim", "kstp", "kper", "text", "paknam", "node", "value")
+    batch = OrderedDict((name, []) for name in names)
+    nbytes = 0
+    for irec in irecs:
+        header = cbcfile.recordarray[irec]
+        data = cbcfile.get_record(irec)
+        if header["imeth"] == 3:
+            # a layer array and a data array of size (nrow, ncol)
+            ilayer, data = data
+            ncpl = data.size
+            node = (ilayer.ravel().astype(np.int64) - 1) * ncpl
+            node += np.arange(ncpl, dtype=np.int64)
+            value = data.ravel()
+        elif data.dtype.names is not None:
+            node = data["node"].astype(np.int64) - 1
+            value = data["q"]
+        else:
+            node = np.arange(data.size, dtype=np.int64)
+            value = data.ravel()
+        n = value.shape[0]
+        batch["totim"].append(np.repeat(header["totim"], n))
+        batch["kstp"].append(np.repeat(np.int32(header["kstp"] - 1), n))
+        batch["kper"].append(np.repeat(np.int32(header["kper"] - 1), n))
+        batch["text"].append(np.repeat(header["text"], n))
+        batch["paknam"].append(np.repeat(header["paknam"], n))
+        batch["node"].append(node)
+        batch["value"].append(value)
+        nbytes += value.nbytes
+        if nbytes >= max_memory:
+            yield OrderedDict(
+                (name, np.concatenate(values))
+                for name, values in batch.items()
+            )
+            batch = OrderedDict((name, []) for name in names)
+            nbytes = 0
+    if len(batch["value"]) > 0:
+        yield OrderedDict(
+            (name, np.concatenate(values)) for name, values in batch.items()
+        )
+
+
+def write_zarr_blocks(group, blocks, chunks=None):
+    """
+    Write the blocks of an iter_data() generator to the arrays data,
+    totim, kstp and kper of a Zarr group.  The first axis of data is the
+    time axis.
+
+    Parameters
+    ----------
+    group : zarr.hierarchy.Group
+        Zarr group.
+    blocks : iterable
+        Blocks of (kstpkper, totim, data) as returned by iter_data() with a
+        chunk or max_memory value.
+    chunks : tuple of ints
+        Chunk shape of the data array.  If None, the data are chunked by
+        time and layer.  (Default is None.)
+
+    Returns
+    -------
+    data : zarr.core.Array
+        The data array, or None if there were no blocks.
+
+    """
+    ntimes = None
+    data = None
+    i0 = 0
+    for kstpkper, totim, block in blocks:
+        if isinstance(block, np.ma.MaskedArray):
+            block = block.astype(np.float64).filled(np.nan)
+        if data is None:
+            shape = block.shape[1:]
+            ntimes = group.attrs["ntimes"]
+            if chunks is None:
+                chunks = (1,) * (len(shape) - 1) + shape[-2:]
+            data = group.create_dataset(
+                "data",
+                shape=(ntimes,) + shape,
+                chunks=chunks,
+                dtype=block.dtype,
+                fill_value=np.nan,
+            )
+            totims = group.create_dataset(
+                "totim", shape=(ntimes,), dtype=np.float64
+            )
+            kstp = group.create_dataset("kstp", shape=(ntimes,), dtype="i4")
+            kper = group.create_dataset("kper", shape=(ntimes,), dtype="i4")
+        i1 = i0 + block.shape[0]
+        data[i0:i1] = block
+        totims[i0:i1] = totim
+        kstpkper = np.array(kstpkper, dtype=np.int32).reshape(-1, 2)
+        kstp[i0:i1] = kstpkper[:, 0]
+        kper[i0:i1] = kstpkper[:, 1]
+        i0 = i1
+    return data
+
+
+def write_zarr_columns(group, batches, names, chunks=None):
+    """
+    Append batches of columns to one-dimensional arrays of a Zarr group,
+    one array for each column.
+
+    Parameters
+    ----------
+    group : zarr.hierarchy.Group
+        Zarr group.
+    batches : iterable
+        Numpy structured arrays or dictionaries of one-dimensional arrays
+        with the same columns.
+    names : list of str
+        Names of the columns to write.
+    chunks : int
+        Chunk length of the arrays.  If None, the chunk length is the
+        number of rows of the first batch.  (Default is None.)
+
+    Returns
+    -------
+    nrows : int
+        Number of rows written.
+
+    """
+    arrays = None
+    nrows = 0
+    for batch in batches:
+        columns = _to_columns(batch)
+        n = columns[names[0]].shape[0]
+        if arrays is None:
+            if chunks is None:
+                chunks = max(n, 1)
+            arrays = [
+                group.create_dataset(
+                    name,
+                    shape=(0,),
+                    chunks=(chunks,),
+                    dtype=columns[name].dtype,
+                )
+                for name in names
+            ]
+        for name, array in zip(names, arrays):
+            array.append(columns[name])
+        nrows += n
+    return nrows
+
+
+def layerfile_to_zarr(
+    layerfile, store, mflay=None, nodata=None, chunks=None, max_memory=2 ** 28
+):
+    """
+    Write the data of a LayerFile to a Zarr store.  The store has the
+    array data of size (ntimes, nlay, nrow, ncol), or (ntimes, nrow, ncol)
+    if mflay is specified, and the arrays totim, kstp and kper of size
+    ntimes.  kstp and kper are zero-based.
+
+    Parameters
+    ----------
+    layerfile : LayerFile
+        Head, drawdown or concentration file.
+    store : str or zarr store
+        Path or store of the Zarr group.  An existing group is overwritten.
+    mflay : int
+        MODFLOW zero-based layer number to export.  If None, all layers
+        are exported.  (Default is None.)
+    nodata : float
+        The nodata value in the data array, which is exported as nan.
+        (Default is None.)
+    chunks : tuple of ints
+        Chunk shape of the data array.  If None, each chunk holds one layer
+        for one time.  (Default is None.)
+    max_memory : int
+        Maximum number of bytes of data read at once.  (Default is 256 MB.)
+
+    Returns
+    -------
+    group : zarr.hierarchy.Group
+
+    """
+    zarr = import_zarr()
+    group = zarr.open_group(store, mode="w")
+    group.attrs["ntimes"] = len(layerfile.get_times())
+    group.attrs["filename"] = str(layerfile.filename)
+    data = write_zarr_blocks(
+        group,
+        layerfile.iter_data(mflay=mflay, nodata=nodata, max_memory=max_memory),
+        chunks=chunks,
+    )
+    if data is None:
+        raise Exception("layerfile_to_zarr error: no data to write")
+    return group
+
+
+def budgetfile_to_zarr(
+    cbcfile, store, text=None, chunks=None, max_memory=2 ** 28
+):
+    """
+    Write the records of a CellBudgetFile to a Zarr store, with one group
+    for each record text and package name.  For array records, each group
+    has the array data of size (nrecords, nlay, nrow, ncol), with nan for
+    cells that are not in a record with a layer array (imeth = 3), and the
+    arrays totim, kstp and kper of size nrecords.  List records (imeth = 2,
+    5 or 6) are written in long format, as by budgetfile_batches(), with
+    the arrays totim, kstp, kper, node and value of size nrows, with one
+    row for each cell in the list of each record.  kstp, kper and node are
+    zero-based, and node is the cell number k * nrow * ncol + i * ncol + j.
+
+    Parameters
+    ----------
+    cbcfile : CellBudgetFile
+        Cell budget file.
+    store : str or zarr store
+        Path or store of the Zarr group.  An existing group is overwritten.
+    text : str or list of str
+        The text identifiers of the records to export.  If None, all
+        records are exported.  (Default is None.)
+    chunks : tuple of ints
+        Chunk shape of the data arrays of array records.  If None, each
+        chunk holds one layer for one time.  The arrays of list records
+        are chunked by the rows read at once.  (Default is None.)
+    max_memory : int
+        Maximum number of bytes of data read at once.  (Default is 256 MB.)
+
+    Returns
+    -------
+    group : zarr.hierarchy.Group
+
+    """
+    zarr = import_zarr()
+    root = zarr.open_group(store, mode="w")
+    root.attrs["filename"] = str(cbcfile.filename)
+    ra = cbcfile.recordarray
+    if text is None:
+        texts = cbcfile.textlist
+    else:
+        if isinstance(text, str):
+            text = [text]
+        texts = [cbcfile._find_text(t) for t in text]
+    for rectext in texts:
+        paknams = np.unique(ra["paknam"][ra["text"] == rectext])
+        for paknam in paknams:
+            name = rectext.decode().strip()
+            if len(paknams) > 1:
+                name += "_" + paknam.decode().strip()
+            group = root.create_group(name.replace(" ", "_"))
+            select = (ra["text"] == rectext) & (ra["paknam"] == paknam)
+            group.attrs["ntimes"] = int(select.sum())
+            group.attrs["text"] = rectext.decode().strip()
+            group.attrs["paknam"] = paknam.decode().strip()
+            if len(paknams) == 1:
+                paknam = None
+            imeth = ra["imeth"][select][0]
+            if imeth in (2, 5, 6):
+                write_zarr_columns(
+                    group,
+                    budgetfile_batches(
+                        cbcfile,
+                        text=rectext,
+                        paknam=paknam,
+                        max_memory=max_memory,
+                    ),
+                    ["totim", "kstp", "kper", "node", "value"],
+                )
+            else:
+                write_zarr_blocks(
+                    group,
+                    cbcfile.iter_data(
+                        rectext,
+                        paknam=paknam,
+                        full3D=True,
+                        max_memory=max_memory,
+                    ),
+                    chunks=chunks,
+                )
+    return root
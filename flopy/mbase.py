@@ -18,6 +18,10 @@ from datetime import datetime
 from shutil import which
 from subprocess import Popen, PIPE, STDOUT
 import copy
+import io
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from inspect import getfullargspec
 import numpy as np
 from flopy import utils, discretization
 from .version import __version__
@@ -367,6 +371,8 @@ class BaseModel(ModelInterface):
         self.array_free_format = True
         self.free_format_input = True
         self.parameter_load = False
+        # read open/close arrays when they are used instead of on load
+        self.lazy_load = False
         self.array_format = None
         self.external_fnames = []
         self.external_units = []
@@ -1644,6 +1650,296 @@ class BaseModel(ModelInterface):
         return
 
 
+class _SharedPickler(pickle.Pickler):
+    """
+    Pickler that stores references to the model and its packages instead
+    of copies, so they can be replaced by the objects in the model that
+    loads the pickle.
+
+    """
+
+    def __init__(self, file, shared):
+        super(_SharedPickler, self).__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._shared = {id(obj): i for i, obj in enumerate(shared)}
+
+    def persistent_id(self, obj):
+        return self._shared.get(id(obj))
+
+
+class _SharedUnpickler(pickle.Unpickler):
+    def __init__(self, file, shared):
+        super(_SharedUnpickler, self).__init__(file)
+        self._shared = shared
+
+    def persistent_load(self, pid):
+        return self._shared[pid]
+
+
+class _CallRecorder(object):
+    """
+    Record the calls a package load makes to the model methods that
+    register packages and files, so they can be repeated on another model.
+
+    """
+
+    def __init__(self, model, names):
+        self.calls = []
+        self._depth = 0
+        for name in names:
+            setattr(model, name, self._record(name, getattr(model, name)))
+
+    def _record(self, name, method):
+        def call(*args, **kwargs):
+            # calls made from inside another recorded call are repeated
+            # by repeating the outer call
+            if self._depth == 0:
+                self.calls.append((name, args, kwargs))
+            self._depth += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._depth -= 1
+
+        return call
+
+
+# model state copied to each package load worker process
+_worker_model = None
+
+
+def _init_package_worker(model_data, namefile_path, units, positions):
+    global _worker_model
+    _worker_model = (model_data, namefile_path, units, positions)
+
+
+def _data_positions(ext_unit_dict):
+    """
+    Return the positions of the data files in ext_unit_dict that have been
+    read from.
+
+    """
+    positions = {}
+    for key, item in ext_unit_dict.items():
+        if item.package is not None:
+            continue
+        try:
+            position = item.filehandle.tell()
+        except (AttributeError, OSError, ValueError):
+            continue
+        if position:
+            positions[key] = position
+    return positions
+
+
+def _load_package_worker(unit):
+    """
+    Load the package file for unit into a copy of the model.
+
+    Returns
+    -------
+    bytes or None
+        The package, the model calls made by the load, the changed model
+        attributes and the positions of the data files read by the load,
+        pickled with references to the original model and packages.  None
+        if the loaded package cannot be pickled.
+
+    """
+    model_data, namefile_path, units, positions = _worker_model
+    model = pickle.loads(model_data)
+    shared = [model] + model.packagelist
+    attributes = {
+        name: getattr(model, name) for name in PackageLoader.attributes
+    }
+    recorder = _CallRecorder(model, PackageLoader.methods)
+
+    # use the same ext_unit_dict entries as the model being loaded
+    namefile_dict = utils.mfreadnam.parsenamefile(
+        namefile_path, model.mfnam_packages, verbose=False
+    )
+    ext_unit_dict = {
+        key: item for key, item in namefile_dict.items() if key in units
+    }
+    for key, position in positions.items():
+        ext_unit_dict[key].filehandle.seek(position)
+    try:
+        package = PackageLoader.load_item(
+            ext_unit_dict[unit], model, ext_unit_dict
+        )
+        read = {
+            key: position
+            for key, position in _data_positions(ext_unit_dict).items()
+            if positions.get(key) != position
+        }
+    finally:
+        for item in namefile_dict.values():
+            if hasattr(item.filehandle, "close"):
+                item.filehandle.close()
+
+    changed = {
+        name: getattr(model, name)
+        for name, value in attributes.items()
+        if getattr(model, name) != value
+    }
+    f = io.BytesIO()
+    try:
+        _SharedPickler(f, shared).dump(
+            (package, recorder.calls, changed, read)
+        )
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return f.getvalue()
+
+
+class PackageLoader(object):
+    """
+    Load the package files of a name file, optionally parsing them in
+    worker processes.
+
+    Packages are loaded by calling load() for each name file entry in name
+    file order.  Entries before the first of units are loaded in this
+    process.  The first of units and all entries after it are then
+    submitted to a process pool, each worker loading its package into a
+    copy of the model.  load() attaches the packages to the model by
+    repeating the model calls made by each load, so the model is the same
+    as when the packages are loaded one after another.  A package that
+    reads a data file read by an earlier package in the pool is loaded
+    again in this process, continuing from where the earlier package
+    stopped reading.
+
+    Parameters
+    ----------
+    model : BaseModel
+        model the packages are loaded into
+    namefile_path : str
+        path of the name file
+    ext_unit_dict : dict
+        dictionary of the name file entries that have not been loaded
+    units : list
+        units of the package files that can be loaded in worker processes
+    max_workers : int
+        maximum number of worker processes.  if None, the default of
+        concurrent.futures.ProcessPoolExecutor is used.  defaults to 1,
+        which loads the packages in this process.
+
+    """
+
+    # model methods that package loads call to register packages and files
+    methods = (
+        "add_package",
+        "remove_package",
+        "add_output_file",
+        "add_output",
+        "remove_output",
+        "add_external",
+        "remove_external",
+        "add_pop_key_list",
+    )
+    # model attributes that package loads can set
+    attributes = ("version", "parameter_load", "free_format_input")
+
+    def __init__(
+        self, model, namefile_path, ext_unit_dict, units, max_workers=1
+    ):
+        self.model = model
+        self.namefile_path = namefile_path
+        self.ext_unit_dict = ext_unit_dict
+        self.units = list(units)
+        self.max_workers = max_workers
+        self._parallel = max_workers != 1 and len(self.units) > 1
+        self._futures = None
+        self._shared = None
+        self._start_positions = None
+        self._positions = {}
+
+    def _start(self):
+        # submit the package files that have not been loaded
+        self._shared = [self.model] + self.model.packagelist
+        self._start_positions = dict(self._positions)
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_package_worker,
+            initargs=(
+                pickle.dumps(self.model, pickle.HIGHEST_PROTOCOL),
+                self.namefile_path,
+                list(self.ext_unit_dict.keys()),
+                self._start_positions,
+            ),
+        )
+        self._futures = {
+            unit: executor.submit(_load_package_worker, unit)
+            for unit in self.units
+        }
+        # the submitted loads still run after the executor is shut down
+        executor.shutdown(wait=False)
+
+    @staticmethod
+    def load_item(item, model, ext_unit_dict):
+        """
+        Load the package file of a name file entry into model.
+
+        """
+        if "check" in getfullargspec(item.package.load)[0]:
+            return item.package.load(
+                item.filehandle,
+                model,
+                ext_unit_dict=ext_unit_dict,
+                check=False,
+            )
+        return item.package.load(
+            item.filehandle, model, ext_unit_dict=ext_unit_dict
+        )
+
+    def load(self, unit, item, ext_unit_dict):
+        """
+        Load the package file of a name file entry into the model.  Errors
+        raised while a worker process loads the package are raised here.
+
+        Parameters
+        ----------
+        unit : int
+            unit number of the name file entry
+        item : NamData
+            name file entry
+        ext_unit_dict : dict
+            dictionary of the name file entries
+
+        Returns
+        -------
+        package : Package object
+
+        """
+        if not self._parallel:
+            return self.load_item(item, self.model, ext_unit_dict)
+        if self._futures is None and unit in self.units:
+            self._start()
+
+        future = None
+        if self._futures is not None:
+            future = self._futures.pop(unit, None)
+        data = None if future is None else future.result()
+        if data is not None:
+            package, calls, attributes, read = _SharedUnpickler(
+                io.BytesIO(data), self._shared
+            ).load()
+            if all(
+                self._positions.get(key) == self._start_positions.get(key)
+                for key in read
+            ):
+                self._positions.update(read)
+                for name, value in attributes.items():
+                    setattr(self.model, name, value)
+                for name, args, kwargs in calls:
+                    getattr(self.model, name)(*args, **kwargs)
+                return package
+
+        # load in this process from where earlier packages stopped reading
+        for key, position in self._positions.items():
+            ext_unit_dict[key].filehandle.seek(position)
+        package = self.load_item(item, self.model, ext_unit_dict)
+        self._positions.update(_data_positions(ext_unit_dict))
+        return package
+
+
 def run_model(
     exe_name,
     namefile,
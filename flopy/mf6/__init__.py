@@ -1,9 +1,53 @@
 # imports
-from . import coordinates
-from . import data
-from .modflow import *
-from . import utils
-
-from .data import mfdatascalar, mfdatalist, mfdataarray
-from .mfmodel import MFModel
-from .mfbase import ExtFileAction
+import importlib
+import sys
+
+# The modules and package classes of flopy.mf6 are imported on first access
+# (PEP 562), so that importing flopy.mf6 is fast.  The package classes, such
+# as MFSimulation and ModflowGwfwel, are provided by flopy.mf6.modflow.
+_subpackages = ("modflow", "coordinates", "data", "utils")
+_attributes = {
+    "mfdatascalar": ".data",
+    "mfdatalist": ".data",
+    "mfdataarray": ".data",
+    "MFModel": ".mfmodel",
+    "ExtFileAction": ".mfbase",
+}
+__all__ = (
+    list(_subpackages)
+    + list(_attributes)
+    + importlib.import_module(".modflow", __name__).__all__
+)
+
+
+def __getattr__(name):
+    modflow = importlib.import_module(".modflow", __name__)
+    if name in _attributes:
+        module = importlib.import_module(_attributes[name], __name__)
+        value = getattr(module, name)
+    elif name in modflow.__all__:
+        value = getattr(modflow, name)
+    else:
+        try:
+            value = importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != "{}.{}".format(__name__, name):
+                raise
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            )
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ is not supported, so import everything now
+    from .modflow import *
+    from . import coordinates, data, utils
+    from .data import mfdatascalar, mfdatalist, mfdataarray
+    from .mfmodel import MFModel
+    from .mfbase import ExtFileAction
@@ -4,6 +4,7 @@ modeldimensions module.  Contains the model dimension information
 
 """
 
+import threading
 from .simulationtime import SimulationTime
 from .modelgrid import UnstructuredModelGrid, ModelGrid
 from ..mfbase import StructException, FlopyException, VerbosityLevel
@@ -327,6 +328,9 @@ class ModelDimensions(object):
 
     Notes
     -----
+    The locked state and the shapes stored while locked are kept per
+    thread, so packages of the same model can be written by several
+    threads at once.
 
     Examples
     --------
@@ -337,15 +341,35 @@ class ModelDimensions(object):
         self.simulation_data = simulation_data
         self._model_grid = None
         self.simulation_time = SimulationTime(simulation_data)
-        self.locked = False
-        self.stored_shapes = {}
+        self._lock_state = threading.local()
+
+    def __getstate__(self):
+        # the lock state of a thread is not copied
+        state = self.__dict__.copy()
+        del state["_lock_state"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock_state = threading.local()
+
+    @property
+    def locked(self):
+        return getattr(self._lock_state, "locked", False)
+
+    @property
+    def stored_shapes(self):
+        stored_shapes = getattr(self._lock_state, "stored_shapes", None)
+        if stored_shapes is None:
+            stored_shapes = self._lock_state.stored_shapes = {}
+        return stored_shapes
 
     def lock(self):
-        self.locked = True
+        self._lock_state.locked = True
 
     def unlock(self):
-        self.locked = False
-        self.stored_shapes = {}
+        self._lock_state.locked = False
+        self._lock_state.stored_shapes = {}
 
     # returns model grid
     def get_model_grid(self):
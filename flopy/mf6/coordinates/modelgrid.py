@@ -1,3 +1,4 @@
+import weakref
 import numpy as np
 from ..utils.mfenums import DiscretizationType
 from ..data.mfstructure import MFStructure
@@ -405,6 +406,10 @@ class ModelGrid(object):
     --------
     """
 
+    # grid type of each model name file package list, stored with the data
+    # version of the package list
+    _grid_types = weakref.WeakKeyDictionary()
+
     def __init__(self, model_name, simulation_data, grid_type):
         self._model_name = model_name
         self._simulation_data = simulation_data
@@ -430,6 +435,20 @@ class ModelGrid(object):
         package_recarray = simulation_data.mfdata[
             (model_name, "nam", "packages", "packages")
         ]
+        # the grid type only changes when the name file's package list
+        # changes, so it is cached by package list and data version
+        cached = ModelGrid._grid_types.get(package_recarray)
+        if cached is not None and cached[0] == package_recarray.data_version:
+            return cached[1]
+        grid_type = ModelGrid._search_grid_type(package_recarray)
+        ModelGrid._grid_types[package_recarray] = (
+            package_recarray.data_version,
+            grid_type,
+        )
+        return grid_type
+
+    @staticmethod
+    def _search_grid_type(package_recarray):
         structure = MFStructure()
         if (
             package_recarray.search_data(
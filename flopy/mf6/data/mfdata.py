@@ -82,6 +82,7 @@ class MFTransient(object):
 
     def update_transient_key(self, old_transient_key, new_transient_key):
         if old_transient_key in self._data_storage:
+            self._set_modified()
             # replace dictionary key
             self._data_storage[new_transient_key] = self._data_storage[
                 old_transient_key
@@ -102,6 +103,7 @@ class MFTransient(object):
             self.add_transient_key(transient_key)
 
     def _set_data_prep(self, data, transient_key=0):
+        self._set_modified()
         if isinstance(transient_key, int):
             self._verify_sp(transient_key)
         if isinstance(transient_key, tuple):
@@ -130,6 +132,7 @@ class MFTransient(object):
         self._current_key = transient_key
 
     def _append_list_as_record_prep(self, record, transient_key=0):
+        self._set_modified()
         if isinstance(transient_key, int):
             self._verify_sp(transient_key)
         self._current_key = transient_key
@@ -137,6 +140,7 @@ class MFTransient(object):
             self.add_transient_key(transient_key)
 
     def _update_record_prep(self, transient_key=0):
+        self._set_modified()
         if isinstance(transient_key, int):
             self._verify_sp(transient_key)
         self._current_key = transient_key
@@ -196,6 +200,15 @@ class MFData(DataInterface):
     ----------
     _current_key : str
         current key defining specific transient dataset to be accessed
+    _deferred_block : MFBlock
+        block containing this data when loading of the block has been
+        deferred until the data is first accessed, otherwise None
+    modified : bool
+        whether the data has changed since it was last loaded from or
+        written to a file
+    data_version : int
+        counter that is incremented each time the data is loaded or changed,
+        used to check whether information derived from the data is current
 
     Methods
     -------
@@ -216,6 +229,8 @@ class MFData(DataInterface):
 
     """
 
+    _deferred_block = None
+
     def __init__(
         self,
         sim_data,
@@ -230,6 +245,8 @@ class MFData(DataInterface):
         # initialize
         self._current_key = None
         self._valid = True
+        self._modified = True
+        self._data_version = 0
         self._simulation_data = sim_data
         self._model_or_sim = model_or_sim
         self.structure = structure
@@ -257,6 +274,43 @@ class MFData(DataInterface):
         # tie this to the simulation dictionary
         sim_data.mfdata[self._path] = self
 
+    @property
+    def _data_storage(self):
+        # load the block containing this data on first access
+        if self._deferred_block is not None:
+            self._deferred_block.load_deferred()
+        return self._data_storage_obj
+
+    @_data_storage.setter
+    def _data_storage(self, data_storage):
+        self._data_storage_obj = data_storage
+
+    @property
+    def _current_key(self):
+        if self._deferred_block is not None:
+            self._deferred_block.load_deferred()
+        return self._current_key_value
+
+    @_current_key.setter
+    def _current_key(self, current_key):
+        self._current_key_value = current_key
+
+    @property
+    def modified(self):
+        return self._modified
+
+    @modified.setter
+    def modified(self, modified):
+        self._modified = modified
+
+    @property
+    def data_version(self):
+        return self._data_version
+
+    def _set_modified(self):
+        self._modified = True
+        self._data_version += 1
+
     def __repr__(self):
         return repr(self._get_storage_obj())
 
@@ -435,6 +489,7 @@ class MFData(DataInterface):
         external_file_info=None,
     ):
         self.enabled = True
+        self._data_version += 1
 
     def is_valid(self):
         # TODO: Implement for each data type
@@ -195,7 +195,9 @@ class MFArray(MFMultiDimVar):
     def __setattr__(self, name, value):
         if name == "__setstate__":
             raise AttributeError(name)
-        elif name == "fname":
+        if name in ("fname", "factor", "iprn", "binary"):
+            self._set_modified()
+        if name == "fname":
             self._get_storage_obj().layer_storage.first_item().fname = value
         elif name == "factor":
             self._get_storage_obj().layer_storage.first_item().factor = value
@@ -313,6 +315,7 @@ class MFArray(MFMultiDimVar):
     def __setitem__(self, k, value):
         storage = self._get_storage_obj()
         self._resync()
+        self._set_modified()
         if storage.layered:
             if isinstance(k, int):
                 k = (k,)
@@ -411,6 +414,7 @@ class MFArray(MFMultiDimVar):
         )
 
     def set_layered_data(self, layered_data):
+        self._set_modified()
         if layered_data is True and self.structure.layered is False:
             if (
                 self._data_dimensions.get_model_grid().grid_type()
@@ -443,6 +447,7 @@ class MFArray(MFMultiDimVar):
 
     def make_layered(self):
         if self.supports_layered():
+            self._set_modified()
             try:
                 self._get_storage_obj().make_layered()
             except Exception as ex:
@@ -498,6 +503,7 @@ class MFArray(MFMultiDimVar):
         replace_existing_external=True,
         check_data=True,
     ):
+        self._set_modified()
         storage = self._get_storage_obj()
         if storage is None:
             self._set_storage_obj(self._new_storage(False, True))
@@ -667,6 +673,7 @@ class MFArray(MFMultiDimVar):
 
     def _set_data(self, data, multiplier=None, layer=None, check_data=True):
         self._resync()
+        self._set_modified()
         if self._get_storage_obj() is None:
             self._data_storage = self._new_storage(False)
         if multiplier is None:
@@ -1376,6 +1383,7 @@ class MFTransientArray(MFArray, MFTransient):
 
     def remove_transient_key(self, transient_key):
         if transient_key in self._data_storage:
+            self._set_modified()
             del self._data_storage[transient_key]
 
     def add_transient_key(self, transient_key):
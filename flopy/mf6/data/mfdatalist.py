@@ -12,7 +12,12 @@ from ...utils import datautil
 from ...datbase import DataListInterface, DataType
 from ...mbase import ModelInterface
 from .mffileaccess import MFFileAccessList
-from .mfdatastorage import DataStorage, DataStorageType, DataStructureType
+from .mfdatastorage import (
+    DataStorage,
+    DataStorageType,
+    DataStructureType,
+    TransientListTable,
+)
 from .mfdatautil import to_string, iterable
 
 
@@ -294,6 +299,13 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                 data = self._get_data()
                 # if not empty dataset
                 if data is not None:
+                    self._set_modified()
+                    if binary is None:
+                        # apply the simulation's binary file settings
+                        binary = self._use_binary_file(data)
+                        fname, ext = os.path.splitext(external_file_path)
+                        if binary and ext.lower() == ".txt":
+                            external_file_path = "{}.bin".format(fname)
                     if (
                         self._simulation_data.verbosity_level.value
                         >= VerbosityLevel.verbose.value
@@ -309,6 +321,34 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
                     }
                     self._set_data(external_data, check_data=check_data)
 
+    def _use_binary_file(self, data):
+        # determines if data is stored in a binary file based on the
+        # simulation's external file settings
+        sim_data = self._simulation_data
+        if (
+            not sim_data.external_list_binary
+            or len(data) < sim_data.external_binary_threshold
+            or self._data_dimensions.package_dim.boundnames()
+        ):
+            return False
+        # binary files only contain cellids and numeric values
+        cellid_names = []
+        for data_item in self.structure.data_item_structures:
+            if data_item.is_cellid:
+                cellid_names.append(data_item.name)
+            elif data_item.name not in ("aux", "boundname") and (
+                data_item.optional
+                or (
+                    data_item.type != DatumType.double_precision
+                    and data_item.type != DatumType.integer
+                )
+            ):
+                return False
+        for name in data.dtype.names:
+            if name not in cellid_names and data.dtype[name].kind not in "fiu":
+                return False
+        return True
+
     def has_data(self):
         try:
             if self._get_storage_obj() is None:
@@ -357,6 +397,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
         return self._get_data(apply_mult, **kwargs)
 
     def _set_data(self, data, autofill=False, check_data=True):
+        self._set_modified()
         if isinstance(data, dict):
             if "data" in data:
                 data_check = data["data"]
@@ -506,6 +547,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
         self._set_data(data, autofill)
 
     def append_data(self, data):
+        self._set_modified()
         try:
             self._resync()
             if self._get_storage_obj() is None:
@@ -531,6 +573,7 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
 
     def append_list_as_record(self, record):
         self._resync()
+        self._set_modified()
         try:
             # convert to tuple
             tuple_record = ()
@@ -1111,6 +1154,15 @@ class MFList(mfdata.MFMultiDimVar, DataListInterface):
             self._current_key,
         )
         storage = self._get_storage_obj()
+        if (
+            external_file_info is not None
+            and storage.process_open_close_line(
+                external_file_info, 0, store=False
+            )[2]
+        ):
+            # binary files are read when the data is accessed
+            storage.point_to_existing_external_file(external_file_info, 0)
+            return [False, None]
         result = file_access.load_from_package(
             first_line, file_handle, storage, pre_data_comments
         )
@@ -1296,6 +1348,8 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         )
         self._transient_setup(self._data_storage)
         self.repeating = True
+        self._table = None
+        self._table_cells = {}
 
     @property
     def data_type(self):
@@ -1378,7 +1432,7 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
                     )
                     m4d[0, :, :, :] = array
                     for kper in range(1, nper):
-                        arrays = self.to_array(kper=kper, mask=True)
+                        arrays = self._masked_arrays(kper, name)
                         for tname, array in arrays.items():
                             if tname == name:
                                 m4d[kper, :, :, :] = array
@@ -1393,18 +1447,129 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
                     )
                     m3d[0, :, :] = array
                     for kper in range(1, nper):
-                        arrays = self.to_array(kper=kper, mask=True)
+                        arrays = self._masked_arrays(kper, name)
                         for tname, array in arrays.items():
                             if tname == name:
                                 m3d[kper, :, :] = array
                     yield name, m3d
 
     def to_array(self, kper=0, mask=False):
+        if self._in_table(kper):
+            return self._table_to_array(kper, mask)
         return super(MFTransientList, self).to_array(kper, mask)
 
+    def _masked_arrays(self, kper, name):
+        # masked arrays of stress period kper, of which only name is used
+        if self._in_table(kper):
+            return self._table_to_array(kper, True, [name])
+        return self.to_array(kper=kper, mask=True)
+
+    def _in_table(self, kper):
+        if self._table is None or kper not in self._table:
+            return False
+        layer_storage = self._data_storage[kper].layer_storage
+        return self._table.is_view(layer_storage.first_item().internal_data)
+
+    def _table_to_array(self, kper, mask=False, names=None):
+        # build the arrays of stress period kper from the compact table
+        data = self._table.get_data(kper)
+        if "inode" in data.dtype.names:
+            # lists without a cellid are handled by the general method
+            return super(MFTransientList, self).to_array(kper, mask)
+        model_grid = self._data_dimensions.get_model_grid()
+        if model_grid._grid_type.value == 1:
+            shape = (
+                model_grid.num_layers(),
+                model_grid.num_rows(),
+                model_grid.num_columns(),
+            )
+        elif model_grid._grid_type.value == 2:
+            shape = (
+                model_grid.num_layers(),
+                model_grid.num_cells_per_layer(),
+            )
+        else:
+            shape = (model_grid.num_cells_per_layer(),)
+
+        # flat cell index of each row, shared by stress periods with the
+        # same rows
+        rows = self._table.period_index[kper]
+        if rows not in self._table_cells:
+            cells = np.array(data["cellid"].tolist(), dtype=int)
+            cells = cells.reshape(len(data), len(shape))
+            self._table_cells[rows] = np.ravel_multi_index(cells.T, shape)
+        cells = self._table_cells[rows]
+        size = int(np.prod(shape))
+        cnt = np.bincount(cells, minlength=size).astype(np.float64)
+        cnt = cnt.reshape(shape)
+        arrays = {}
+        for name in data.dtype.names[1:]:
+            if data.dtype.fields[name][0] == object:
+                continue
+            if names is not None and name not in names:
+                continue
+            arr = np.bincount(cells, weights=data[name], minlength=size)
+            arr = arr.reshape(shape)
+            # average keys that should not be added
+            if name != "cond" and name != "flux":
+                idx = cnt > 0.0
+                arr[idx] /= cnt[idx]
+            if mask:
+                arr = np.ma.masked_where(cnt == 0.0, arr)
+                arr[cnt == 0.0] = np.NaN
+            arrays[name] = arr
+        return arrays
+
+    def _update_table(self, key):
+        # keep the data of stress period key in the compact table
+        if not self._simulation_data.compact_transient_lists:
+            return
+        if self._table is None:
+            self._table = TransientListTable()
+        data = None
+        if key in self._data_storage:
+            layer_storage = self._data_storage[key].layer_storage
+            if (
+                layer_storage.get_total_size() > 0
+                and layer_storage.first_item().data_storage_type
+                == DataStorageType.internal_array
+            ):
+                data = layer_storage.first_item().internal_data
+        if not isinstance(data, np.ndarray) or data.dtype.names is None:
+            self._table.remove(key)
+            return
+        if self._table.is_view(data, key):
+            # data already holds the rows of stress period key
+            return
+        self._table_cells = {}
+        try:
+            reallocated = self._table.store(key, data)
+        except TypeError:
+            # data that does not fit the table is stored separately
+            self._table.remove(key)
+            return
+        if reallocated:
+            update_keys = self._table.period_index.keys()
+        else:
+            update_keys = [key]
+        for update_key in update_keys:
+            data = self._table.get_data(update_key)
+            layer_storage = self._data_storage[update_key].layer_storage
+            layer_storage.first_item().internal_data = data
+
     def remove_transient_key(self, transient_key):
         if transient_key in self._data_storage:
+            self._set_modified()
             del self._data_storage[transient_key]
+            if self._table is not None:
+                self._table.remove(transient_key)
+
+    def update_transient_key(self, old_transient_key, new_transient_key):
+        super(MFTransientList, self).update_transient_key(
+            old_transient_key, new_transient_key
+        )
+        if self._table is not None:
+            self._table.update_key(old_transient_key, new_transient_key)
 
     def add_transient_key(self, transient_key):
         super(MFTransientList, self).add_transient_key(transient_key)
@@ -1450,6 +1615,7 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
                         replace_existing_external,
                         check_data,
                     )
+                    self._update_table(sp)
 
     def get_data(self, key=None, apply_mult=False, **kwargs):
         if self._data_storage is not None and len(self._data_storage) > 0:
@@ -1475,15 +1641,33 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
                     output = {}
                     for key in self._data_storage.keys():
                         self.get_data_prep(key)
-                        output[key] = super(MFTransientList, self).get_data(
-                            apply_mult=apply_mult
+                        output[key] = self._unshared_data(
+                            key,
+                            super(MFTransientList, self).get_data(
+                                apply_mult=apply_mult
+                            ),
                         )
                     return output
             self.get_data_prep(key)
-            return super(MFTransientList, self).get_data(apply_mult=apply_mult)
+            return self._unshared_data(
+                key,
+                super(MFTransientList, self).get_data(apply_mult=apply_mult),
+            )
         else:
             return None
 
+    def _unshared_data(self, key, data):
+        # rows shared with other stress periods are returned as a copy so
+        # that changing them does not change the other stress periods
+        if (
+            isinstance(data, np.ndarray)
+            and self._table is not None
+            and self._table.is_view(data, key)
+            and self._table.is_shared(key)
+        ):
+            return data.copy()
+        return data
+
     def set_data(self, data, key=None, autofill=False):
         if isinstance(data, dict) or isinstance(data, OrderedDict):
             if "filename" not in data:
@@ -1499,11 +1683,13 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
                         super(MFTransientList, self).set_data(
                             list_item, autofill=autofill
                         )
+                        self._update_table(key)
                 for key in del_keys:
                     del data[key]
             else:
                 self._set_data_prep(data["data"], key)
                 super(MFTransientList, self).set_data(data, autofill)
+                self._update_table(self._current_key)
         else:
             if key is None:
                 # search for a key
@@ -1517,6 +1703,7 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
             else:
                 self._set_data_prep(data, key)
                 super(MFTransientList, self).set_data(data, autofill)
+                self._update_table(self._current_key)
 
     def get_file_entry(
         self, key=0, ext_file_action=ExtFileAction.copy_relative_paths
@@ -1535,21 +1722,25 @@ class MFTransientList(MFList, mfdata.MFTransient, DataListInterface):
         external_file_info=None,
     ):
         self._load_prep(block_header)
-        return super(MFTransientList, self).load(
+        result = super(MFTransientList, self).load(
             first_line,
             file_handle,
             block_header,
             pre_data_comments,
             external_file_info,
         )
+        self._update_table(self._current_key)
+        return result
 
     def append_list_as_record(self, record, key=0):
         self._append_list_as_record_prep(record, key)
         super(MFTransientList, self).append_list_as_record(record)
+        self._update_table(key)
 
     def update_record(self, record, key_index, key=0):
         self._update_record_prep(key)
         super(MFTransientList, self).update_record(record, key_index)
+        self._update_table(key)
 
     def _new_storage(self, stress_period=0):
         return OrderedDict()
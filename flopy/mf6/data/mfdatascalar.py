@@ -162,6 +162,7 @@ class MFScalar(mfdata.MFData):
 
     def set_data(self, data):
         self._resync()
+        self._set_modified()
         if self.structure.type == DatumType.record:
             if data is not None:
                 if (
@@ -229,6 +230,7 @@ class MFScalar(mfdata.MFData):
             )
 
     def add_one(self):
+        self._set_modified()
         datum_type = self.structure.get_datum_type()
         if datum_type == int or datum_type == np.int32:
             if self._get_storage_obj().get_data() is None:
@@ -1606,10 +1606,20 @@ class DataStorage(object):
                 self._stress_period,
             )
             if self.layer_storage[layer].binary:
-                data = file_access.read_binary_data_from_file(
-                    read_file, self._model_or_sim.modeldiscrit
+                # MODFLOW 6 binary list files are double precision
+                columns = file_access.read_binary_columns_from_file(
+                    read_file, self._model_or_sim.modeldiscrit, "double"
                 )
-                data_out = self._build_recarray(data, layer, False)
+                self.build_type_list(key=layer)
+                if len(columns) == len(self._recarray_type_list):
+                    # build recarray directly from the columns
+                    data_out = np.rec.fromarrays(
+                        columns, dtype=self._recarray_type_list
+                    )
+                else:
+                    data_out = self._build_recarray(
+                        list(zip(*columns)), layer, False
+                    )
             else:
                 with open(read_file, "r") as fd_read_file:
                     data_out = file_access.read_list_data_from_file(
@@ -2675,3 +2685,156 @@ class DataStorage(object):
         for dimension in dimensions:
             data_size = data_size * dimension
         return data_size
+
+
+class TransientListTable(object):
+    """
+    Stores the list data of all stress periods of a transient list in a
+    single table.
+
+    Attributes
+    ----------
+    table : recarray
+        rows of the stress periods.  the rows of each stress period are
+        contiguous
+    period_index : OrderedDict
+        (first row, last row + 1) in table of the rows of each stress
+        period, by stress period key
+
+    Methods
+    -------
+    get_data(key) : recarray
+        returns a view of the rows of stress period key
+    is_view(data, key=None) : bool
+        returns True if data is a view of the table, or of exactly the rows
+        of stress period key when key is given
+    is_shared(key) : bool
+        returns True if stress period key shares its rows with another
+        stress period
+    store(key, data) : bool
+        copies recarray data into the table as the rows of stress period
+        key.  returns True if the table has been reallocated, which
+        invalidates the views of all stress periods
+    remove(key)
+        removes stress period key from the table
+    update_key(old_key, new_key)
+        renames stress period old_key to new_key
+
+    Notes
+    -----
+    A stress period with the same data as the previously stored stress
+    period shares its rows.  Objects, such as cellids, that are equal to
+    the objects in the same rows of the previously stored stress period
+    are shared with that stress period.  Changing the view of shared rows
+    changes all stress periods that share them, so shared rows should be
+    copied before they are changed and stored again with store.
+
+    """
+
+    def __init__(self):
+        self.table = None
+        self.period_index = OrderedDict()
+        self._size = 0
+        self._last_key = None
+
+    def __contains__(self, key):
+        return key in self.period_index
+
+    def get_data(self, key):
+        start, stop = self.period_index[key]
+        return self.table[start:stop]
+
+    def is_view(self, data, key=None):
+        if self.table is None or data.base is not self.table:
+            return False
+        if key is None:
+            return True
+        if key not in self.period_index:
+            return False
+        return np.byte_bounds(data) == np.byte_bounds(self.get_data(key))
+
+    def is_shared(self, key):
+        rows = self.period_index[key]
+        return (
+            sum(1 for other in self.period_index.values() if other == rows) > 1
+        )
+
+    def remove(self, key):
+        if key in self.period_index:
+            del self.period_index[key]
+
+    def update_key(self, old_key, new_key):
+        if old_key in self.period_index:
+            self.period_index[new_key] = self.period_index.pop(old_key)
+            if self._last_key == old_key:
+                self._last_key = new_key
+
+    def store(self, key, data):
+        self.remove(key)
+        if self.table is not None and data.dtype != self.table.dtype:
+            raise TypeError(
+                "Data type {} of stress period {} does not match the "
+                "table's data type {}.".format(
+                    data.dtype, key, self.table.dtype
+                )
+            )
+        previous_key = self._last_key
+        previous = None
+        if previous_key in self.period_index:
+            previous = self.get_data(previous_key)
+            if len(previous) != len(data):
+                previous = None
+        self._last_key = key
+        if previous is not None and all(
+            self._equal(previous[name], data[name])
+            for name in data.dtype.names
+        ):
+            # share the rows of the previous stress period
+            self.period_index[key] = self.period_index[previous_key]
+            return False
+        reallocated = self._reserve(len(data), data.dtype)
+        start = self._size
+        stop = start + len(data)
+        self.table[start:stop] = data
+        if previous is not None:
+            if reallocated:
+                previous = self.get_data(previous_key)
+            for name in data.dtype.names:
+                if data.dtype.fields[name][0] == object:
+                    # share equal objects with the previous stress period
+                    column = self.table[name][start:stop]
+                    equal = column == previous[name]
+                    column[equal] = previous[name][equal]
+        self.period_index[key] = (start, stop)
+        self._size = stop
+        return reallocated
+
+    @staticmethod
+    def _equal(column, other_column):
+        equal = column == other_column
+        if column.dtype.kind == "f":
+            # missing values are equal
+            equal |= np.isnan(column) & np.isnan(other_column)
+        return bool(np.all(equal))
+
+    def _reserve(self, num_rows, dtype):
+        # make room for num_rows rows at the end of the table
+        if self.table is not None and self._size + num_rows <= len(self.table):
+            return False
+        # copy the rows still in use to a larger table
+        ranges = sorted(set(self.period_index.values()))
+        num_used = sum(stop - start for start, stop in ranges)
+        capacity = (num_used + num_rows) * 3 // 2
+        table = np.recarray((capacity,), dtype=dtype)
+        new_ranges = {}
+        size = 0
+        for start, stop in ranges:
+            table[size : size + stop - start] = self.table[start:stop]
+            new_ranges[(start, stop)] = (size, size + stop - start)
+            size += stop - start
+        for key, rows in self.period_index.items():
+            self.period_index[key] = new_ranges[rows]
+        reallocated = self.table is not None
+        self.table = table
+        self._size = size
+        return reallocated
@@ -1,4 +1,5 @@
 import sys, inspect
+import warnings
 from copy import deepcopy
 import numpy as np
 from ..mfbase import MFDataException, VerbosityLevel
@@ -196,6 +197,9 @@ class MFFileAccess(object):
 
 
 class MFFileAccessArray(MFFileAccess):
+    # maximum number of characters of text array data converted at once
+    _text_chunk_size = 2 ** 20
+
     def __init__(
         self, structure, data_dimensions, simulation_data, path, current_key
     ):
@@ -450,6 +454,23 @@ class MFFileAccessArray(MFFileAccess):
                     jagged_def_path
                 ].array
 
+        if (
+            jagged_def is None
+            and isinstance(data, np.ndarray)
+            and data.ndim > 0
+            and data.size > 0
+            and (
+                (
+                    data_type == DatumType.double_precision
+                    and data.dtype.kind in "fiu"
+                )
+                or (data_type == DatumType.integer and data.dtype.kind in "iu")
+            )
+        ):
+            return self._get_array_data_string(
+                data, data_type, data_indent, is_cellid
+            )
+
         for item, last_item, new_list, nesting_change in data_iter:
             # increment data/layer counts
             line_data_count += 1
@@ -506,6 +527,62 @@ class MFFileAccessArray(MFFileAccess):
         else:
             return "\n".join(layer_data_string)
 
+    def _get_array_data_string(self, data, data_type, data_indent, is_cellid):
+        # format a numeric array one line at a time, producing the same text
+        # as formatting the array one value at a time with to_string
+        sim_data = self._simulation_data
+        indent_str = sim_data.indent_string
+        if sim_data.wrap_multidim_arrays:
+            row_size = data.shape[-1]
+            line_size = min(sim_data.max_columns_of_data, row_size)
+        else:
+            # all data on one line
+            row_size = line_size = data.size
+        if data_type == DatumType.double_precision:
+            rows = data.reshape(-1, row_size).astype(np.float64)
+            abs_val = np.abs(rows)
+            use_reg_format = (
+                (abs_val > sim_data._sci_note_upper_thres)
+                | (abs_val < sim_data._sci_note_lower_thres)
+            ) & (abs_val != 0)
+            reg_format = indent_str + sim_data.reg_format_str
+            sci_format = indent_str + sim_data.sci_format_str
+        else:
+            rows = data.reshape(-1, row_size).astype(np.int64)
+            if is_cellid:
+                rows = rows + 1
+
+        lines = []
+        line_formats = {}
+        for row_index in range(rows.shape[0]):
+            row = rows[row_index].tolist()
+            for start in range(0, row_size, line_size):
+                values = row[start : start + line_size]
+                if data_type != DatumType.double_precision:
+                    line = indent_str + indent_str.join(map(str, values))
+                else:
+                    reg = use_reg_format[row_index, start : start + line_size]
+                    if reg.any():
+                        line_format = "".join(
+                            [
+                                reg_format if use_reg else sci_format
+                                for use_reg in reg.tolist()
+                            ]
+                        )
+                    else:
+                        # reuse format of lines with the same number of values
+                        line_format = line_formats.get(len(values))
+                        if line_format is None:
+                            line_format = sci_format * len(values)
+                            line_formats[len(values)] = line_format
+                    line = line_format.format(*values)
+                lines.append("{}{}".format(data_indent, line))
+
+        if not sim_data.wrap_multidim_arrays:
+            return "{}{}\n".format(data_indent, lines[0].strip())
+        lines.append("")
+        return "\n".join(lines)
+
     def _read_binary_file_layer(
         self, fd, fname, header_dtype, numpy_type, data_size, data_shape
     ):
@@ -545,25 +622,43 @@ class MFFileAccessArray(MFFileAccess):
         data_item=None,
     ):
         # load variable data from file
-        current_size = 0
         if layer is None:
             layer = 0
         close_file = False
         if fd is None:
             close_file = True
             fd = self._open_ext_file(fname)
-        data_raw = []
-        line = " "
-        PyListUtil.reset_delimiter_used()
-        while line != "" and len(data_raw) < data_size:
-            line = fd.readline()
-            arr_line = PyListUtil.split_data_line(line, True)
-            if not MFComment.is_comment(arr_line, True):
-                data_raw += arr_line
-            else:
-                PyListUtil.reset_delimiter_used()
 
-        if len(data_raw) < data_size:
+        if data_type == DatumType.double_precision:
+            data_type = np.float64
+        elif data_type == DatumType.integer:
+            data_type = np.int32
+
+        # read the data in chunks of text that are converted at once
+        data_out = np.empty(data_size, dtype=data_type)
+        current_size = 0
+        while current_size < data_size:
+            remaining = data_size - current_size
+            position = fd.tell()
+            text = fd.read(min(self._text_chunk_size, 32 * remaining))
+            if not text:
+                break
+            if text[-1] != "\n":
+                # complete the last line of the chunk
+                text += fd.readline()
+            values, num_lines = self._text_to_values(
+                text, data_out.dtype, remaining
+            )
+            data_out[current_size : current_size + values.size] = values
+            current_size += values.size
+            if num_lines is not None:
+                # data ends before the end of the chunk, move the file
+                # position to the end of the last line of data
+                fd.seek(position)
+                for _ in range(num_lines):
+                    fd.readline()
+
+        if current_size < data_size:
             message = (
                 'Not enough data in file {} for data "{}".  '
                 "Expected data size {} but only found "
@@ -591,12 +686,6 @@ class MFFileAccessArray(MFFileAccess):
                 self._simulation_data.debug,
             )
 
-        if data_type == DatumType.double_precision:
-            data_type = np.float64
-        elif data_type == DatumType.integer:
-            data_type = np.int32
-
-        data_out = np.fromiter(data_raw, dtype=data_type, count=data_size)
         data_out = self._resolve_cellid_numbers_from_file(data_out)
         if close_file:
             fd.close()
@@ -604,6 +693,128 @@ class MFFileAccessArray(MFFileAccess):
         data_out = np.reshape(data_out, data_dim)
         return data_out, current_size
 
+    @staticmethod
+    def _text_to_values(text, dtype, max_size):
+        # convert up to max_size values from text.  returns the values and,
+        # if the values end before the end of text, the number of lines of
+        # text they span.  text between comments is converted with numpy's
+        # tokenizer, lines with comments are split one at a time
+        values = []
+        size = 0
+        num_lines = 0
+        start = 0
+        comment_index = {"#": None, "!": None}
+        while start < len(text):
+            # find the beginning of the next line with a comment
+            for comment_char, index in comment_index.items():
+                if index is None or 0 <= index < start:
+                    index = text.find(comment_char, start)
+                    comment_index[comment_char] = index
+            indexes = [i for i in comment_index.values() if i >= 0]
+            if indexes:
+                end = max(text.rfind("\n", start, min(indexes)) + 1, start)
+            else:
+                end = len(text)
+            if end > start:
+                try:
+                    with warnings.catch_warnings(record=True) as parse_warn:
+                        warnings.simplefilter("always")
+                        new_values = np.fromstring(
+                            text[start:end].replace(",", " "),
+                            dtype=dtype,
+                            sep=" ",
+                        )
+                    complete = not parse_warn
+                except ValueError:
+                    new_values = np.empty(0, dtype=dtype)
+                    complete = False
+                if not complete:
+                    # numpy stops at text it can not convert, such as a
+                    # fortran d exponent, a float in an integer array or a
+                    # quoted value, and the last value may only be the
+                    # start of that text.  keep the values of the lines
+                    # before it and split the remaining lines
+                    num_values = 0
+                    line_start = start
+                    while line_start < end:
+                        line_end = text.find("\n", line_start, end)
+                        if line_end < 0:
+                            break
+                        line = text[line_start:line_end].replace(",", " ")
+                        line_size = len(line.split())
+                        if num_values + line_size >= new_values.size:
+                            break
+                        num_values += line_size
+                        line_start = line_end + 1
+                    new_values = new_values[:num_values]
+                    end = line_start
+                if size + new_values.size >= max_size:
+                    # count the lines spanned by the data
+                    line_start = start
+                    while size < max_size and line_start <= len(text):
+                        line_end = text.find("\n", line_start)
+                        if line_end < 0:
+                            line_end = len(text)
+                        line = text[line_start:line_end].replace(",", " ")
+                        size += len(line.split())
+                        num_lines += 1
+                        line_start = line_end + 1
+                    values.append(new_values)
+                    values = np.concatenate(values)[:max_size]
+                    return values, num_lines
+                values.append(new_values)
+                size += new_values.size
+                num_lines += text.count("\n", start, end)
+                start = end
+                if start == len(text):
+                    break
+                if not complete:
+                    end = len(text)
+                else:
+                    # split the line with the comment
+                    end = text.find("\n", start) + 1
+                    if end == 0:
+                        end = len(text)
+            else:
+                end = text.find("\n", start) + 1
+                if end == 0:
+                    end = len(text)
+            new_values, split_lines = MFFileAccessArray._split_text_to_values(
+                text[start:end], dtype, max_size - size
+            )
+            values.append(new_values)
+            size += new_values.size
+            if split_lines is not None:
+                return np.concatenate(values), num_lines + split_lines
+            num_lines += text.count("\n", start, end)
+            start = end
+        return np.concatenate(values), None
+
+    @staticmethod
+    def _split_text_to_values(text, dtype, max_size):
+        data_raw = []
+        num_lines = 0
+        PyListUtil.reset_delimiter_used()
+        if dtype.kind == "f":
+            # fortran d exponents
+            text = text.replace("d", "e").replace("D", "E")
+        for line in text.split("\n"):
+            num_lines += 1
+            arr_line = PyListUtil.split_data_line(line, True)
+            if MFComment.is_comment(arr_line, True):
+                PyListUtil.reset_delimiter_used()
+                continue
+            if "#" in arr_line:
+                # remove comment at end of line
+                arr_line = arr_line[: arr_line.index("#")]
+            data_raw += arr_line
+            if len(data_raw) >= max_size:
+                return (
+                    np.fromiter(data_raw, dtype=dtype, count=max_size),
+                    num_lines,
+                )
+        return np.fromiter(data_raw, dtype=dtype, count=len(data_raw)), None
+
     def load_from_package(
         self,
         first_line,
@@ -982,31 +1193,41 @@ class MFFileAccessList(MFFileAccess):
     def read_binary_data_from_file(
         self, read_file, modelgrid, precision="double"
     ):
-        # read from file
+        # build data list for recarray
+        columns = self.read_binary_columns_from_file(
+            read_file, modelgrid, precision
+        )
+        return list(zip(*columns))
+
+    def read_binary_columns_from_file(
+        self, read_file, modelgrid, precision="double"
+    ):
+        """
+        Reads a binary list file with a single np.fromfile call and
+        returns its columns.  The cellid columns are combined into an
+        object array of zero-based cellid tuples and the other columns are
+        views of the array read from the file.
+
+        """
         header, int_cellid_indexes, ext_cellid_indexes = self._get_header(
             modelgrid, precision
         )
         file_array = np.fromfile(read_file, dtype=header, count=-1)
-        # build data list for recarray
         cellid_size = len(self._get_cell_header(modelgrid))
-        data_list = []
-        for record in file_array:
-            data_record = ()
-            current_cellid_size = 0
-            current_cellid = ()
-            for index, data_item in enumerate(record):
-                if index in ext_cellid_indexes:
-                    current_cellid += (data_item - 1,)
-                    current_cellid_size += 1
-                    if current_cellid_size == cellid_size:
-                        data_record += current_cellid
-                        data_record = (data_record,)
-                        current_cellid = ()
-                        current_cellid_size = 0
-                else:
-                    data_record += (data_item,)
-            data_list.append(data_record)
-        return data_list
+        columns = []
+        cellid = []
+        for index, name in enumerate(file_array.dtype.names):
+            if index in ext_cellid_indexes:
+                cellid.append(file_array[name] - 1)
+                if len(cellid) == cellid_size:
+                    # combine cellid columns into tuples of python ints
+                    columns.append(
+                        np.frompyfunc(lambda *x: x, cellid_size, 1)(*cellid)
+                    )
+                    cellid = []
+            else:
+                columns.append(file_array[name])
+        return columns
 
     def write_binary_file(
         self, data, fname, modelgrid=None, precision="double"
@@ -1020,6 +1241,30 @@ class MFFileAccessList(MFFileAccess):
         header, int_cellid_indexes, ext_cellid_indexes = self._get_header(
             modelgrid, precision
         )
+        if (
+            isinstance(data, np.ndarray)
+            and data.dtype.names is not None
+            and len(data.dtype.names)
+            == len(header) - len(ext_cellid_indexes) + len(int_cellid_indexes)
+        ):
+            # fill the binary records one column at a time
+            data_array = np.empty(len(data), dtype=header)
+            ext_index = 0
+            for index, name in enumerate(data.dtype.names):
+                if index in int_cellid_indexes:
+                    cellid_size = len(self._get_cell_header(modelgrid))
+                    cellids = np.array(data[name].tolist()).reshape(
+                        (len(data), cellid_size)
+                    )
+                    for cellid_index in range(cellid_size):
+                        data_array[header[ext_index][0]] = (
+                            cellids[:, cellid_index] + 1
+                        )
+                        ext_index += 1
+                else:
+                    data_array[header[ext_index][0]] = data[name]
+                    ext_index += 1
+            return data_array
         data_list = []
         for record in data:
             new_record = ()
@@ -1036,7 +1281,10 @@ class MFFileAccessList(MFFileAccess):
         return np.array(data_list, dtype=header)
 
     def _get_header(self, modelgrid, precision):
-        np_flt_type = np.float64
+        if precision == "single":
+            np_flt_type = np.float32
+        else:
+            np_flt_type = np.float64
         header = []
         int_cellid_indexes = {}
         ext_cellid_indexes = {}
@@ -1276,8 +1524,15 @@ class MFFileAccessList(MFFileAccess):
         optional_line_info = []
         line_info_processed = False
         data_structs = struct.data_item_structures
+        # lines that were read ahead by the bulk loader, but still need to
+        # be processed line by line
+        pending_lines = []
+        bulk_spec = None
         while line != "":
-            line = file_handle.readline()
+            if pending_lines:
+                line = pending_lines.pop(0)
+            else:
+                line = file_handle.readline()
             arr_line = PyListUtil.split_data_line(line)
             if not line or (
                 arr_line
@@ -1427,6 +1682,27 @@ class MFFileAccessList(MFFileAccess):
                         )
 
                     data_loaded.append(self._data_line)
+
+                    # load the lines that follow in bulk
+                    if bulk_spec is None:
+                        bulk_spec = False
+                        if recarray_len == 1:
+                            bulk_spec = self._get_simple_line_spec()
+                    if (
+                        bulk_spec
+                        and not pending_lines
+                        and arr_line_len == bulk_spec[1]
+                    ):
+                        (
+                            num_lines,
+                            pending_lines,
+                            bulk_ok,
+                        ) = self._load_simple_lines(
+                            file_handle, bulk_spec, data_loaded
+                        )
+                        line_num += num_lines
+                        if not bulk_ok:
+                            bulk_spec = False
             else:
                 try:
                     data_line = self._load_list_line(
@@ -1469,6 +1745,156 @@ class MFFileAccessList(MFFileAccess):
         else:
             return [False, None, data_line]
 
+    def _get_simple_line_spec(self):
+        """
+        Get the layout of a simple list line from the line info of the last
+        line loaded by the quick load, for loading the lines that follow in
+        bulk.  Returns a tuple with a list of the data items of a line and
+        the number of values on the line, or False if the line can not be
+        loaded in bulk.
+        """
+        struct = self.structure
+        data_structs = struct.data_item_structures
+        spec = []
+        data_index = 0
+        for index, entry in enumerate(self._last_line_info):
+            if len(entry) == 0:
+                return False
+            if entry[0][2] > 0:
+                if len(entry) != entry[0][2]:
+                    return False
+                spec.append(("cellid", [sub_entry[0] for sub_entry in entry]))
+            elif len(entry) != 1:
+                return False
+            elif entry[0][1] is None:
+                spec.append(("none",))
+            else:
+                spec.append(
+                    ("value", entry[0][0], entry[0][1], data_structs[index])
+                )
+            data_index = entry[-1][0]
+        data_index += 1
+        for data_item in data_structs[len(self._last_line_info) :]:
+            if data_item.name == "aux":
+                aux_var_names = (
+                    self._data_dimensions.package_dim.get_aux_variables()
+                )
+                if aux_var_names is not None:
+                    for var_name in aux_var_names[0]:
+                        if var_name.lower() != "auxiliary":
+                            spec.append(
+                                (
+                                    "value",
+                                    data_index,
+                                    data_item.type,
+                                    data_item,
+                                )
+                            )
+                            data_index += 1
+            elif (
+                data_item.name == "boundname"
+                and self._data_dimensions.package_dim.boundnames()
+            ):
+                spec.append(("value", data_index, data_item.type, data_item))
+                data_index += 1
+                break
+        for item in spec:
+            if item[0] != "value":
+                continue
+            data_type, data_item = item[2], item[3]
+            if data_type == DatumType.double_precision:
+                if data_item.support_negative_index:
+                    return False
+            elif data_type not in (DatumType.integer, DatumType.string):
+                return False
+        return spec, data_index
+
+    def _load_simple_lines(self, file_handle, bulk_spec, data_loaded):
+        """
+        Read the lines of a simple list that follow the current line and
+        that hold exactly the values of bulk_spec, and convert them in bulk
+        with numpy.  Reading stops at the first line that is not such a
+        line, such as a comment, a line with quotes or delimiters, a line
+        with optional data missing or the end of the block.
+
+        Returns
+        -------
+        num_lines : int
+            Number of lines loaded.
+        pending_lines : list
+            Lines that were read but not loaded, which must be processed
+            line by line.
+        bulk_ok : bool
+            False if the lines could not be converted in bulk.
+        """
+        spec, num_values = bulk_spec
+        lines = []
+        while True:
+            line = file_handle.readline()
+            arr_line = line.split()
+            if (
+                len(arr_line) != num_values
+                or arr_line[0][:3].upper() == "END"
+                or "#" in line
+                or "!" in line
+                or "//" in line
+                or "," in line
+                or "'" in line
+                or '"' in line
+            ):
+                break
+            lines.append(line)
+        if not lines:
+            return 0, [line], True
+
+        # one field per value on the line, so that numpy tokenizes and
+        # converts the whole block at once
+        str_len = max(len(block_line) for block_line in lines)
+        dtype = []
+        for item in spec:
+            if item[0] == "cellid":
+                dtype.extend(
+                    ("f{}".format(index), np.int64) for index in item[1]
+                )
+            elif item[0] == "value":
+                if item[2] == DatumType.double_precision:
+                    field_type = np.float64
+                elif item[2] == DatumType.integer:
+                    field_type = np.int64
+                else:
+                    field_type = "U{}".format(str_len)
+                dtype.append(("f{}".format(item[1]), field_type))
+        try:
+            block = np.loadtxt(lines, dtype=dtype, comments=None, ndmin=1)
+        except ValueError:
+            # fall back to loading the lines one at a time
+            return 0, lines + [line], False
+
+        values = []
+        for item in spec:
+            if item[0] == "cellid":
+                cellid = [
+                    (block["f{}".format(index)] - 1).tolist()
+                    for index in item[1]
+                ]
+                values.append(list(zip(*cellid)))
+            elif item[0] == "none":
+                values.append([None] * len(lines))
+            else:
+                data_type, data_item = item[2], item[3]
+                column = block["f{}".format(item[1])]
+                if data_type == DatumType.integer and data_item.numeric_index:
+                    column = column - 1
+                elif (
+                    data_type == DatumType.string
+                    and not data_item.preserve_case
+                ):
+                    # keep strings lower case
+                    column = np.char.lower(column)
+                values.append(column.tolist())
+        data_loaded.extend(zip(*values))
+        return len(lines), [line], True
+
     def _load_list_line(
         self,
         storage,
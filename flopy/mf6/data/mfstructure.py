@@ -7,6 +7,10 @@ import os
 import traceback
 import ast
 import keyword
+import glob
+import hashlib
+import pickle
+import tempfile
 from enum import Enum
 from textwrap import TextWrapper
 from collections import OrderedDict
@@ -2402,9 +2406,23 @@ class MFStructure(object):
     dimension_dict : dict
         Dictionary mapping paths to dimension information to the dataitem whose
         dimension information is being described
+    use_cache : bool
+        whether the resolved structure is stored in and loaded from a cache
+        file in the user's cache directory.  The cache is rebuilt whenever
+        the flopy version or the package definition files change.
+
+    Notes
+    -----
+    Building the structure from the package definitions is the most
+    expensive part of creating the first MFSimulation in a python session.
+    The resolved structure is therefore pickled to structure.pickle in the
+    user's cache directory.  If the optional 'appdirs' package is available,
+    this is the platform-dependent user cache directory, otherwise the
+    user's 'HOME/.flopy' directory.
     """
 
     _instance = None
+    use_cache = True
 
     def __new__(cls, internal_request=False, load_from_dfn_files=False):
         if cls._instance is None:
@@ -2430,6 +2448,9 @@ class MFStructure(object):
         return format(str(self.mf_version))
 
     def __load_structure(self):
+        if not self.load_from_dfn_files and self.__load_cache():
+            return True
+
         # set up structure classes
         self.sim_struct = MFSimulationStructure()
 
@@ -2453,9 +2474,90 @@ class MFStructure(object):
             for package in package_list:
                 self.sim_struct.process_dfn(DfnPackage(package))
             self.sim_struct.tag_read_as_arrays()
+            self.__save_cache()
+
+        return True
+
+    @staticmethod
+    def cache_path():
+        """
+        Returns the path of the structure cache file.
+
+        Returns
+        -------
+        cache_path : str
+
+        """
+        try:
+            from appdirs import user_cache_dir
+        except ImportError:
+            user_cache_dir = None
+        if user_cache_dir:
+            cache_dir = user_cache_dir("flopy")
+        else:
+            # if appdirs is not installed, use user's home directory
+            cache_dir = os.path.join(os.path.expanduser("~"), ".flopy")
+        return os.path.join(cache_dir, "structure.pickle")
 
+    @staticmethod
+    def __cache_key():
+        # the structure depends on the flopy version and on the package
+        # definitions, which are stored in the generated package classes
+        from ...version import __version__
+
+        mf6_path = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+        file_list = glob.glob(os.path.join(mf6_path, "modflow", "*.py"))
+        file_list += glob.glob(os.path.join(mf6_path, "data", "dfn", "*.dfn"))
+        file_list.append(os.path.realpath(__file__))
+        key = hashlib.sha1(__version__.encode())
+        for file_path in sorted(file_list):
+            stat = os.stat(file_path)
+            key.update(
+                "{} {} {}".format(
+                    os.path.basename(file_path), stat.st_mtime, stat.st_size
+                ).encode()
+            )
+        return key.hexdigest()
+
+    def __load_cache(self):
+        if not self.use_cache:
+            return False
+        try:
+            with open(self.cache_path(), "rb") as fd:
+                key, structure = pickle.load(fd)
+            if key != self.__cache_key():
+                return False
+        except Exception:
+            # a missing, outdated, or unreadable cache is rebuilt
+            return False
+        self.sim_struct, self.dimension_dict, self.flopy_dict = structure
         return True
 
+    def __save_cache(self):
+        if not self.use_cache:
+            return
+        structure = (self.sim_struct, self.dimension_dict, self.flopy_dict)
+        cache_path = self.cache_path()
+        temp_path = None
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            # write to a temporary file first so that other processes
+            # never read a partially written cache
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, "wb") as temp_fd:
+                pickle.dump(
+                    (self.__cache_key(), structure),
+                    temp_fd,
+                    pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_path, cache_path)
+        except Exception:
+            # the cache is only an optimization
+            if temp_path is not None and os.path.isfile(temp_path):
+                os.remove(temp_path)
+
     def __load_flopy(self):
         current_variable = None
         var_info = {}
@@ -2,6 +2,7 @@ import glob
 import importlib
 import inspect, sys, traceback
 import os, collections, copy
+from concurrent.futures import ThreadPoolExecutor
 from shutil import copyfile
 from enum import Enum
 
@@ -558,10 +559,7 @@ class PackageContainer(object):
     def get_module(package_file_path):
         package_file_name = os.path.basename(package_file_path)
         module_path = os.path.splitext(package_file_name)[0]
-        module_name = "{}{}{}".format(
-            "Modflow", module_path[2].upper(), module_path[3:]
-        )
-        if module_name.startswith("__"):
+        if module_path.startswith("__"):
             return None
 
         # import
@@ -671,6 +669,23 @@ class PackageContainer(object):
         path = (package.package_name,)
         return (path, None)
 
+    @staticmethod
+    def _write_files(write_functions, max_workers=1):
+        # each write function writes a different file, so the files are
+        # the same regardless of the order in which they are written
+        if max_workers == 1 or len(write_functions) < 2:
+            for write_function in write_functions:
+                write_function()
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(write_function)
+                    for write_function in write_functions
+                ]
+                # raise any errors in the order the files were submitted
+                for future in futures:
+                    future.result()
+
     @staticmethod
     def _load_only_dict(load_only):
         if load_only is None:
@@ -3,6 +3,7 @@ mfmodel module.  Contains the MFModel class
 
 """
 import os, sys, inspect, warnings
+import functools
 import numpy as np
 from .mfbase import (
     PackageContainer,
@@ -774,7 +775,12 @@ class MFModel(PackageContainer, ModelInterface):
 
         return instance
 
-    def write(self, ext_file_action=ExtFileAction.copy_relative_paths):
+    def write(
+        self,
+        ext_file_action=ExtFileAction.copy_relative_paths,
+        max_workers=1,
+        incremental=False,
+    ):
         """
         write model to model files
 
@@ -784,6 +790,15 @@ class MFModel(PackageContainer, ModelInterface):
             defines what to do with external files when the simulation path has
             changed.  defaults to copy_relative_paths which copies only files
             with relative paths, leaving files defined by absolute paths fixed.
+        max_workers : int
+            maximum number of threads used to write package files and their
+            external files.  if None, the default of
+            concurrent.futures.ThreadPoolExecutor is used.  defaults to 1,
+            which writes the packages one after another.
+        incremental : bool
+            only write the package files that have changed since the model
+            was last loaded or written.  defaults to False, which writes all
+            package files.
 
         Returns
         -------
@@ -799,7 +814,13 @@ class MFModel(PackageContainer, ModelInterface):
         ):
             print("    writing model name file...")
 
-        self.name_file.write(ext_file_action=ext_file_action)
+        write_functions = [
+            functools.partial(
+                self.name_file.write,
+                ext_file_action=ext_file_action,
+                incremental=incremental,
+            )
+        ]
 
         # write packages
         for pp in self.packagelist:
@@ -808,7 +829,14 @@ class MFModel(PackageContainer, ModelInterface):
                 >= VerbosityLevel.normal.value
             ):
                 print("    writing package {}...".format(pp._get_pname()))
-            pp.write(ext_file_action=ext_file_action)
+            write_functions.append(
+                functools.partial(
+                    pp.write,
+                    ext_file_action=ext_file_action,
+                    incremental=incremental,
+                )
+            )
+        self._write_files(write_functions, max_workers)
 
     def get_grid_type(self):
         """
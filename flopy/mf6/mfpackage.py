@@ -1,3 +1,4 @@
+import io
 import os
 import sys
 import errno
@@ -268,6 +269,68 @@ class MFBlockHeader(object):
         return transient_key
 
 
+class MFDeferredLoad(object):
+    """
+    Location of a block in a MF6 input file whose loading has been deferred
+    until its data is first accessed
+
+    Parameters
+    ----------
+    file_path : string
+        path to the file containing the block
+    offset : int
+        file position of the first line after the block header
+    header_line : string
+        text of the block header line
+    block_header : MFBlockHeader
+        block header of the block
+    strict : boolean
+        strict enforcement of file formatting when the block is loaded
+    post_comments : MFComment
+        comments following the end of the block
+
+    Attributes
+    ----------
+    text : string
+        block text read from the file before the file is overwritten
+
+    """
+
+    def __init__(
+        self,
+        file_path,
+        offset,
+        header_line,
+        block_header,
+        strict,
+        post_comments,
+    ):
+        self.file_path = file_path
+        self.offset = offset
+        self.header_line = header_line
+        self.block_header = block_header
+        self.strict = strict
+        self.post_comments = post_comments
+        self.text = None
+
+    def read_text(self):
+        """Reads the text of the block following the block header."""
+        if self.text is not None:
+            return self.text
+        lines = []
+        with open(self.file_path, "r") as fd:
+            fd.seek(self.offset)
+            line = fd.readline()
+            while line != "":
+                lines.append(line)
+                if line.lstrip()[:3].upper() == "END":
+                    break
+                line = fd.readline()
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+        return "".join(lines)
+
+
 class MFBlock(object):
     """
     Represents a block in a MF6 input file
@@ -310,6 +373,13 @@ class MFBlock(object):
     load : (block_header : MFBlockHeader, fd : file, strict : boolean)
         loads block from file object.  file object must be advanced to
         beginning of block before calling
+    defer_load : (block_header : MFBlockHeader, header_line : string,
+                  fd : file, strict : boolean, post_comments : MFComment)
+        records the location of the block in file object and skips to the
+        end of the block.  the block is loaded when its data is first
+        accessed
+    load_deferred : ()
+        loads any blocks whose loading has been deferred
     write : (fd : file)
         writes block to a file object
     is_valid : ()
@@ -359,6 +429,7 @@ class MFBlock(object):
         # initially disable if optional
         self.enabled = structure.number_non_optional_data() > 0
         self.loaded = False
+        self.deferred_loads = []
         self.external_file_name = None
         self._structure_init()
 
@@ -789,7 +860,14 @@ class MFBlock(object):
         # if block not empty
         external_file_info = None
         if not (len(arr_line[0]) > 2 and arr_line[0][:3].upper() == "END"):
-            if arr_line[0].lower() == "open/close":
+            if arr_line[0].lower() == "open/close" and self._binary_file(
+                arr_line
+            ):
+                # binary block contents are read from the external file
+                # when the data is accessed
+                fd_block.readline()
+                external_file_info = arr_line
+            elif arr_line[0].lower() == "open/close":
                 # open block contents from external file
                 fd_block.readline()
                 fd_path = os.path.split(os.path.realpath(fd_block.name))[0]
@@ -948,6 +1026,113 @@ class MFBlock(object):
         self.loaded = True
         self.is_valid()
 
+    @staticmethod
+    def _binary_file(arr_line):
+        for word in arr_line[2:]:
+            if word.lower() in ("binary", "(binary)"):
+                return True
+        return False
+
+    def deferrable(self):
+        """Returns whether loading of the block can be deferred."""
+        # name files, options and dimensions are needed to load the rest of
+        # the simulation
+        if (
+            self._container_package.package_type == "nam"
+            or self.structure.name.lower() in ("options", "dimensions")
+        ):
+            return False
+        # blocks that reference child packages must be loaded immediately
+        for dataset in self.datasets.values():
+            if dataset.structure.file_data:
+                return False
+        return True
+
+    def defer_load(
+        self, block_header, header_line, fd, strict=True, post_comments=None
+    ):
+        # record block location and skip to the end of the block
+        offset = fd.tell()
+        # blocks with repeated headers are either all deferred or all loaded
+        load_now = self.loaded and not self.deferred_loads
+        line = fd.readline()
+        while line != "" and not load_now:
+            clean_line = line.lstrip()[:10].upper()
+            if clean_line == "OPEN/CLOSE":
+                # external file paths are relative to the current
+                # simulation path, so load the block now
+                self.load_deferred()
+                load_now = True
+            elif clean_line[:3] == "END":
+                break
+            line = fd.readline()
+        if load_now:
+            fd.seek(offset)
+            self.load(block_header, fd, strict)
+            if post_comments is not None:
+                self._simulation_data.mfdata[
+                    self.block_headers[-1].blk_post_comment_path
+                ] = post_comments
+            return
+
+        self.enabled = True
+        self.loaded = True
+        self.deferred_loads.append(
+            MFDeferredLoad(
+                os.path.realpath(fd.name),
+                offset,
+                header_line,
+                block_header,
+                strict,
+                post_comments,
+            )
+        )
+        for dataset in self.datasets.values():
+            dataset._deferred_block = self
+
+    def load_deferred(self):
+        if not self.deferred_loads:
+            return
+        deferred_loads = self.deferred_loads
+        self.deferred_loads = []
+        modified = {}
+        for key, dataset in self.datasets.items():
+            dataset._deferred_block = None
+            modified[key] = dataset.modified
+        if (
+            self._simulation_data.verbosity_level.value
+            >= VerbosityLevel.verbose.value
+        ):
+            print("      loading block {}...".format(self.structure.name))
+        # load blocks in the order they appear in the file
+        self.loaded = False
+        for deferred_load in deferred_loads:
+            if deferred_load.text is not None:
+                fd = io.StringIO(deferred_load.text)
+                fd.name = deferred_load.file_path
+            else:
+                fd = open(deferred_load.file_path, "r")
+                fd.seek(deferred_load.offset)
+            try:
+                self.load(deferred_load.block_header, fd, deferred_load.strict)
+            finally:
+                fd.close()
+            if deferred_load.post_comments is not None:
+                self._simulation_data.mfdata[
+                    self.block_headers[-1].blk_post_comment_path
+                ] = deferred_load.post_comments
+        # loading the block from file does not modify its data
+        for key, dataset in self.datasets.items():
+            dataset.modified = modified[key]
+        if self._simulation_data.auto_set_sizes:
+            self._container_package._update_size_defs()
+
+    def read_deferred(self):
+        # keep the text of blocks that have not been loaded in memory before
+        # the package file is overwritten
+        for deferred_load in self.deferred_loads:
+            deferred_load.text = deferred_load.read_text()
+
     def _find_data_by_keyword(self, line, fd, initial_comment):
         first_key = None
         nothing_found = False
@@ -1125,6 +1310,10 @@ class MFBlock(object):
                 comments.append(arr_line)
 
     def write(self, fd, ext_file_action=ExtFileAction.copy_relative_paths):
+        if self.deferred_loads:
+            # copy block text for blocks that have never been loaded
+            self._write_deferred(fd)
+            return
         # never write an empty block
         is_empty = self.is_empty()
         if (
@@ -1151,6 +1340,24 @@ class MFBlock(object):
         else:
             self._write_block(fd, self.block_headers[0], ext_file_action)
 
+    def _write_deferred(self, fd):
+        for deferred_load in self.deferred_loads:
+            text = deferred_load.read_text()
+            fd.write(deferred_load.header_line)
+            # point to the block in the file being written
+            deferred_load.file_path = os.path.realpath(fd.name)
+            deferred_load.offset = fd.tell()
+            deferred_load.text = text
+            fd.write(text)
+
+            # write post block comments
+            if deferred_load.post_comments is not None:
+                deferred_load.post_comments.write(fd)
+
+            # write extra line if comments are off
+            if not self._simulation_data.comments_on:
+                fd.write("\n")
+
     def _add_missing_block_headers(self, repeating_dataset):
         for key in repeating_dataset.get_active_key_list():
             if not self._header_exists(key[0]):
@@ -1178,8 +1385,14 @@ class MFBlock(object):
                 )
                 and dataset.enabled
             ):
+                if isinstance(dataset, mfdatalist.MFList):
+                    # lists follow the simulation's binary file settings
+                    binary = None
+                else:
+                    binary = False
                 dataset.store_as_external_file(
                     "{}_{}.txt".format(base_name, dataset.structure.name),
+                    binary=binary,
                     replace_existing_external=False,
                     check_data=check_data,
                 )
@@ -1400,6 +1613,9 @@ class MFPackage(PackageContainer, PackageInterface):
         describes the blocks and data contain in this package
     dimensions : PackageDimension
         resolves data dimensions for data within this package
+    modified : bool
+        whether any of the package's data has changed since the package was
+        last loaded from or written to a file
 
     Methods
     -------
@@ -1412,8 +1628,9 @@ class MFPackage(PackageContainer, PackageInterface):
         Loads the package from file
     is_valid : bool
         Returns whether or not this package is valid
-    write
-        Writes the package to a file
+    write : (ext_file_action : ExtFileAction, incremental : bool)
+        Writes the package to a file.  If incremental is True the file is only
+        written if the package has been modified or its file path has changed
     get_file_path : string
         Returns the package file's path
     remove
@@ -1561,6 +1778,7 @@ class MFPackage(PackageContainer, PackageInterface):
         self.bc_color = "black"
         self.__inattr = False
         self._child_package_groups = {}
+        self._written_path = None
 
     def __setattr__(self, name, value):
         if hasattr(self, name) and getattr(self, name) is not None:
@@ -1613,6 +1831,21 @@ class MFPackage(PackageContainer, PackageInterface):
     def package_type(self):
         return self._package_type
 
+    @property
+    def modified(self):
+        for block in self.blocks.values():
+            for dataset in block.datasets.values():
+                if dataset.modified:
+                    return True
+        return False
+
+    def _reset_modified(self):
+        # the package file now matches the package's data
+        for block in self.blocks.values():
+            for dataset in block.datasets.values():
+                dataset.modified = False
+        self._written_path = os.path.realpath(self.get_file_path())
+
     @property
     def name(self):
         return [self.package_name]
@@ -1768,6 +2001,9 @@ class MFPackage(PackageContainer, PackageInterface):
 
         # loop through all data
         for block in self.blocks.values():
+            if block.deferred_loads:
+                # sizes of data that has not been loaded are unchanged
+                continue
             for dataset in block.datasets.values():
                 # if data shape is 1-D
                 if (
@@ -1975,6 +2211,7 @@ class MFPackage(PackageContainer, PackageInterface):
 
         if self.simulation_data.auto_set_sizes:
             self._update_size_defs()
+        self._reset_modified()
 
         # return validity of file
         return self.is_valid()
@@ -2144,14 +2381,28 @@ class MFPackage(PackageContainer, PackageInterface):
                             "", self.path, self._simulation_data
                         )
 
-                        cur_block.load(
-                            block_header_info, fd_input_file, strict
-                        )
+                        if (
+                            self._simulation_data.lazy_load
+                            and cur_block.deferrable()
+                        ):
+                            # load block on first access of its data
+                            cur_block.defer_load(
+                                block_header_info,
+                                line,
+                                fd_input_file,
+                                strict,
+                                self.post_block_comments,
+                            )
+                        else:
+                            cur_block.load(
+                                block_header_info, fd_input_file, strict
+                            )
 
-                        # write post block comment comment
-                        self._simulation_data.mfdata[
-                            cur_block.block_headers[-1].blk_post_comment_path
-                        ] = self.post_block_comments
+                            # write post block comment comment
+                            block_header = cur_block.block_headers[-1]
+                            self._simulation_data.mfdata[
+                                block_header.blk_post_comment_path
+                            ] = self.post_block_comments
 
                         blocks_read += 1
                         if blocks_read >= max_blocks:
@@ -2188,16 +2439,33 @@ class MFPackage(PackageContainer, PackageInterface):
                     # treat unresolved text as a comment for now
                     self._store_comment(line, found_first_block)
 
-    def write(self, ext_file_action=ExtFileAction.copy_relative_paths):
+    def write(
+        self,
+        ext_file_action=ExtFileAction.copy_relative_paths,
+        incremental=False,
+    ):
+        package_file_path = self.get_file_path()
+        if (
+            incremental
+            and not self.modified
+            and self._written_path == os.path.realpath(package_file_path)
+            and os.path.isfile(package_file_path)
+        ):
+            # package file is up to date
+            return
+
         if self.simulation_data.auto_set_sizes:
             self._update_size_defs()
 
         # create any folders in path
-        package_file_path = self.get_file_path()
         package_folder = os.path.split(package_file_path)[0]
         if package_folder and not os.path.isdir(package_folder):
             os.makedirs(os.path.split(package_file_path)[0])
 
+        # read blocks that have not been loaded before overwriting the file
+        for block in self.blocks.values():
+            block.read_deferred()
+
         # open file
         fd = open(package_file_path, "w")
 
@@ -2219,6 +2487,12 @@ class MFPackage(PackageContainer, PackageInterface):
 
         fd.close()
 
+        # blocks that have not been loaded are now read from the new file
+        for block in self.blocks.values():
+            for deferred_load in block.deferred_loads:
+                deferred_load.text = None
+        self._reset_modified()
+
     def create_package_dimensions(self):
         model_dims = None
         if self.container_type[0] == PackageContainerType.model:
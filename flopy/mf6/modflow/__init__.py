@@ -1,60 +1,95 @@
 # imports
-from .mfsimulation import MFSimulation
-from .mfnam import ModflowNam
-from .mftdis import ModflowTdis
-from .mfgwfgwf import ModflowGwfgwf
-from .mfims import ModflowIms
-from .mfmvr import ModflowMvr
-from .mfgnc import ModflowGnc
-from .mfgwfgwt import ModflowGwfgwt
-from .mfutlobs import ModflowUtlobs
-from .mfutlts import ModflowUtlts
-from .mfutltas import ModflowUtltas
-from .mfutllaktab import ModflowUtllaktab
-from .mfgwfnam import ModflowGwfnam
-from .mfgwf import ModflowGwf
-from .mfgwfdis import ModflowGwfdis
-from .mfgwfdisv import ModflowGwfdisv
-from .mfgwfdisu import ModflowGwfdisu
-from .mfgwfic import ModflowGwfic
-from .mfgwfnpf import ModflowGwfnpf
-from .mfgwfsto import ModflowGwfsto
-from .mfgwfhfb import ModflowGwfhfb
-from .mfgwfchd import ModflowGwfchd
-from .mfgwfwel import ModflowGwfwel
-from .mfgwfdrn import ModflowGwfdrn
-from .mfgwfriv import ModflowGwfriv
-from .mfgwfghb import ModflowGwfghb
-from .mfgwfrch import ModflowGwfrch
-from .mfgwfrcha import ModflowGwfrcha
-from .mfgwfevt import ModflowGwfevt
-from .mfgwfevta import ModflowGwfevta
-from .mfgwfmaw import ModflowGwfmaw
-from .mfgwfsfr import ModflowGwfsfr
-from .mfgwflak import ModflowGwflak
-from .mfgwfuzf import ModflowGwfuzf
-from .mfgwfmvr import ModflowGwfmvr
-from .mfgwfgnc import ModflowGwfgnc
-from .mfgwfoc import ModflowGwfoc
-from .mfgwfcsub import ModflowGwfcsub
-from .mfgwfbuy import ModflowGwfbuy
-from .mfgwtnam import ModflowGwtnam
-from .mfgwt import ModflowGwt
-from .mfgwtuzt import ModflowGwtuzt
-from .mfgwtmvt import ModflowGwtmvt
-from .mfgwtdsp import ModflowGwtdsp
-from .mfgwtssm import ModflowGwtssm
-from .mfgwtmwt import ModflowGwtmwt
-from .mfgwtcnc import ModflowGwtcnc
-from .mfgwtsft import ModflowGwtsft
-from .mfgwtdisv import ModflowGwtdisv
-from .mfgwtlkt import ModflowGwtlkt
-from .mfgwtic import ModflowGwtic
-from .mfgwtdisu import ModflowGwtdisu
-from .mfgwtsrc import ModflowGwtsrc
-from .mfgwtdis import ModflowGwtdis
-from .mfgwtoc import ModflowGwtoc
-from .mfgwtadv import ModflowGwtadv
-from .mfgwtfmi import ModflowGwtfmi
-from .mfgwtist import ModflowGwtist
-from .mfgwtmst import ModflowGwtmst
+import importlib
+import sys
+
+# The package classes are imported on first access (PEP 562), so that
+# importing flopy.mf6 does not import all of the package modules.
+_class_modules = {
+    "MFSimulation": ".mfsimulation",
+    "ModflowNam": ".mfnam",
+    "ModflowTdis": ".mftdis",
+    "ModflowGwfgwf": ".mfgwfgwf",
+    "ModflowIms": ".mfims",
+    "ModflowMvr": ".mfmvr",
+    "ModflowGnc": ".mfgnc",
+    "ModflowGwfgwt": ".mfgwfgwt",
+    "ModflowUtlobs": ".mfutlobs",
+    "ModflowUtlts": ".mfutlts",
+    "ModflowUtltas": ".mfutltas",
+    "ModflowUtllaktab": ".mfutllaktab",
+    "ModflowGwfnam": ".mfgwfnam",
+    "ModflowGwf": ".mfgwf",
+    "ModflowGwfdis": ".mfgwfdis",
+    "ModflowGwfdisv": ".mfgwfdisv",
+    "ModflowGwfdisu": ".mfgwfdisu",
+    "ModflowGwfic": ".mfgwfic",
+    "ModflowGwfnpf": ".mfgwfnpf",
+    "ModflowGwfsto": ".mfgwfsto",
+    "ModflowGwfhfb": ".mfgwfhfb",
+    "ModflowGwfchd": ".mfgwfchd",
+    "ModflowGwfwel": ".mfgwfwel",
+    "ModflowGwfdrn": ".mfgwfdrn",
+    "ModflowGwfriv": ".mfgwfriv",
+    "ModflowGwfghb": ".mfgwfghb",
+    "ModflowGwfrch": ".mfgwfrch",
+    "ModflowGwfrcha": ".mfgwfrcha",
+    "ModflowGwfevt": ".mfgwfevt",
+    "ModflowGwfevta": ".mfgwfevta",
+    "ModflowGwfmaw": ".mfgwfmaw",
+    "ModflowGwfsfr": ".mfgwfsfr",
+    "ModflowGwflak": ".mfgwflak",
+    "ModflowGwfuzf": ".mfgwfuzf",
+    "ModflowGwfmvr": ".mfgwfmvr",
+    "ModflowGwfgnc": ".mfgwfgnc",
+    "ModflowGwfoc": ".mfgwfoc",
+    "ModflowGwfcsub": ".mfgwfcsub",
+    "ModflowGwfbuy": ".mfgwfbuy",
+    "ModflowGwtnam": ".mfgwtnam",
+    "ModflowGwt": ".mfgwt",
+    "ModflowGwtuzt": ".mfgwtuzt",
+    "ModflowGwtmvt": ".mfgwtmvt",
+    "ModflowGwtdsp": ".mfgwtdsp",
+    "ModflowGwtssm": ".mfgwtssm",
+    "ModflowGwtmwt": ".mfgwtmwt",
+    "ModflowGwtcnc": ".mfgwtcnc",
+    "ModflowGwtsft": ".mfgwtsft",
+    "ModflowGwtdisv": ".mfgwtdisv",
+    "ModflowGwtlkt": ".mfgwtlkt",
+    "ModflowGwtic": ".mfgwtic",
+    "ModflowGwtdisu": ".mfgwtdisu",
+    "ModflowGwtsrc": ".mfgwtsrc",
+    "ModflowGwtdis": ".mfgwtdis",
+    "ModflowGwtoc": ".mfgwtoc",
+    "ModflowGwtadv": ".mfgwtadv",
+    "ModflowGwtfmi": ".mfgwtfmi",
+    "ModflowGwtist": ".mfgwtist",
+    "ModflowGwtmst": ".mfgwtmst",
+}
+__all__ = list(_class_modules)
+
+
+def __getattr__(name):
+    if name in _class_modules:
+        module = importlib.import_module(_class_modules[name], __name__)
+        value = getattr(module, name)
+    else:
+        try:
+            value = importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != "{}.{}".format(__name__, name):
+                raise
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            )
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_class_modules))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ is not supported, so import everything now
+    for _name in __all__:
+        __getattr__(_name)
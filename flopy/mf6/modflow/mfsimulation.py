@@ -7,6 +7,7 @@ import errno
 import sys
 import inspect
 import collections
+import functools
 import os.path
 from ...mbase import run_model
 from ..mfbase import (
@@ -62,6 +63,7 @@ class SimulationDict(collections.OrderedDict):
     """
 
     def __init__(self, path=None):
+        self._path_cache = {}
         collections.OrderedDict.__init__(self)
         self._path = path
 
@@ -103,6 +105,30 @@ class SimulationDict(collections.OrderedDict):
 
         """
         collections.OrderedDict.__setitem__(self, key, val)
+        self._path_cache.clear()
+
+    def __delitem__(self, key):
+        """Define the __delitem__ magic method.
+
+        Parameters
+        ----------
+        key (string): Dictionary key
+
+        """
+        collections.OrderedDict.__delitem__(self, key)
+        self._path_cache.clear()
+
+    def pop(self, key, *args):
+        self._path_cache.clear()
+        return collections.OrderedDict.pop(self, key, *args)
+
+    def popitem(self, last=True):
+        self._path_cache.clear()
+        return collections.OrderedDict.popitem(self, last)
+
+    def clear(self):
+        self._path_cache.clear()
+        collections.OrderedDict.clear(self)
 
     def find_in_path(self, key_path, key_leaf):
         """Attempt to find key_leaf in a partial key path key_path.
@@ -116,7 +142,17 @@ class SimulationDict(collections.OrderedDict):
             MFData: Data found at the path.
             int: Data index
 
+        Notes:
+            Results are cached until a key is added to or removed from the
+            dictionary.
+
         """
+        cache_key = (key_path, key_leaf)
+        if cache_key not in self._path_cache:
+            self._path_cache[cache_key] = self._search_path(key_path, key_leaf)
+        return self._path_cache[cache_key]
+
+    def _search_path(self, key_path, key_leaf):
         key_path_size = len(key_path)
         for key, item in self.items():
             if key[:key_path_size] == key_path:
@@ -228,6 +264,25 @@ class MFSimulationData(object):
         numbers greater than this threshold are written in scientific notation
     sci_note_lower_thres : float
         numbers less than this threshold are written in scientific notation
+    lazy_load : bool
+        when true, package blocks other than options and dimensions are
+        loaded when their data is first accessed
+    external_list_binary : bool
+        when true, set_all_data_external stores list data, such as stress
+        period data, in binary instead of text files.  lists with
+        boundnames or non-numeric data are always stored in text files
+    external_binary_threshold : int
+        minimum number of rows a list must have to be stored in a binary
+        file by set_all_data_external.  binary list files are written in
+        double precision, the only precision MODFLOW 6 reads
+    compact_transient_lists : bool
+        when true, the stress period data of each transient list is stored
+        in a single table.  a stress period with the same data as the
+        previous stress period shares its rows, and equal cellids are
+        shared with the previous stress period.  get_data returns views of
+        the table, or copies of rows that are shared with other stress
+        periods, so changing the returned data in place only changes its
+        own stress period.  must be set before the data is loaded or set
     mfpath : MFFileMgmt
         file path location information for the simulation
     model_dimensions : OrderedDict
@@ -252,6 +307,10 @@ class MFSimulationData(object):
         self.comments_on = False
         self.auto_set_sizes = True
         self.verify_data = True
+        self.lazy_load = False
+        self.external_list_binary = False
+        self.external_binary_threshold = 0
+        self.compact_transient_lists = False
         self.debug = False
         self.verbose = True
         self.verbosity_level = VerbosityLevel.normal
@@ -618,6 +677,8 @@ class MFSimulation(PackageContainer):
         load_only=None,
         verify_data=False,
         write_headers=True,
+        lazy_load=False,
+        compact_transient_lists=False,
     ):
         """Load an existing model.
 
@@ -653,6 +714,17 @@ class MFSimulation(PackageContainer):
         write_headers: bool
             when true flopy writes a header to each package file indicating
             that it was created by flopy
+        lazy_load : bool
+            only record the location of package blocks other than options
+            and dimensions when loading, and load each block when its data
+            is first accessed.  blocks whose data is never accessed are
+            copied unchanged when the simulation is written.  errors in the
+            data of a block are reported when the block is loaded
+        compact_transient_lists : bool
+            store the stress period data of each transient list, such as
+            the stress period data of well packages, in a single table in
+            which stress periods with the same data share their rows.  see
+            MFSimulationData.compact_transient_lists
 
         Returns
         -------
@@ -661,6 +733,7 @@ class MFSimulation(PackageContainer):
         Examples
         --------
         >>> s = flopy.mf6.mfsimulation.load('my simulation')
+        >>> s = flopy.mf6.mfsimulation.load('my simulation', lazy_load=True)
 
         """
         # initialize
@@ -674,6 +747,10 @@ class MFSimulation(PackageContainer):
         )
         verbosity_level = instance.simulation_data.verbosity_level
         instance.simulation_data.verify_data = verify_data
+        instance.simulation_data.lazy_load = lazy_load
+        instance.simulation_data.compact_transient_lists = (
+            compact_transient_lists
+        )
 
         if verbosity_level.value >= VerbosityLevel.normal.value:
             print("loading simulation...")
@@ -880,6 +957,9 @@ class MFSimulation(PackageContainer):
                     )
                 ims_file.load(strict)
 
+        # registering the loaded packages updates the simulation name file,
+        # which still matches the file that was loaded
+        instance.name_file._reset_modified()
         instance.simulation_data.mfpath.set_last_accessed_path()
         if verify_data:
             instance.check()
@@ -1209,6 +1289,29 @@ class MFSimulation(PackageContainer):
             model.rename_all_packages(name)
 
     def set_all_data_external(self, check_data=True):
+        """Sets the simulation's list and array data to be stored externally.
+
+        List data is stored in binary files when
+        simulation_data.external_list_binary is True and the list has at
+        least simulation_data.external_binary_threshold rows, otherwise in
+        text files.
+
+        Parameters
+        ----------
+            check_data : bool
+                determines if data error checking is enabled during this
+                process
+
+        Examples
+        --------
+        >>> import flopy
+        >>> sim = flopy.mf6.MFSimulation.load(sim_ws='model')
+        >>> sim.simulation_data.external_list_binary = True
+        >>> sim.simulation_data.external_binary_threshold = 10000
+        >>> sim.set_all_data_external()
+        >>> sim.write_simulation()
+
+        """
         # copy any files whose paths have changed
         self.simulation_data.mfpath.copy_files()
         # set data external for all packages in all models
@@ -1227,7 +1330,11 @@ class MFSimulation(PackageContainer):
             package.set_all_data_external(check_data)
 
     def write_simulation(
-        self, ext_file_action=ExtFileAction.copy_relative_paths, silent=False
+        self,
+        ext_file_action=ExtFileAction.copy_relative_paths,
+        silent=False,
+        max_workers=1,
+        incremental=False,
     ):
         """Write the simulation to files.
 
@@ -1239,6 +1346,30 @@ class MFSimulation(PackageContainer):
                 by absolute paths fixed.
             silent : bool
                 writes out the simulation in silent mode (verbosity_level = 0)
+            max_workers : int
+                maximum number of threads used to write package files and
+                their external files.  if None, the default of
+                concurrent.futures.ThreadPoolExecutor is used.  defaults to
+                1, which writes the packages one after another.  each package
+                is written to its own files, so the files written do not
+                depend on max_workers.
+            incremental : bool
+                only write the package files that have changed since the
+                simulation was last loaded or written, leaving the other
+                package files untouched on disk.  a package is rewritten if
+                any of its data has been set or if its file path has changed.
+                changes made in place to arrays returned by get_data are not
+                detected.  external files are written when their data is set,
+                so unchanged external files are never rewritten.
+
+        Examples
+        --------
+
+        >>> import flopy
+        >>> sim = flopy.mf6.MFSimulation.load(sim_ws='model')
+        >>> gwf = sim.get_model()
+        >>> gwf.npf.k = 10.0
+        >>> sim.write_simulation(incremental=True)  # only writes npf
 
         """
         saved_verb_lvl = self.simulation_data.verbosity_level
@@ -1252,7 +1383,13 @@ class MFSimulation(PackageContainer):
         ):
             print("writing simulation...")
             print("  writing simulation name file...")
-        self.name_file.write(ext_file_action=ext_file_action)
+        write_functions = [
+            functools.partial(
+                self.name_file.write,
+                ext_file_action=ext_file_action,
+                incremental=incremental,
+            )
+        ]
 
         # write TDIS file
         if (
@@ -1260,7 +1397,13 @@ class MFSimulation(PackageContainer):
             >= VerbosityLevel.normal.value
         ):
             print("  writing simulation tdis package...")
-        self._tdis_file.write(ext_file_action=ext_file_action)
+        write_functions.append(
+            functools.partial(
+                self._tdis_file.write,
+                ext_file_action=ext_file_action,
+                incremental=incremental,
+            )
+        )
 
         # write ims files
         for ims_file in self._ims_files.values():
@@ -1272,11 +1415,19 @@ class MFSimulation(PackageContainer):
                     "  writing ims package {}.."
                     ".".format(ims_file._get_pname())
                 )
-            ims_file.write(ext_file_action=ext_file_action)
+            write_functions.append(
+                functools.partial(
+                    ims_file.write,
+                    ext_file_action=ext_file_action,
+                    incremental=incremental,
+                )
+            )
 
         # write exchange files
         for exchange_file in self._exchange_files.values():
-            exchange_file.write()
+            write_functions.append(
+                functools.partial(exchange_file.write, incremental=incremental)
+            )
             if (
                 hasattr(exchange_file, "gnc_filerecord")
                 and exchange_file.gnc_filerecord.has_data()
@@ -1304,8 +1455,12 @@ class MFSimulation(PackageContainer):
                                 self._ghost_node_files[gnc_file]._get_pname()
                             )
                         )
-                    self._ghost_node_files[gnc_file].write(
-                        ext_file_action=ext_file_action
+                    write_functions.append(
+                        functools.partial(
+                            self._ghost_node_files[gnc_file].write,
+                            ext_file_action=ext_file_action,
+                            incremental=incremental,
+                        )
                     )
                 else:
                     if (
@@ -1345,8 +1500,12 @@ class MFSimulation(PackageContainer):
                                 self._mover_files[mvr_file]._get_pname()
                             )
                         )
-                    self._mover_files[mvr_file].write(
-                        ext_file_action=ext_file_action
+                    write_functions.append(
+                        functools.partial(
+                            self._mover_files[mvr_file].write,
+                            ext_file_action=ext_file_action,
+                            incremental=incremental,
+                        )
                     )
                 else:
                     if (
@@ -1358,6 +1517,7 @@ class MFSimulation(PackageContainer):
                             "writing. File will not be "
                             "written.".format(mvr_file)
                         )
+        self._write_files(write_functions, max_workers)
 
         if ext_file_action == ExtFileAction.copy_relative_paths:
             # move external files with relative paths
@@ -1381,13 +1541,21 @@ class MFSimulation(PackageContainer):
             )
 
         # write other packages
+        write_functions = []
         for pp in self._other_files.values():
             if (
                 self.simulation_data.verbosity_level.value
                 >= VerbosityLevel.normal.value
             ):
                 print("  writing package {}...".format(pp._get_pname()))
-            pp.write(ext_file_action=ext_file_action)
+            write_functions.append(
+                functools.partial(
+                    pp.write,
+                    ext_file_action=ext_file_action,
+                    incremental=incremental,
+                )
+            )
+        self._write_files(write_functions, max_workers)
 
         # FIX: model working folder should be model name file folder
 
@@ -1398,7 +1566,11 @@ class MFSimulation(PackageContainer):
                 >= VerbosityLevel.normal.value
             ):
                 print("  writing model {}...".format(model.name))
-            model.write(ext_file_action=ext_file_action)
+            model.write(
+                ext_file_action=ext_file_action,
+                max_workers=max_workers,
+                incremental=incremental,
+            )
 
         self.simulation_data.mfpath.set_last_accessed_path()
 
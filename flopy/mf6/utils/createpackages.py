@@ -344,6 +344,54 @@ def build_model_init_vars(param_list):
     return "\n".join(init_var_list)
 
 
+def build_modflow_init_string(class_list):
+    # the package classes are imported on first access (PEP 562)
+    class_modules = "\n".join(
+        '    "{}": ".{}",'.format(class_name, module_name)
+        for module_name, class_name in class_list
+    )
+    return (
+        "# imports\n"
+        "import importlib\n"
+        "import sys\n"
+        "\n"
+        "# The package classes are imported on first access (PEP 562), so "
+        "that\n"
+        "# importing flopy.mf6 does not import all of the package modules.\n"
+        "_class_modules = {{\n{}\n}}\n"
+        "__all__ = list(_class_modules)\n"
+        "\n"
+        "\n"
+        "def __getattr__(name):\n"
+        "    if name in _class_modules:\n"
+        "        module = importlib.import_module(_class_modules[name], "
+        "__name__)\n"
+        "        value = getattr(module, name)\n"
+        "    else:\n"
+        "        try:\n"
+        '            value = importlib.import_module("." + name, __name__)\n'
+        "        except ModuleNotFoundError as e:\n"
+        '            if e.name != "{{}}.{{}}".format(__name__, name):\n'
+        "                raise\n"
+        "            raise AttributeError(\n"
+        '                "module {{!r}} has no attribute {{!r}}".format('
+        "__name__, name)\n"
+        "            )\n"
+        "    globals()[name] = value\n"
+        "    return value\n"
+        "\n"
+        "\n"
+        "def __dir__():\n"
+        "    return sorted(set(globals()) | set(_class_modules))\n"
+        "\n"
+        "\n"
+        "if sys.version_info < (3, 7):\n"
+        "    # module __getattr__ is not supported, so import everything now\n"
+        "    for _name in __all__:\n"
+        "        __getattr__(_name)\n".format(class_modules)
+    )
+
+
 def create_packages():
     indent = "    "
     init_string_def = "    def __init__(self"
@@ -412,8 +460,7 @@ def create_packages():
         "w",
         newline="\n",
     )
-    init_file.write("# imports\n")
-    init_file.write("from .mfsimulation import MFSimulation\n")
+    init_class_list = [("mfsimulation", "MFSimulation")]
 
     nam_import_string = (
         "from .. import mfmodel\nfrom ..data.mfdatautil "
@@ -784,9 +831,11 @@ def create_packages():
             pb_file.write(packages_str)
         pb_file.close()
 
-        init_file.write(
-            "from .mf{} import "
-            "Modflow{}\n".format(package_name, package_name.title())
+        init_class_list.append(
+            (
+                "mf{}".format(package_name),
+                "Modflow{}".format(package_name.title()),
+            )
         )
 
         if package[0].dfn_type == mfstructure.DfnType.model_name_file:
@@ -865,10 +914,13 @@ def create_packages():
             )
             md_file.write(package_string)
             md_file.close()
-            init_file.write(
-                "from .mf{} import "
-                "Modflow{}\n".format(model_name, model_name.capitalize())
+            init_class_list.append(
+                (
+                    "mf{}".format(model_name),
+                    "Modflow{}".format(model_name.capitalize()),
+                )
             )
+    init_file.write(build_modflow_init_string(init_class_list))
     init_file.close()
 
 
@@ -6,8 +6,7 @@ mf module.  Contains the ModflowGlobal, ModflowList, and Modflow classes.
 
 import os
 import flopy
-from inspect import getfullargspec
-from ..mbase import BaseModel
+from ..mbase import BaseModel, PackageLoader
 from ..pakbase import Package
 from ..utils import mfreadnam
 from ..discretization.structuredgrid import StructuredGrid
@@ -680,6 +679,8 @@ class Modflow(BaseModel):
         load_only=None,
         forgive=False,
         check=True,
+        max_workers=1,
+        lazy_load=False,
     ):
         """
         Load an existing MODFLOW model.
@@ -708,6 +709,20 @@ class Modflow(BaseModel):
             useful for debugging. Default False.
         check : boolean, optional
             Check model input for common errors. Default True.
+        max_workers : int, optional
+            Maximum number of worker processes used to load the package
+            files after the DIS and BAS6 files, which are attached to the
+            model in name file order. If None, the default of
+            concurrent.futures.ProcessPoolExecutor is used. Default 1,
+            which loads the packages one after another.
+        lazy_load : bool, optional
+            Keep a reference to the file of each OPEN/CLOSE array instead
+            of reading it, so the file is read when the array is used and
+            copied when the unchanged array is written. Arrays read this
+            way are released from memory by a least recently used cache
+            that holds up to Util2d.lazy_cache_size arrays. The model check
+            reads the checked arrays, so use with check=False to defer
+            reading them. Default False.
 
         Returns
         -------
@@ -754,6 +769,7 @@ class Modflow(BaseModel):
             model_ws=model_ws,
             **attribs
         )
+        ml.lazy_load = lazy_load
 
         files_successfully_loaded = []
         files_not_loaded = []
@@ -864,26 +880,26 @@ class Modflow(BaseModel):
             ml.mfpar.set_mult(ml, ext_unit_dict)
             assert ml.pop_key_list.pop() == ext_pkg_d.get("MULT")
 
+        # packages after bas6 can be loaded in worker processes, as they
+        # can depend on its free format option
+        units = [
+            key
+            for key, item in ext_unit_dict.items()
+            if item.package is not None and item.filetype in load_only
+        ]
+        if bas_key in units:
+            units = units[units.index(bas_key) + 1 :]
+        loader = PackageLoader(
+            ml, namefile_path, ext_unit_dict, units, max_workers=max_workers
+        )
+
         # try loading packages in ext_unit_dict
         for key, item in ext_unit_dict.items():
             if item.package is not None:
                 if item.filetype in load_only:
-                    package_load_args = getfullargspec(item.package.load)[0]
                     if forgive:
                         try:
-                            if "check" in package_load_args:
-                                item.package.load(
-                                    item.filehandle,
-                                    ml,
-                                    ext_unit_dict=ext_unit_dict,
-                                    check=False,
-                                )
-                            else:
-                                item.package.load(
-                                    item.filehandle,
-                                    ml,
-                                    ext_unit_dict=ext_unit_dict,
-                                )
+                            loader.load(key, item, ext_unit_dict)
                             files_successfully_loaded.append(item.filename)
                             if ml.verbose:
                                 print(
@@ -904,19 +920,7 @@ class Modflow(BaseModel):
                                 print(msg)
                             files_not_loaded.append(item.filename)
                     else:
-                        if "check" in package_load_args:
-                            item.package.load(
-                                item.filehandle,
-                                ml,
-                                ext_unit_dict=ext_unit_dict,
-                                check=False,
-                            )
-                        else:
-                            item.package.load(
-                                item.filehandle,
-                                ml,
-                                ext_unit_dict=ext_unit_dict,
-                            )
+                        loader.load(key, item, ext_unit_dict)
                         files_successfully_loaded.append(item.filename)
                         if ml.verbose:
                             msg = (
@@ -200,10 +200,10 @@ class ModflowEvt(Package):
         f_evt.write("{0:s}\n".format(self.heading))
         f_evt.write("{0:10d}{1:10d}\n".format(self.nevtop, self.ipakcb))
         for n in range(nper):
-            insurf, surf = self.surf.get_kper_entry(n)
-            inevtr, evtr = self.evtr.get_kper_entry(n)
-            inexdp, exdp = self.exdp.get_kper_entry(n)
-            inievt, ievt = self.ievt.get_kper_entry(n)
+            insurf, surf = self.surf.get_kper_entry(n, reuse=True)
+            inevtr, evtr = self.evtr.get_kper_entry(n, reuse=True)
+            inexdp, exdp = self.exdp.get_kper_entry(n, reuse=True)
+            inievt, ievt = self.ievt.get_kper_entry(n, reuse=True)
             comment = "Evapotranspiration  dataset 5 for stress period " + str(
                 n + 1
             )
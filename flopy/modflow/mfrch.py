@@ -356,9 +356,11 @@ class ModflowRch(Package):
             )
 
         for kper in range(nper):
-            inrech, file_entry_rech = self.rech.get_kper_entry(kper)
+            inrech, file_entry_rech = self.rech.get_kper_entry(
+                kper, reuse=True
+            )
             if self.nrchop == 2:
-                inirch, file_entry_irch = irch.get_kper_entry(kper)
+                inirch, file_entry_irch = irch.get_kper_entry(kper, reuse=True)
             else:
                 inirch = -1
             f_rch.write(
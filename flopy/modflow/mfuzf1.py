@@ -875,7 +875,7 @@ class ModflowUzf1(Package):
                     f_uzf.write("{}\n".format(comment))
 
         def write_transient(name):
-            invar, var = self.__dict__[name].get_kper_entry(n)
+            invar, var = self.__dict__[name].get_kper_entry(n, reuse=True)
 
             comment = " #{} for stress period ".format(name) + str(n + 1)
             f_uzf.write("{0:10d}{1:20s}\n".format(invar, comment))
@@ -1,7 +1,7 @@
 import os
 import sys
 import numpy as np
-from ..mbase import BaseModel
+from ..mbase import BaseModel, PackageLoader
 from ..pakbase import Package
 from ..utils import mfreadnam
 from .mtbtn import Mt3dBtn
@@ -582,6 +582,7 @@ class Mt3dms(BaseModel):
         load_only=None,
         forgive=False,
         modflowmodel=None,
+        max_workers=1,
     ):
         """
         Load an existing model.
@@ -619,6 +620,13 @@ class Mt3dms(BaseModel):
             This is a flopy Modflow model object upon which this Mt3dms
             model is based. (the default is None)
 
+        max_workers : int
+            Maximum number of worker processes used to load the package
+            files after the BTN file, which are attached to the model in
+            name file order. If None, the default of
+            concurrent.futures.ProcessPoolExecutor is used.
+            (default is 1, which loads the packages one after another)
+
         Returns
         -------
         mt : flopy.mt3d.mt.Mt3dms
@@ -766,17 +774,25 @@ class Mt3dms(BaseModel):
                     "in the ext_unit_dict: " + ",".join(not_found)
                 )
 
+        loader = PackageLoader(
+            mt,
+            namefile_path,
+            ext_unit_dict,
+            [
+                key
+                for key, item in ext_unit_dict.items()
+                if item.package is not None and item.filetype in load_only
+            ],
+            max_workers=max_workers,
+        )
+
         # try loading packages in ext_unit_dict
         for key, item in ext_unit_dict.items():
             if item.package is not None:
                 if item.filetype in load_only:
                     if forgive:
                         try:
-                            pck = item.package.load(
-                                item.filehandle,
-                                mt,
-                                ext_unit_dict=ext_unit_dict,
-                            )
+                            pck = loader.load(key, item, ext_unit_dict)
                             files_successfully_loaded.append(item.filename)
                             if mt.verbose:
                                 sys.stdout.write(
@@ -793,9 +809,7 @@ class Mt3dms(BaseModel):
                                 )
                             files_not_loaded.append(item.filename)
                     else:
-                        pck = item.package.load(
-                            item.filehandle, mt, ext_unit_dict=ext_unit_dict
-                        )
+                        pck = loader.load(key, item, ext_unit_dict)
                         files_successfully_loaded.append(item.filename)
                         if mt.verbose:
                             sys.stdout.write(
@@ -484,7 +484,9 @@ class Mt3dSsm(Package):
                 # written
                 incrch = -1
                 for t2d in self.crch:
-                    incrchicomp, file_entry = t2d.get_kper_entry(kper)
+                    incrchicomp, file_entry = t2d.get_kper_entry(
+                        kper, reuse=True
+                    )
                     incrch = max(incrch, incrchicomp)
                     if incrch == 1:
                         break
@@ -500,7 +502,9 @@ class Mt3dSsm(Package):
                 # written
                 incevt = -1
                 for t2d in self.cevt:
-                    incevticomp, file_entry = t2d.get_kper_entry(kper)
+                    incevticomp, file_entry = t2d.get_kper_entry(
+                        kper, reuse=True
+                    )
                     incevt = max(incevt, incevticomp)
                     if incevt == 1:
                         break
@@ -376,7 +376,9 @@ class Mt3dUzt(Package):
                 # written
                 incuzinf = -1
                 for t2d in self.cuzinf:
-                    incuzinficomp, file_entry = t2d.get_kper_entry(kper)
+                    incuzinficomp, file_entry = t2d.get_kper_entry(
+                        kper, reuse=True
+                    )
                     incuzinf = max(incuzinf, incuzinficomp)
                     if incuzinf == 1:
                         break
@@ -397,7 +399,9 @@ class Mt3dUzt(Package):
                     # written
                     incuzet = -1
                     for t2d in self.cuzet:
-                        incuzeticomp, file_entry = t2d.get_kper_entry(kper)
+                        incuzeticomp, file_entry = t2d.get_kper_entry(
+                            kper, reuse=True
+                        )
                         incuzet = max(incuzet, incuzeticomp)
                         if incuzet == 1:
                             break
@@ -417,7 +421,9 @@ class Mt3dUzt(Package):
                     # written
                     incgwet = -1
                     for t2d in self.cgwet:
-                        incgweticomp, file_entry = t2d.get_kper_entry(kper)
+                        incgweticomp, file_entry = t2d.get_kper_entry(
+                            kper, reuse=True
+                        )
                         incgwet = max(incgwet, incgweticomp)
                         if incgwet == 1:
                             break
@@ -51,7 +51,7 @@ class Transient2dTpl:
                 self.params[kper].append(p)
         return
 
-    def get_kper_entry(self, kper):
+    def get_kper_entry(self, kper, reuse=False):
 
         # Set defaults
         parameterized = False
@@ -80,7 +80,10 @@ class Transient2dTpl:
             u2dtpl = Util2dTpl(chararray, u2d.name, multiplier, indexed_param)
             return (1, u2dtpl.get_file_entry())
         else:
-            return self.transient2d.get_kper_entry(kper)
+            # the array of a parameterized kper can not be reused
+            if kper - 1 in self.multipliers or kper - 1 in self.params:
+                reuse = False
+            return self.transient2d.get_kper_entry(kper, reuse=reuse)
 
 
 class Util3dTpl(object):
@@ -441,6 +441,8 @@ class Seawat(BaseModel):
         verbose=False,
         model_ws=".",
         load_only=None,
+        max_workers=1,
+        lazy_load=False,
     ):
         """
         Load an existing model.
@@ -470,6 +472,16 @@ class Seawat(BaseModel):
             Filetype(s) to load (e.g. ['lpf', 'adv'])
             (default is None, which means that all will be loaded)
 
+        max_workers : int
+            Maximum number of worker processes used to load the MODFLOW
+            and MT3DMS package files. If None, the default of
+            concurrent.futures.ProcessPoolExecutor is used.
+            (default is 1, which loads the packages one after another)
+
+        lazy_load : bool
+            Read the MODFLOW OPEN/CLOSE arrays when they are used instead
+            of when the model is loaded. (default is False)
+
         Returns
         -------
         m : flopy.seawat.swt.Seawat
@@ -509,6 +521,8 @@ class Seawat(BaseModel):
             load_only=load_only,
             forgive=False,
             check=False,
+            max_workers=max_workers,
+            lazy_load=lazy_load,
         )
 
         mt = Mt3dms.load(
@@ -518,6 +532,7 @@ class Seawat(BaseModel):
             verbose=verbose,
             model_ws=model_ws,
             forgive=False,
+            max_workers=max_workers,
         )
 
         # set listing and global files using mf objects
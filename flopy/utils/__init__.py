@@ -20,54 +20,98 @@
     --------
 
     """
-from .mfreadnam import parsenamefile
-from .util_array import Util3d, Util2d, Transient2d, Transient3d, read1d
-from .util_list import MfList
-from .binaryfile import (
-    BinaryHeader,
-    HeadFile,
-    UcnFile,
-    CellBudgetFile,
-    HeadUFile,
-)
-from .formattedfile import FormattedHeadFile
-from .modpathfile import PathlineFile, EndpointFile, TimeseriesFile
-from .swroutputfile import (
-    SwrStage,
-    SwrBudget,
-    SwrFlow,
-    SwrExchange,
-    SwrStructure,
-)
-from .observationfile import HydmodObs, SwrObs, Mf6Obs
-from .reference import (
-    SpatialReference,
-    SpatialReferenceUnstructured,
-    crs,
-    TemporalReference,
-)
-from .mflistfile import (
-    MfListBudget,
-    MfusgListBudget,
-    SwtListBudget,
-    SwrListBudget,
-    Mf6ListBudget,
-)
-from .check import check, get_neighbors
-from .utils_def import FlopyBinaryData, totim_to_datetime
-from .flopy_io import read_fixed_var, write_fixed_var
-from .zonbud import (
-    ZoneBudget,
-    read_zbarray,
-    write_zbarray,
-    ZoneBudgetOutput,
-    ZBNetOutput,
-)
-from .mfgrdfile import MfGrdFile
-from .postprocessing import get_transmissivities
-from .sfroutputfile import SfrFile
-from .recarray_utils import create_empty_recarray, ra_slice
-from .mtlistfile import MtListBudget
-from .optionblock import OptionBlock
-from .rasters import Raster
-from .gridintersect import GridIntersect, ModflowGridIndices
+import importlib
+import sys
+
+# The contents of utils are imported on first access (PEP 562), so that
+# importing a single module, such as flopy.utils.binaryfile, does not
+# import the other utilities and their optional dependencies.
+_attributes = {
+    "parsenamefile": ".mfreadnam",
+    "Util3d": ".util_array",
+    "Util2d": ".util_array",
+    "Transient2d": ".util_array",
+    "Transient3d": ".util_array",
+    "read1d": ".util_array",
+    "MfList": ".util_list",
+    "BinaryHeader": ".binaryfile",
+    "HeadFile": ".binaryfile",
+    "UcnFile": ".binaryfile",
+    "CellBudgetFile": ".binaryfile",
+    "HeadUFile": ".binaryfile",
+    "FormattedHeadFile": ".formattedfile",
+    "RunningMax": ".datafile",
+    "RunningMin": ".datafile",
+    "RunningMean": ".datafile",
+    "ExceedanceCount": ".datafile",
+    "EnsembleFile": ".ensemblefile",
+    "PathlineFile": ".modpathfile",
+    "EndpointFile": ".modpathfile",
+    "TimeseriesFile": ".modpathfile",
+    "SwrStage": ".swroutputfile",
+    "SwrBudget": ".swroutputfile",
+    "SwrFlow": ".swroutputfile",
+    "SwrExchange": ".swroutputfile",
+    "SwrStructure": ".swroutputfile",
+    "HydmodObs": ".observationfile",
+    "SwrObs": ".observationfile",
+    "Mf6Obs": ".observationfile",
+    "SpatialReference": ".reference",
+    "SpatialReferenceUnstructured": ".reference",
+    "crs": ".reference",
+    "TemporalReference": ".reference",
+    "MfListBudget": ".mflistfile",
+    "MfusgListBudget": ".mflistfile",
+    "SwtListBudget": ".mflistfile",
+    "SwrListBudget": ".mflistfile",
+    "Mf6ListBudget": ".mflistfile",
+    "check": ".check",
+    "get_neighbors": ".check",
+    "FlopyBinaryData": ".utils_def",
+    "totim_to_datetime": ".utils_def",
+    "read_fixed_var": ".flopy_io",
+    "write_fixed_var": ".flopy_io",
+    "ZoneBudget": ".zonbud",
+    "read_zbarray": ".zonbud",
+    "write_zbarray": ".zonbud",
+    "ZoneBudgetOutput": ".zonbud",
+    "ZBNetOutput": ".zonbud",
+    "MfGrdFile": ".mfgrdfile",
+    "get_transmissivities": ".postprocessing",
+    "SfrFile": ".sfroutputfile",
+    "create_empty_recarray": ".recarray_utils",
+    "ra_slice": ".recarray_utils",
+    "MtListBudget": ".mtlistfile",
+    "OptionBlock": ".optionblock",
+    "Raster": ".rasters",
+    "GridIntersect": ".gridintersect",
+    "ModflowGridIndices": ".gridintersect",
+}
+__all__ = list(_attributes)
+
+
+def __getattr__(name):
+    if name in _attributes:
+        module = importlib.import_module(_attributes[name], __name__)
+        value = getattr(module, name)
+    else:
+        try:
+            value = importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != "{}.{}".format(__name__, name):
+                raise
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            )
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_attributes))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ is not supported, so import everything now
+    for _name in _attributes:
+        __getattr__(_name)
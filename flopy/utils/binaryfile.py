@@ -9,10 +9,12 @@ important classes that can be accessed by the user.
 
 """
 from __future__ import print_function
+import os
+import time
 import numpy as np
 import warnings
 from collections import OrderedDict
-from ..utils.datafile import Header, LayerFile
+from ..utils.datafile import Header, LayerFile, _get_chunk_size, _reduce
 
 
 class BinaryHeader(Header):
@@ -175,6 +177,112 @@ def binaryread(file, vartype, shape=(1,), charlen=16):
     return result
 
 
+_INDEX_CACHE_VERSION = 1
+
+
+def _index_cache_path(filename):
+    """
+    Return the path of the sidecar index cache file for filename.
+
+    """
+    return "{}.idx.npz".format(filename)
+
+
+def _load_index_cache(filename, header_dtype):
+    """
+    Load a sidecar index cache for filename.  None is returned if the
+    cache does not exist, was written for another header dtype, or no
+    longer matches the file.  A cache for a file that has grown since the
+    cache was written is returned so that the index can be extended.
+
+    """
+    fpth = _index_cache_path(filename)
+    if not os.path.isfile(fpth):
+        return None
+    try:
+        with np.load(fpth, allow_pickle=False) as f:
+            cache = {key: f[key] for key in f.files}
+    except Exception:
+        return None
+    if int(cache["version"]) != _INDEX_CACHE_VERSION:
+        return None
+    if str(cache["dtype"]) != str(header_dtype.descr):
+        return None
+    stat = os.stat(filename)
+    filesize = int(cache["filesize"])
+    if stat.st_size < filesize:
+        return None
+    if stat.st_size == filesize and stat.st_mtime_ns != int(cache["mtime"]):
+        return None
+    return cache
+
+
+def _write_index_cache(filename, header_dtype, indexed, **arrays):
+    """
+    Write the sidecar index cache for filename.  indexed is the byte
+    position after the last complete record in the index.
+
+    """
+    stat = os.stat(filename)
+    try:
+        np.savez(
+            _index_cache_path(filename),
+            version=_INDEX_CACHE_VERSION,
+            dtype=str(header_dtype.descr),
+            filesize=stat.st_size,
+            mtime=stat.st_mtime_ns,
+            indexed=indexed,
+            **arrays
+        )
+    except (IOError, OSError) as e:
+        msg = "Could not write index cache for {}: {}".format(filename, e)
+        warnings.warn(msg)
+    return
+
+
+def read_at_offsets(file, ipos, offsets, vartype, gap=4096):
+    """
+    Read values at element offsets from the data array that starts at byte
+    position ipos of a binary file.  Offsets that are close to each other
+    are read with a single read call.
+
+    Parameters
+    ----------
+    file : file object
+        is an open file object
+    ipos : int
+        is the byte position of the first element of the data array
+    offsets : numpy array of ints
+        are the zero-based element offsets of the values to read
+    vartype : type
+        is the variable type: numpy.int32, numpy.float32, or numpy.float64
+    gap : int
+        is the largest number of bytes between two values that are read
+        with a single read call (default is 4096)
+
+    Returns
+    -------
+    values : numpy array
+        values at offsets, in the same order as offsets
+
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    itemsize = np.dtype(vartype).itemsize
+    values = np.empty(offsets.shape, dtype=vartype)
+    if offsets.size == 0:
+        return values
+    order = np.argsort(offsets, kind="stable")
+    soffsets = offsets[order]
+    breaks = np.where(np.diff(soffsets) * itemsize > gap)[0] + 1
+    for run in np.split(np.arange(soffsets.size), breaks):
+        ioff0 = soffsets[run[0]]
+        nval = soffsets[run[-1]] - ioff0 + 1
+        file.seek(ipos + ioff0 * itemsize, 0)
+        block = np.fromfile(file, vartype, nval)
+        values[order[run]] = block[soffsets[run] - ioff0]
+    return values
+
+
 def join_struct_arrays(arrays):
     """
     Simple function that can join two numpy structured arrays.
@@ -279,7 +387,13 @@ class BinaryLayerFile(LayerFile):
 
     """
 
+    _index_attributes = LayerFile._index_attributes + ("_indexed",)
+
     def __init__(self, filename, precision, verbose, kwargs):
+        self.memmap = kwargs.pop("memmap", False)
+        self.cache_index = kwargs.pop("cache_index", False)
+        self._mmap = None
+        self._indexed = 0
         super(BinaryLayerFile, self).__init__(
             filename, precision, verbose, kwargs
         )
@@ -291,12 +405,99 @@ class BinaryLayerFile(LayerFile):
     def __exit__(self, *exc):
         self.close()
 
+    def _get_mmap(self):
+        """
+        Return a read-only numpy.memmap of the whole binary file. The map
+        is created on first use and reused for all subsequent reads.
+
+        """
+        if self.file.closed:
+            raise ValueError("I/O operation on closed file")
+        if self._mmap is None:
+            self._mmap = np.memmap(self.file, dtype=np.uint8, mode="r")
+        return self._mmap
+
+    def _read_record(self, ipos, shp):
+        """
+        Read the data array of shape shp that starts at byte position ipos.
+        If the memmap backend is active a read-only view of the mapped file
+        is returned instead of a copy.
+
+        """
+        if self.memmap:
+            return np.ndarray(
+                shp, dtype=self.realtype, buffer=self._get_mmap(), offset=ipos
+            )
+        self.file.seek(ipos, 0)
+        return self._read_data(shp)
+
+    def _get_data_array(self, totim=0):
+        """
+        Get the three dimensional data array for the specified totim value.
+        When the memmap backend is active and all layers for totim are
+        stored with a constant stride, a strided read-only view of the
+        mapped file is returned without copying.
+
+        """
+        if not self.memmap:
+            return super(BinaryLayerFile, self)._get_data_array(totim)
+
+        if totim >= 0.0:
+            keyindices = np.where((self.recordarray["totim"] == totim))[0]
+            if len(keyindices) == 0:
+                msg = "totim value ({}) not found in file...".format(totim)
+                raise Exception(msg)
+        else:
+            raise Exception("Data not found...")
+
+        mm = self._get_mmap()
+        ipos = self.iposarray[keyindices].astype(np.int64)
+        ilay = self.recordarray["ilay"][keyindices]
+        nrow = self.recordarray["nrow"][keyindices[0]]
+        ncol = self.recordarray["ncol"][keyindices[0]]
+        itemsize = self.realtype(1).nbytes
+        same_shape = np.all(
+            (self.recordarray["nrow"][keyindices] == nrow)
+            & (self.recordarray["ncol"][keyindices] == ncol)
+        )
+        if same_shape and np.array_equal(ilay, np.arange(1, self.nlay + 1)):
+            if self.nlay > 1:
+                stride = ipos[1] - ipos[0]
+            else:
+                stride = nrow * ncol * itemsize
+            if np.all(np.diff(ipos) == stride):
+                if self.verbose:
+                    msg = "Mapping {} layers from byte position {}".format(
+                        self.nlay, ipos[0]
+                    )
+                    print(msg)
+                return np.ndarray(
+                    (self.nlay, nrow, ncol),
+                    dtype=self.realtype,
+                    buffer=mm,
+                    offset=ipos[0],
+                    strides=(stride, ncol * itemsize, itemsize),
+                )
+
+        # layers are missing or irregularly spaced, so build a copy
+        data = np.empty((self.nlay, nrow, ncol), dtype=self.realtype)
+        data[:, :, :] = np.nan
+        for idx in keyindices:
+            ilay = self.recordarray["ilay"][idx]
+            shp = (
+                self.recordarray["nrow"][idx],
+                self.recordarray["ncol"][idx],
+            )
+            data[ilay - 1] = self._read_record(self.iposarray[idx], shp)
+        return data
+
     def _build_index(self):
         """
         Build the recordarray and iposarray, which maps the header information
         to the position in the binary file.
 
         """
+        self.file.seek(0, 0)
         header = self._get_header()
         self.nrow = header["nrow"]
         self.ncol = header["ncol"]
@@ -309,34 +510,232 @@ class BinaryLayerFile(LayerFile):
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
-        ipos = 0
-        while ipos < self.totalbytes:
+        self.recordarray = np.array([], dtype=self.header_dtype)
+        self.iposarray = np.array([], dtype=np.int64)
+        self._indexed = 0
+        if self.cache_index:
+            self._read_index_cache()
+        indexed = self._indexed
+        self._extend_index()
+        if self.cache_index and (indexed == 0 or self._indexed != indexed):
+            _write_index_cache(
+                self.filename,
+                self.header_dtype,
+                self._indexed,
+                recordarray=self.recordarray,
+                iposarray=self.iposarray,
+            )
+        return
+
+    def _check_index(self, index):
+        """
+        Check that the last header in the record index of index is also
+        the last header in this file.
+
+        """
+        if index.precision != self.precision:
+            return False
+        if len(index.recordarray) == 0:
+            return True
+        self.file.seek(index.iposarray[-1] - self.header_dtype.itemsize, 0)
+        header = self._get_header()
+        self.file.seek(0, 0)
+        return header.tobytes() == index.recordarray[-1].tobytes()
+
+    def _read_index_cache(self):
+        """
+        Set the record index from the sidecar index cache, if it is valid.
+
+        """
+        cache = _load_index_cache(self.filename, self.header_dtype)
+        if cache is None:
+            return
+        recordarray = cache["recordarray"]
+        iposarray = cache["iposarray"]
+        if len(recordarray) > 0:
+            # make sure the last indexed header has not been overwritten
+            self.file.seek(iposarray[-1] - self.header_dtype.itemsize, 0)
+            header = self._get_header()
+            if header.tobytes() != recordarray[-1].tobytes():
+                return
+        self.recordarray = recordarray
+        self.iposarray = iposarray
+        self._indexed = int(cache["indexed"])
+        if self.verbose:
+            print("Read index cache for {}".format(self.filename))
+        return
+
+    def _extend_index(self):
+        """
+        Add the records between the end of the current index and the end of
+        the file to the index.  A partially written trailing record is not
+        indexed.
+
+        """
+        if not self._build_index_strided():
+            self._build_index_sequential()
+
+        # derive the unique times and kstpkper values from the headers
+        totim = self.recordarray["totim"]
+        new = np.ones(totim.shape, dtype=bool)
+        new[1:] = totim[1:] != totim[:-1]
+        self.times = list(totim[new])
+        self.kstpkper = list(
+            zip(self.recordarray["kstp"][new], self.recordarray["kper"][new])
+        )
+        if len(self.recordarray) > 0:
+            self.nlay = np.max(self.recordarray["ilay"])
+        else:
+            # no record has been completely written yet, see refresh()
+            self.nlay = 0
+        return
+
+    def _build_index_strided(self):
+        """
+        Read all remaining headers in a single strided read of the file.
+        This only succeeds if all remaining records have the same size as
+        the first remaining record.
+
+        """
+        hsize = self.header_dtype.itemsize
+        remaining = self.totalbytes - self._indexed
+        if remaining < hsize:
+            return False
+        self.file.seek(self._indexed, 0)
+        header = self._get_header()
+        recsize = hsize + int(self.get_databytes(header))
+        if remaining % recsize != 0:
+            return False
+        nrec = remaining // recsize
+        mm = np.memmap(self.file, dtype=np.uint8, mode="r")
+        headers = np.ndarray(
+            (nrec,),
+            dtype=self.header_dtype,
+            buffer=mm,
+            offset=self._indexed,
+            strides=(recsize,),
+        ).copy()
+        del mm
+        valid = (
+            (headers["nrow"] == header["nrow"])
+            & (headers["ncol"] == header["ncol"])
+            & (np.char.find(headers["text"], self.text.upper()) >= 0)
+        )
+        if not valid.all():
+            return False
+        iposarray = (
+            self._indexed + hsize + np.arange(nrec, dtype=np.int64) * recsize
+        )
+        self.recordarray = np.concatenate((self.recordarray, headers))
+        self.iposarray = np.concatenate((self.iposarray, iposarray))
+        self._indexed = self.totalbytes
+        return True
+
+    def _build_index_sequential(self):
+        """
+        Read the remaining headers one at a time.
+
+        """
+        hsize = self.header_dtype.itemsize
+        headers = []
+        iposarray = []
+        ipos = self._indexed
+        self.file.seek(ipos, 0)
+        while ipos + hsize <= self.totalbytes:
             header = self._get_header()
-            self.recordarray.append(header)
-            if self.text.upper() not in header["text"]:
-                continue
-            if ipos == 0:
-                self.times.append(header["totim"])
-                kstpkper = (header["kstp"], header["kper"])
-                self.kstpkper.append(kstpkper)
-            else:
-                totim = header["totim"]
-                if totim != self.times[-1]:
-                    self.times.append(totim)
-                    kstpkper = (header["kstp"], header["kper"])
-                    self.kstpkper.append(kstpkper)
-            ipos = self.file.tell()
-            self.iposarray.append(ipos)
             databytes = self.get_databytes(header)
+            ipos += hsize
+            if ipos + databytes > self.totalbytes:
+                break
+            if self.text.upper() in header["text"]:
+                headers.append(header)
+                iposarray.append(ipos)
             self.file.seek(databytes, 1)
             ipos = self.file.tell()
+            self._indexed = ipos
 
         # self.recordarray contains a recordarray of all the headers.
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposarray = np.array(self.iposarray)
-        self.nlay = np.max(self.recordarray["ilay"])
+        self.recordarray = np.concatenate(
+            (self.recordarray, np.array(headers, dtype=self.header_dtype))
+        )
+        self.iposarray = np.concatenate(
+            (self.iposarray, np.array(iposarray, dtype=np.int64))
+        )
         return
 
+    def refresh(self):
+        """
+        Extend the record index with records that were written to the file
+        since it was last indexed, for example by a simulation that is
+        still running.  The file is only read from the end of the current
+        index and a partially written trailing record is not indexed.
+
+        Returns
+        -------
+        nrecords : int
+            The number of records added to the index.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> if hdobj.refresh() > 0:
+        ...     head = hdobj.get_data()
+
+        """
+        nrecords = len(self.recordarray)
+        self.file.seek(0, 2)
+        self.totalbytes = self.file.tell()
+        if self.totalbytes > self._indexed:
+            # the file grew, so it is mapped again on the next memmap read
+            self._mmap = None
+            self._extend_index()
+        return len(self.recordarray) - nrecords
+
+    def follow(self, interval=1.0, timeout=None):
+        """
+        Generator that polls the file for new records and yields each
+        record as soon as it has been completely written.
+
+        Parameters
+        ----------
+        interval : float
+            Number of seconds to wait between polls of the file.
+            (default is 1.)
+        timeout : float
+            Stop when no new records have been written for timeout seconds.
+            If timeout is None, the generator polls until it is closed.
+            (default is None)
+
+        Returns
+        -------
+        out : generator of (header, data) tuples
+            header is the record from recordarray and data is the
+            (nrow, ncol) array for the record.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> for header, data in hdobj.follow(interval=5., timeout=600.):
+        ...     print(header['totim'], header['ilay'], data.max())
+
+        """
+        irec = len(self.recordarray)
+        tlast = time.time()
+        while True:
+            self.refresh()
+            if irec < len(self.recordarray):
+                tlast = time.time()
+            while irec < len(self.recordarray):
+                header = self.recordarray[irec]
+                shp = (header["nrow"], header["ncol"])
+                yield header, self._read_record(self.iposarray[irec], shp)
+                irec += 1
+            if timeout is not None and time.time() - tlast >= timeout:
+                return
+            time.sleep(interval)
+
     def get_databytes(self, header):
         """
 
@@ -368,6 +767,15 @@ class BinaryLayerFile(LayerFile):
         header = binaryread(self.file, self.header_dtype, (1,))
         return header[0]
 
+    def close(self):
+        """
+        Close the file handle and release the memory map, if any.
+
+        """
+        self._mmap = None
+        super(BinaryLayerFile, self).close()
+        return
+
     def get_ts(self, idx):
         """
         Get a time series from the binary file.
@@ -394,6 +802,11 @@ class BinaryLayerFile(LayerFile):
         The layer, row, and column values must be zero-based, and must be
         within the following ranges: 0 <= k < nlay; 0 <= i < nrow; 0 <= j < ncol
 
+        Cells are grouped by layer so that each layer record is visited once
+        and only the parts of the record holding the requested cells are
+        read.  If the memmap backend is active, values for all records of a layer
+        are gathered from the memory map in a single operation.
+
         Examples
         --------
 
@@ -404,27 +817,55 @@ class BinaryLayerFile(LayerFile):
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
 
-        istat = 1
-        for k, i, j in kijlist:
-            ioffset = (i * self.ncol + j) * self.realtype(1).nbytes
-            for irec, header in enumerate(self.recordarray):
-                ilay = (
-                    header["ilay"] - 1
-                )  # change ilay from header to zero-based
-                if ilay != k:
-                    continue
-                ipos = np.long(self.iposarray[irec])
-
-                # Calculate offset necessary to reach intended cell
-                self.file.seek(ipos + np.long(ioffset), 0)
-
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.where(result[:, 0] == header["totim"])[0]
-                result[itim, istat] = binaryread(self.file, self.realtype)
-            istat += 1
+        # map the totim of each record to a row in the result array
+        itimes = {totim: itim for itim, totim in enumerate(self.times)}
+        rows = np.array(
+            [itimes.get(totim, -1) for totim in self.recordarray["totim"]],
+            dtype=np.int64,
+        )
+        reclay = self.recordarray["ilay"] - 1
+        itemsize = self.realtype(1).nbytes
+
+        # group the cells by layer so each layer record is visited once
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        for k in np.unique(kij[:, 0]):
+            istat = np.where(kij[:, 0] == k)[0]
+            offsets = kij[istat, 1] * self.ncol + kij[istat, 2]
+            irecs = np.where((reclay == k) & (rows >= 0))[0]
+            if len(irecs) == 0:
+                continue
+            values = self._read_offsets(self.iposarray[irecs], offsets)
+            result[rows[irecs][:, None], istat[None, :] + 1] = values
         return result
 
+    def _read_offsets(self, ipos, offsets):
+        """
+        Read the values at element offsets from the records that start at
+        byte positions ipos.  If the memmap backend is active, the values
+        of all records are gathered from the memory map in a single
+        operation.
+
+        Returns
+        -------
+        values : numpy array
+            Array of size (len(ipos), len(offsets)).
+
+        """
+        ipos = np.asarray(ipos, dtype=np.int64)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if self.memmap:
+            # gather the bytes of every value through the memory map
+            itemsize = self.realtype(1).nbytes
+            bidx = (ipos[:, None] + offsets[None, :] * itemsize)[
+                ..., None
+            ] + np.arange(itemsize)
+            values = np.asarray(self._get_mmap())[bidx]
+            return values.view(self.realtype)[..., 0]
+        values = np.empty((len(ipos), len(offsets)), self.realtype)
+        for n, pos in enumerate(ipos):
+            values[n] = read_at_offsets(self.file, pos, offsets, self.realtype)
+        return values
+
 
 class HeadFile(BinaryLayerFile):
     """
@@ -440,6 +881,18 @@ class HeadFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    memmap : bool
+        Map the file into memory with numpy.memmap and return read-only
+        views of the file data instead of copies.  Default is False.
+    cache_index : bool
+        Store the record index in a sidecar file (filename + '.idx.npz')
+        that is reused when the file is opened again and extended if the
+        file has grown.  Default is False.
+    index : object
+        Open file object of the same type and with the same layout as this
+        file, such as another realization of an ensemble.  Its record
+        index is reused instead of reading the headers of this file, if
+        both files have the same size.  Default is None.
 
     Attributes
     ----------
@@ -510,6 +963,18 @@ class UcnFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    memmap : bool
+        Map the file into memory with numpy.memmap and return read-only
+        views of the file data instead of copies.  Default is False.
+    cache_index : bool
+        Store the record index in a sidecar file (filename + '.idx.npz')
+        that is reused when the file is opened again and extended if the
+        file has grown.  Default is False.
+    index : object
+        Open file object of the same type and with the same layout as this
+        file, such as another realization of an ensemble.  Its record
+        index is reused instead of reading the headers of this file, if
+        both files have the same size.  Default is None.
 
     Attributes
     ----------
@@ -582,6 +1047,15 @@ class CellBudgetFile(object):
         'single' or 'double'.  Default is 'single'.
     verbose : bool
         Write information to the screen.  Default is False.
+    cache_index : bool
+        Store the record index in a sidecar file (filename + '.idx.npz')
+        that is reused when the file is opened again and extended if the
+        file has grown.  Default is False.
+    index : object
+        Open file object of the same type and with the same layout as this
+        file, such as another realization of an ensemble.  Its record
+        index is reused instead of reading the headers of this file, if
+        both files have the same size.  Default is None.
 
     Attributes
     ----------
@@ -663,10 +1137,21 @@ class CellBudgetFile(object):
                 )
         if "modelgrid" in kwargs.keys():
             self.modelgrid = kwargs.pop("modelgrid")
+        self.cache_index = kwargs.pop("cache_index", False)
+        self._indexed = 0
+        self._index = kwargs.pop("index", None)
         if len(kwargs.keys()) > 0:
             args = ",".join(kwargs.keys())
             raise Exception("LayerFile error: unrecognized kwargs: " + args)
 
+        # precision is determined again by refresh() if no record has been
+        # completely written yet
+        self._auto_precision = precision == "auto"
+        if precision == "auto" and isinstance(self._index, CellBudgetFile):
+            if self._index.realtype == np.float32:
+                precision = "single"
+            else:
+                precision = "double"
         if precision == "auto":
             success = self._set_precision("single")
             if not success:
@@ -687,6 +1172,7 @@ class CellBudgetFile(object):
             )
             raise Exception(s)
 
+        self._index = None
         return
 
     def __enter__(self):
@@ -759,7 +1245,8 @@ class CellBudgetFile(object):
         self.header_dtype = np.dtype(hdt)
 
         try:
-            self._build_index()
+            if self._index is None or not self._share_index(self._index):
+                self._build_index()
         except BudgetIndexError:
             success = False
             self.__reset()
@@ -792,40 +1279,161 @@ class CellBudgetFile(object):
         Build the ordered dictionary, which maps the header information
         to the position in the binary file.
         """
-        asciiset = " "
-        for i in range(33, 127):
-            asciiset += chr(i)
-
+        self.file.seek(0, 0)
         header = self._get_header()
         self.nrow = header["nrow"]
         self.ncol = header["ncol"]
         self.nlay = np.abs(header["nlay"])
-        text = header["text"]
-        if isinstance(text, bytes):
-            text = text.decode()
         if self.nrow < 0 or self.ncol < 0:
             raise Exception("negative nrow, ncol")
         self.file.seek(0, 2)
         self.totalbytes = self.file.tell()
         self.file.seek(0, 0)
-        self.recorddict = OrderedDict()
-        ipos = 0
-        while ipos < self.totalbytes:
-            self.iposheader.append(ipos)
+        self.recordarray = np.array([], dtype=self.header_dtype)
+        self.iposheader = np.array([], dtype=np.int64)
+        self.iposarray = np.array([], dtype=np.int64)
+        self._indexed = 0
+        if self.cache_index:
+            self._read_index_cache()
+        indexed = self._indexed
+        self._extend_index()
+        if self.cache_index and (indexed == 0 or self._indexed != indexed):
+            _write_index_cache(
+                self.filename,
+                self.header_dtype,
+                self._indexed,
+                recordarray=self.recordarray,
+                iposheader=self.iposheader,
+                iposarray=self.iposarray,
+            )
+        return
+
+    def _share_index(self, index):
+        """
+        Reuse the record index of another CellBudgetFile with the same
+        layout, instead of reading the headers of this file.  The index is
+        only reused if both files have the same size and precision and the
+        last indexed header is also found in this file.
+
+        Parameters
+        ----------
+        index : CellBudgetFile
+            File object with the same layout as this file.
+
+        Returns
+        -------
+        success : bool
+            True if the index was reused.
+
+        """
+        if not isinstance(index, CellBudgetFile):
+            return False
+        self.file.seek(0, 2)
+        totalbytes = self.file.tell()
+        if totalbytes != index.totalbytes or index.realtype != self.realtype:
+            self.file.seek(0, 0)
+            return False
+        if len(index.recordarray) > 0:
+            self.file.seek(index.iposheader[-1], 0)
             header = self._get_header()
-            self.nrecords += 1
-            totim = header["totim"]
-            if totim == 0:
-                totim = self._totim_from_kstpkper(
+            for name in ("kstp", "kper", "text", "nlay", "imeth"):
+                if header[name] != index.recordarray[-1][name]:
+                    self.file.seek(0, 0)
+                    return False
+        self.file.seek(0, 0)
+        for name in (
+            "nrow",
+            "ncol",
+            "nlay",
+            "nper",
+            "times",
+            "kstpkper",
+            "recordarray",
+            "iposheader",
+            "iposarray",
+            "textlist",
+            "imethlist",
+            "paknamlist",
+            "nrecords",
+            "totalbytes",
+            "_indexed",
+        ):
+            value = getattr(index, name)
+            if isinstance(value, list):
+                value = list(value)
+            setattr(self, name, value)
+        if self.verbose:
+            print("Reusing index of {}".format(index.filename))
+        return True
+
+    def _read_index_cache(self):
+        """
+        Set the record index from the sidecar index cache, if it is valid.
+
+        """
+        cache = _load_index_cache(self.filename, self.header_dtype)
+        if cache is None:
+            return
+        recordarray = cache["recordarray"]
+        iposheader = cache["iposheader"]
+        if len(recordarray) > 0:
+            # make sure the last indexed header has not been overwritten
+            self.file.seek(iposheader[-1], 0)
+            header = self._get_header()
+            for name in ("kstp", "kper", "text", "nlay", "imeth"):
+                if header[name] != recordarray[-1][name]:
+                    return
+        self.recordarray = recordarray
+        self.iposheader = iposheader
+        self.iposarray = cache["iposarray"]
+        self._indexed = int(cache["indexed"])
+        if self.verbose:
+            print("Read index cache for {}".format(self.filename))
+        return
+
+    def _extend_index(self):
+        """
+        Add the records between the end of the current index and the end of
+        the file to the index.  A partially written trailing record is not
+        indexed.
+
+        """
+        asciiset = " "
+        for i in range(33, 127):
+            asciiset += chr(i)
+
+        h1size = self.header1_dtype.itemsize
+        h2size = self.header2_dtype0.itemsize
+        names = self.header_dtype.names
+        checked = set(self.recordarray["text"].tolist())
+        headers = []
+        iposheader = []
+        iposarray = []
+        ipos = self._indexed
+        self.file.seek(ipos, 0)
+        while ipos < self.totalbytes:
+            buf = self.file.read(h1size)
+            if len(buf) < h1size:
+                break
+            header1 = np.frombuffer(buf, self.header1_dtype)[0].tolist()
+            header2 = [0, 0.0, 0.0, 0.0, b"", b"", b"", b""]
+            if header1[-1] < 0:
+                buf = self.file.read(h2size)
+                if len(buf) < h2size:
+                    break
+                temp = np.frombuffer(buf, self.header2_dtype0)[0].tolist()
+                header2[:4] = temp
+                if temp[0] == 6:
+                    buf = self.file.read(64)
+                    if len(buf) < 64:
+                        break
+                    header2[4:] = [buf[i : i + 16] for i in range(0, 64, 16)]
+            header = OrderedDict(zip(names, list(header1) + header2))
+            if header["totim"] == 0:
+                header["totim"] = self._totim_from_kstpkper(
                     (header["kstp"] - 1, header["kper"] - 1)
                 )
-                header["totim"] = totim
-            if totim >= 0 and totim not in self.times:
-                self.times.append(totim)
-            kstpkper = (header["kstp"], header["kper"])
-            if kstpkper not in self.kstpkper:
-                self.kstpkper.append(kstpkper)
-            if header["text"] not in self.textlist:
+            if header["text"] not in checked:
                 # check the precision of the file using text records
                 try:
                     tlist = [header["text"], header["modelnam"]]
@@ -838,34 +1446,16 @@ class CellBudgetFile(object):
 
                 except:
                     raise BudgetIndexError("Improper precision")
-                self.textlist.append(header["text"])
-                self.imethlist.append(header["imeth"])
-            if header["paknam"] not in self.paknamlist:
-                self.paknamlist.append(header["paknam"])
-            ipos = self.file.tell()
+                checked.add(header["text"])
+            ipos_data = self.file.tell()
 
             if self.verbose:
-                for itxt in [
-                    "kstp",
-                    "kper",
-                    "text",
-                    "ncol",
-                    "nrow",
-                    "nlay",
-                    "imeth",
-                    "delt",
-                    "pertim",
-                    "totim",
-                    "modelnam",
-                    "paknam",
-                    "modelnam2",
-                    "paknam2",
-                ]:
+                for itxt in names:
                     s = header[itxt]
                     if isinstance(s, bytes):
                         s = s.decode()
                     print(itxt + ": " + str(s))
-                print("file position: ", ipos)
+                print("file position: ", ipos_data)
                 if (
                     int(header["imeth"]) != 5
                     and int(header["imeth"]) != 6
@@ -873,26 +1463,140 @@ class CellBudgetFile(object):
                 ):
                     print("")
 
+            # skip over the data to the next record and set ipos, stopping
+            # at a partially written record
+            try:
+                self._skip_record(header)
+            except IndexError:
+                break
+            if self.file.tell() > self.totalbytes:
+                break
+
             # store record and byte position mapping
-            self.recorddict[
-                tuple(header)
-            ] = ipos  # store the position right after header2
-            self.recordarray.append(header)
-            self.iposarray.append(
-                ipos
-            )  # store the position right after header2
-
-            # skip over the data to the next record and set ipos
-            self._skip_record(header)
+            headers.append(tuple(header.values()))
+            iposheader.append(ipos)
+            # store the position right after header2
+            iposarray.append(ipos_data)
             ipos = self.file.tell()
+            self._indexed = ipos
 
         # convert to numpy arrays
-        self.recordarray = np.array(self.recordarray, dtype=self.header_dtype)
-        self.iposheader = np.array(self.iposheader, dtype=np.int64)
-        self.iposarray = np.array(self.iposarray, dtype=np.int64)
-        self.nper = self.recordarray["kper"].max()
+        self.recordarray = np.concatenate(
+            (self.recordarray, np.array(headers, dtype=self.header_dtype))
+        )
+        self.iposheader = np.concatenate(
+            (self.iposheader, np.array(iposheader, dtype=np.int64))
+        )
+        self.iposarray = np.concatenate(
+            (self.iposarray, np.array(iposarray, dtype=np.int64))
+        )
+
+        # derive the unique times, kstpkper, text and package names
+        ra = self.recordarray
+        self.nrecords = ra.shape[0]
+        totim = ra["totim"][ra["totim"] >= 0]
+        idx = np.sort(np.unique(totim, return_index=True)[1])
+        self.times = list(totim[idx])
+        kk = np.column_stack((ra["kstp"], ra["kper"]))
+        idx = np.sort(np.unique(kk, axis=0, return_index=True)[1])
+        self.kstpkper = [(ra["kstp"][i], ra["kper"][i]) for i in idx]
+        idx = np.sort(np.unique(ra["text"], return_index=True)[1])
+        self.textlist = list(ra["text"][idx])
+        self.imethlist = list(ra["imeth"][idx])
+        idx = np.sort(np.unique(ra["paknam"], return_index=True)[1])
+        self.paknamlist = list(ra["paknam"][idx])
+        if self.nrecords > 0:
+            self.nper = ra["kper"].max()
+        else:
+            # no record has been completely written yet, see refresh()
+            self.nper = 0
         return
 
+    def refresh(self):
+        """
+        Extend the record index with records that were written to the file
+        since it was last indexed, for example by a simulation that is
+        still running.  The file is only read from the end of the current
+        index and a partially written trailing record is not indexed.
+
+        Returns
+        -------
+        nrecords : int
+            The number of records added to the index.
+
+        """
+        nrecords = self.nrecords
+        self.file.seek(0, 2)
+        self.totalbytes = self.file.tell()
+        if self.totalbytes > self._indexed:
+            if nrecords == 0 and self._auto_precision:
+                if not self._set_precision("single"):
+                    if not self._set_precision("double"):
+                        s = "Budget precision could not be auto determined"
+                        raise BudgetIndexError(s)
+            else:
+                self._extend_index()
+        return self.nrecords - nrecords
+
+    def follow(self, interval=1.0, timeout=None, full3D=False):
+        """
+        Generator that polls the file for new records and yields each
+        record as soon as it has been completely written.
+
+        Parameters
+        ----------
+        interval : float
+            Number of seconds to wait between polls of the file.
+            (default is 1.)
+        timeout : float
+            Stop when no new records have been written for timeout seconds.
+            If timeout is None, the generator polls until it is closed.
+            (default is None)
+        full3D : boolean
+            If true, then return the record as a three dimensional numpy
+            array, even for those list-style records written as part of a
+            'COMPACT BUDGET' MODFLOW budget file.  (Default is False.)
+
+        Returns
+        -------
+        out : generator of (header, record) tuples
+            header is the record from recordarray and record is the data
+            returned by get_record.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('mymodel.cbb')
+        >>> for header, rec in cbb.follow(interval=5., timeout=600.):
+        ...     print(header['totim'], header['text'])
+
+        """
+        irec = self.nrecords
+        tlast = time.time()
+        while True:
+            self.refresh()
+            if irec < self.nrecords:
+                tlast = time.time()
+            while irec < self.nrecords:
+                header = self.recordarray[irec]
+                yield header, self.get_record(irec, full3D=full3D)
+                irec += 1
+            if timeout is not None and time.time() - tlast >= timeout:
+                return
+            time.sleep(interval)
+
+    @property
+    def recorddict(self):
+        """
+        Ordered dictionary that maps the header information to the position
+        right after header2 in the binary file.
+
+        """
+        return OrderedDict(
+            (tuple(header), ipos)
+            for header, ipos in zip(self.recordarray, self.iposarray)
+        )
+
     def _skip_record(self, header):
         """
         Skip over this record, not counting header and header2.
@@ -1333,6 +2037,230 @@ class CellBudgetFile(object):
 
         return recordlist
 
+    def iter_data(
+        self, text, paknam=None, full3D=False, chunk=None, max_memory=None
+    ):
+        """
+        Iterate over the records for a text identifier, one record or one
+        block of records at a time, so that the records for all times are
+        never held in memory at once.
+
+        Parameters
+        ----------
+        text : str
+            The text identifier for the record.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
+        paknam : str
+            The package name for the record.  (Default is None.)
+        full3D : boolean
+            If true, then return list-style records as three dimensional
+            numpy masked arrays.  (Default is False.)
+        chunk : int
+            Number of records in a block.  If chunk and max_memory are None,
+            the records are returned one at a time.  (Default is None.)
+        max_memory : int
+            Maximum number of bytes in a block.  (Default is None.)
+
+        Returns
+        ----------
+        out : generator
+            If chunk and max_memory are None, yields (kstpkper, totim, data)
+            for each record, with data as returned by get_record().
+            Otherwise, yields (kstpkper, totim, data) for each block, with a
+            list of kstpkper values, an array of totim values and an array
+            with the records stacked along the first axis.
+
+        See Also
+        --------
+
+        Notes
+        -----
+        Blocks of list-style records can only be returned if full3D is
+        True.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> for kstpkper, totim, q in cbb.iter_data('STORAGE', chunk=100):
+        ...     print(totim.min(), q.shape)
+
+        """
+        select = self.recordarray["text"] == self._find_text(text)
+        if paknam is not None:
+            select &= self.recordarray["paknam"] == self._find_paknam(paknam)
+        irecs = np.where(select)[0]
+        records = self.recordarray[irecs]
+        kstpkper = [
+            (kstp - 1, kper - 1)
+            for kstp, kper in zip(records["kstp"], records["kper"])
+        ]
+        totims = records["totim"]
+
+        nbytes = 0
+        if len(irecs) > 0:
+            header = records[0]
+            nbytes = (
+                abs(int(header["nlay"]))
+                * int(header["nrow"])
+                * int(header["ncol"])
+                * np.dtype(self.realtype).itemsize
+            )
+            if header["imeth"] in (2, 5, 6) and not full3D:
+                if chunk is not None or max_memory is not None:
+                    raise Exception(
+                        "full3D must be True to return blocks of "
+                        + "list-style {} records".format(text)
+                    )
+        chunk = _get_chunk_size(nbytes, len(irecs), chunk, max_memory)
+
+        if chunk is None:
+            for n, irec in enumerate(irecs):
+                data = self.get_record(irec, full3D=full3D)
+                yield kstpkper[n], totims[n], data
+            return
+
+        for i0 in range(0, len(irecs), chunk):
+            i1 = min(i0 + chunk, len(irecs))
+            block = None
+            for n, irec in enumerate(irecs[i0:i1]):
+                data = self.get_record(irec, full3D=full3D)
+                if block is None:
+                    shape = (i1 - i0,) + data.shape
+                    if isinstance(data, np.ma.MaskedArray):
+                        block = np.ma.masked_all(shape, data.dtype)
+                    else:
+                        block = np.empty(shape, data.dtype)
+                block[n] = data
+            yield kstpkper[i0:i1], totims[i0:i1], block
+
+    def reduce(self, reducers, text, paknam=None, max_memory=2 ** 28):
+        """
+        Reduce the records for a text identifier without holding the
+        records for all times in memory at once.  List-style records,
+        including the MODFLOW 6 list records (imeth = 6), are expanded to
+        three dimensional arrays with the flows summed for each node, and
+        cells that are not in the list are ignored.
+
+        Parameters
+        ----------
+        reducers : DataReducer or list of DataReducer
+            Reducers, such as flopy.utils.RunningMax(),
+            flopy.utils.RunningMean() or flopy.utils.ExceedanceCount(),
+            that are updated with the records.
+        text : str
+            The text identifier for the record.  Examples include
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
+        paknam : str
+            The package name for the record.  (Default is None.)
+        max_memory : int
+            Maximum number of bytes in a block.  (Default is 256 MB.)
+
+        Returns
+        ----------
+        out : numpy array or list of numpy arrays
+            The result of each reducer.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> qmean = cbb.reduce(flopy.utils.RunningMean(), 'STORAGE')
+
+        """
+        return _reduce(
+            self.iter_data(
+                text, paknam=paknam, full3D=True, max_memory=max_memory
+            ),
+            reducers,
+        )
+
+    def to_parquet(self, filename, text=None, max_memory=2 ** 28, **kwargs):
+        """
+        Export records to a Parquet file in long format, with the columns
+        totim, kstp, kper, text, paknam, node and value.  kstp, kper and
+        node are zero-based, and node is the cell number
+        k * nrow * ncol + i * ncol + j.  Array records are exported for all
+        cells and list records for the cells in the list.  Records are
+        read one at a time and written in row groups of about max_memory
+        bytes.  Requires pyarrow.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the Parquet file.
+        text : str or list of str
+            The text identifiers of the records to export.  If None, all
+            records are exported.  (Default is None.)
+        max_memory : int
+            Approximate number of bytes of data values in a row group.
+            (Default is 256 MB.)
+        **kwargs : dict
+            Keyword arguments passed to pyarrow.parquet.ParquetWriter.
+
+        Returns
+        ----------
+        nrows : int
+            Number of rows written.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> cbb.to_parquet('model_cbc.parquet', text=['STORAGE', 'WELLS'])
+
+        """
+        from ..export.columnar import budgetfile_batches, write_parquet
+
+        return write_parquet(
+            filename,
+            budgetfile_batches(self, text=text, max_memory=max_memory),
+            **kwargs
+        )
+
+    def to_zarr(self, store, text=None, chunks=None, max_memory=2 ** 28):
+        """
+        Export records to a Zarr store, with one group for each record text
+        (and package name, if several packages write the same text).  Each
+        group of array records has the array data of size
+        (nrecords, nlay, nrow, ncol) and the arrays totim, kstp and kper.
+        List records are written in long format, as by to_parquet, with the
+        arrays totim, kstp, kper, node and value.  Records are read and
+        written in blocks.  Requires zarr.
+
+        Parameters
+        ----------
+        store : str or zarr store
+            Path or store of the Zarr group.  An existing group is
+            overwritten.
+        text : str or list of str
+            The text identifiers of the records to export.  If None, all
+            records are exported.  (Default is None.)
+        chunks : tuple of ints
+            Chunk shape of the data arrays.  If None, each chunk holds one
+            layer for one time.  (Default is None.)
+        max_memory : int
+            Maximum number of bytes of data read at once.
+            (Default is 256 MB.)
+
+        Returns
+        ----------
+        group : zarr.hierarchy.Group
+
+        Examples
+        --------
+        >>> import flopy
+        >>> cbb = flopy.utils.CellBudgetFile('model.cbc')
+        >>> root = cbb.to_zarr('model_cbc.zarr')
+        >>> q = root['STORAGE/data'][:, 0, 10, 10]
+
+        """
+        from ..export.columnar import budgetfile_to_zarr
+
+        return budgetfile_to_zarr(
+            self, store, text=text, chunks=chunks, max_memory=max_memory
+        )
+
     def get_ts(self, idx, text=None, times=None):
         """
         Get a time series from the binary budget file.
@@ -1343,17 +2271,20 @@ class CellBudgetFile(object):
             idx can be (layer, row, column) or it can be a list in the form
             [(layer, row, column), (layer, row, column), ...].  The layer,
             row, and column values must be zero based.
-        text : str
+        text : str or list of str
             The text identifier for the record.  Examples include
-            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.
+            'RIVER LEAKAGE', 'STORAGE', 'FLOW RIGHT FACE', etc.  If a list
+            of text identifiers is passed, the time series for all of them
+            are extracted in a single pass over the file.
         times : iterable of floats
             List of times to from which to get time series.
 
         Returns
         ----------
-        out : numpy array
+        out : numpy array or dict
             Array has size (ntimes, ncells + 1).  The first column in the
-            data array will contain time (totim).
+            data array will contain time (totim).  If text is a list, a
+            dictionary with an array for each text identifier is returned.
 
         See Also
         --------
@@ -1364,6 +2295,11 @@ class CellBudgetFile(object):
         The layer, row, and column values must be zero-based, and must be
         within the following ranges: 0 <= k < nlay; 0 <= i < nrow; 0 <= j < ncol
 
+        Values are read directly at the position of the requested cells for
+        array records.  For list records, the positions of the requested
+        cells in the list are reused as long as the list of nodes does not
+        change.  Cells that are not in a list record are set to nan.
+
         Examples
         --------
 
@@ -1375,13 +2311,14 @@ class CellBudgetFile(object):
                 + "get_ts() method."
             )
             raise Exception(etxt)
+        if isinstance(text, (list, tuple)):
+            texts = list(text)
+        else:
+            texts = [text]
 
         kijlist = self._build_kijlist(idx)
         nstation = self._get_nstation(idx, kijlist)
 
-        # Initialize result array and put times in first column
-        result = self._init_result(nstation)
-
         kk = self.get_kstpkper()
         timesint = self.get_times()
         if len(timesint) < 1:
@@ -1398,51 +2335,154 @@ class CellBudgetFile(object):
                     )
                     raise Exception(etxt)
                 timesint = times
-        for idx, t in enumerate(timesint):
-            result[idx, 0] = t
 
-        for itim, k in enumerate(kk):
-            try:
-                v = self.get_data(kstpkper=k, text=text, full3D=True)
-                # skip missing data - required for storage
-                if len(v) > 0:
-                    v = v[0]
-                    istat = 1
-                    for k, i, j in kijlist:
-                        result[itim, istat] = v[k, i, j].copy()
-                        istat += 1
-            except ValueError:
-                v = self.get_data(kstpkper=k, text=text)
-                # skip missing data - required for storage
-                if len(v) > 0:
-                    if self.modelgrid is None:
-                        s = (
-                            "A modelgrid instance must be provided during "
-                            "instantiation to get IMETH=6 timeseries data"
-                        )
-                        raise AssertionError(s)
-
-                    if self.modelgrid.grid_type == "structured":
-                        ndx = [
-                            lrc[0]
-                            * (self.modelgrid.nrow * self.modelgrid.ncol)
-                            + lrc[1] * self.modelgrid.ncol
-                            + (lrc[2] + 1)
-                            for lrc in kijlist
-                        ]
-                    else:
-                        ndx = [
-                            lrc[0] * self.modelgrid.ncpl + (lrc[-1] + 1)
-                            for lrc in kijlist
-                        ]
+        # Initialize result arrays and put times in first column
+        results = []
+        for t in texts:
+            result = self._init_result(nstation)
+            for itim, totim in enumerate(timesint):
+                result[itim, 0] = totim
+            results.append(result)
+
+        # map text records to result arrays and kstpkper to result rows
+        iresults = OrderedDict()
+        for n, t in enumerate(texts):
+            iresults.setdefault(self._find_text(t), []).append(n)
+        rows = {kstpkper: itim for itim, kstpkper in enumerate(self.kstpkper)}
+        filled = np.zeros((len(texts), len(kk)), dtype=bool)
+
+        kij = np.array(kijlist, dtype=np.int64).reshape(-1, 3)
+        lookup = {}
+        irecs = np.where(
+            np.isin(self.recordarray["text"], list(iresults.keys()))
+        )[0]
+        for irec in irecs:
+            header = self.recordarray[irec]
+            itim = rows[(header["kstp"], header["kper"])]
+            imeth = header["imeth"]
+            ntext = iresults[header["text"]]
+            # only the first record for a time step is used, except for
+            # imeth 6 where each record updates the cells it contains
+            if imeth != 6 and filled[ntext[0], itim]:
+                continue
+            values = self._get_ts_record(irec, kij, lookup)
+            present = ~np.isnan(values)
+            for n in ntext:
+                if imeth == 6:
+                    results[n][itim, 1:][present] = values[present]
+                else:
+                    results[n][itim, 1:] = values
+            filled[ntext, itim] = True
 
-                    for vv in v:
-                        field = vv.dtype.names[2]
-                        dix = np.where(np.isin(vv["node"], ndx))[0]
-                        if len(dix) > 0:
-                            result[itim, 1:] = vv[field][dix]
+        if isinstance(text, (list, tuple)):
+            return OrderedDict(zip(texts, results))
+        return results[0]
 
-        return result
+    def _get_ts_record(self, idx, kij, lookup):
+        """
+        Get the values of a single record for the cells in kij.  Cells
+        that are not in the record are set to nan.
+
+        Parameters
+        ----------
+        idx : int
+            The zero-based record number.
+        kij : numpy array of ints
+            Array of shape (ncells, 3) with zero-based layer, row, and
+            column values.
+        lookup : dict
+            Cache of the list positions of the cells for list records,
+            keyed by text.  The cache is updated by this method.
+
+        Returns
+        -------
+        values : numpy array
+            Array of size ncells.
+
+        """
+        header = self.recordarray[idx]
+        ipos = np.int64(self.iposarray[idx])
+        imeth = header["imeth"]
+        nlay = abs(header["nlay"])
+        nrow = header["nrow"]
+        ncol = header["ncol"]
+        k, i, j = kij[:, 0], kij[:, 1], kij[:, 2]
+        values = np.empty(kij.shape[0], dtype=self.realtype)
+        values[:] = np.nan
+
+        # array records
+        if imeth in (0, 1):
+            offsets = (k * nrow + i) * ncol + j
+            return read_at_offsets(self.file, ipos, offsets, self.realtype)
+        elif imeth == 3:
+            offsets = i * ncol + j
+            ilayer = read_at_offsets(self.file, ipos, offsets, np.int32)
+            data = read_at_offsets(
+                self.file,
+                ipos + nrow * ncol * np.int32(1).nbytes,
+                offsets,
+                self.realtype,
+            )
+            isin = ilayer == k + 1
+            values[isin] = data[isin]
+            return values
+        elif imeth == 4:
+            isin = k == 0
+            values[isin] = read_at_offsets(
+                self.file, ipos, i[isin] * ncol + j[isin], self.realtype
+            )
+            return values
+
+        # list records
+        if imeth == 6:
+            if self.modelgrid is None:
+                s = (
+                    "A modelgrid instance must be provided during "
+                    "instantiation to get IMETH=6 timeseries data"
+                )
+                raise AssertionError(s)
+            if self.modelgrid.grid_type == "structured":
+                nodes = (
+                    k * (self.modelgrid.nrow * self.modelgrid.ncol)
+                    + i * self.modelgrid.ncol
+                    + j
+                    + 1
+                )
+            else:
+                nodes = k * self.modelgrid.ncpl + j + 1
+        elif imeth in (2, 5):
+            nodes = (k * nrow + i) * ncol + j + 1
+        else:
+            raise ValueError("invalid imeth value - {}".format(imeth))
+        data = self.get_record(idx)
+        field = "q"
+        if field not in data.dtype.names:
+            field = data.dtype.names[2]
+
+        # find the list positions of the cells, reusing the positions found
+        # for the previous record with this text if the nodes are the same
+        listnodes = np.asarray(data["node"])
+        cached = lookup.get(header["text"])
+        if cached is None or not np.array_equal(cached[0], listnodes):
+            sorter = np.argsort(listnodes, kind="stable")
+            left = np.searchsorted(listnodes, nodes, "left", sorter=sorter)
+            right = np.searchsorted(listnodes, nodes, "right", sorter=sorter)
+            counts = right - left
+            istat = np.repeat(np.arange(nodes.shape[0]), counts)
+            first = np.repeat(left, counts)
+            step = np.arange(counts.sum()) - np.repeat(
+                np.cumsum(counts) - counts, counts
+            )
+            irow = sorter[first + step]
+            cached = (listnodes, irow, istat, counts > 0)
+            lookup[header["text"]] = cached
+        listnodes, irow, istat, present = cached
+
+        # sum the values of cells that are in the list more than once
+        total = np.zeros(nodes.shape[0], dtype=self.realtype)
+        np.add.at(total, istat, np.asarray(data[field])[irow])
+        values[present] = total[present]
+        return values
 
     def _build_kijlist(self, idx):
         if isinstance(idx, list):
@@ -1509,7 +2549,9 @@ class CellBudgetFile(object):
 
             If full3D is True, then this method will return a numpy masked
             array of size (nlay, nrow, ncol) for those list-style
-            'COMPACT BUDGET' records written by MODFLOW.
+            'COMPACT BUDGET' records written by MODFLOW, including the
+            MODFLOW 6 list records (imeth = 6), with the flows summed for
+            each node.
 
         See Also
         --------
@@ -1655,18 +2697,14 @@ class CellBudgetFile(object):
             data = binaryread(self.file, dtype, shape=(nlist,))
             if self.verbose:
                 if full3D:
-                    s += (
-                        "full 3D arrays not supported for "
-                        + "imeth = {}".format(imeth)
+                    s += "a numpy masked array of size ({},{},{})".format(
+                        nlay, nrow, ncol
                     )
                 else:
                     s += "a numpy recarray of size (" + str(nlist) + ", 2)"
                 print(s)
             if full3D:
-                s += "full 3D arrays not supported for " + "imeth = {}".format(
-                    imeth
-                )
-                raise ValueError(s)
+                return self.create3D(data, nlay, nrow, ncol)
             else:
                 return data.view(np.recarray)
         else:
@@ -1698,10 +2736,9 @@ class CellBudgetFile(object):
         """
         out = np.ma.zeros((nlay * nrow * ncol), dtype=np.float32)
         out.mask = True
-        for [node, q] in zip(data["node"], data["q"]):
-            idx = node - 1
-            out.data[idx] += q
-            out.mask[idx] = False
+        idx = data["node"] - 1
+        np.add.at(out.data, idx, data["q"])
+        out.mask[idx] = False
         return np.ma.reshape(out, (nlay, nrow, ncol))
 
     def get_times(self):
@@ -1831,6 +2868,18 @@ class HeadUFile(BinaryLayerFile):
         'auto', 'single' or 'double'.  Default is 'auto'.
     verbose : bool
         Write information to the screen.  Default is False.
+    memmap : bool
+        Map the file into memory with numpy.memmap and return read-only
+        views of the file data instead of copies.  Default is False.
+    cache_index : bool
+        Store the record index in a sidecar file (filename + '.idx.npz')
+        that is reused when the file is opened again and extended if the
+        file has grown.  Default is False.
+    index : object
+        Open file object of the same type and with the same layout as this
+        file, such as another realization of an ensemble.  Its record
+        index is reused instead of reading the headers of this file, if
+        both files have the same size.  Default is None.
 
     Attributes
     ----------
@@ -1861,6 +2910,10 @@ class HeadUFile(BinaryLayerFile):
     array for a layer.  If the heads for a layer were not saved, then
     None will be returned for that layer.
 
+    The get_node_data and get_ts methods use an index that maps each node
+    number to the layer record holding it and its offset in that record,
+    so that only the requested nodes are read from the file.
+
     Examples
     --------
 
@@ -1868,6 +2921,8 @@ class HeadUFile(BinaryLayerFile):
     >>> hdobj = bf.HeadUFile('model.hds')
     >>> hdobj.list_records()
     >>> usgheads = hdobj.get_data(kstpkper=(1, 50))
+    >>> h = hdobj.get_node_data(slice(1000, 2000), kstpkper=(1, 50))
+    >>> ts = hdobj.get_ts([0, 5000, 100000])
 
 
     """
@@ -1890,9 +2945,168 @@ class HeadUFile(BinaryLayerFile):
         self.header_dtype = BinaryHeader.set_dtype(
             bintype="Head", precision=precision
         )
+        self._node_index = None
         super(HeadUFile, self).__init__(filename, precision, verbose, kwargs)
         return
 
+    def _get_node_index(self):
+        """
+        Get the node index of the file.  The node index is built from the
+        record headers on first use, and rebuilt if records were added to
+        the record index since.
+
+        Returns
+        -------
+        laystrt : numpy array
+            Zero-based number of the first node of each layer.
+        laynpl : numpy array
+            Number of nodes of each layer.
+        recipos : numpy array
+            Array of size (ntimes, nlay) with the byte position of the
+            layer record of each time, or -1 if the layer was not saved.
+
+        """
+        nrecords = len(self.recordarray)
+        if self._node_index is None or self._node_index[0] != nrecords:
+            ilay = self.recordarray["ilay"].astype(np.int64) - 1
+            # for unstructured grids, ncol and nrow are the one-based
+            # starting and ending node numbers of a layer
+            nstrt = self.recordarray["ncol"].astype(np.int64) - 1
+            nend = self.recordarray["nrow"].astype(np.int64)
+            laystrt = np.zeros(self.nlay, dtype=np.int64)
+            laynpl = np.zeros(self.nlay, dtype=np.int64)
+            laystrt[ilay] = nstrt
+            laynpl[ilay] = nend - nstrt
+            itimes = {totim: itim for itim, totim in enumerate(self.times)}
+            itim = np.array(
+                [itimes[totim] for totim in self.recordarray["totim"]],
+                dtype=np.int64,
+            )
+            recipos = np.full((len(self.times), self.nlay), -1, np.int64)
+            recipos[itim, ilay] = self.iposarray
+            self._node_index = (nrecords, laystrt, laynpl, recipos)
+        return self._node_index[1:]
+
+    def get_nnodes(self):
+        """
+        Get the number of nodes in the file.
+
+        Returns
+        ----------
+        out : int
+            The number of nodes.
+
+        """
+        laystrt, laynpl, recipos = self._get_node_index()
+        return int(np.max(laystrt + laynpl))
+
+    def _locate_nodes(self, nodes):
+        """
+        Get the zero-based layer and the offset in the layer record of
+        zero-based node numbers.
+
+        """
+        laystrt, laynpl, recipos = self._get_node_index()
+        nodes = np.asarray(nodes, dtype=np.int64)
+        order = np.argsort(laystrt)
+        ilay = order[np.searchsorted(laystrt[order], nodes, side="right") - 1]
+        offsets = nodes - laystrt[ilay]
+        invalid = (nodes < 0) | (offsets < 0) | (offsets >= laynpl[ilay])
+        if invalid.any():
+            msg = "HeadUFile: node(s) not found in file: {}".format(
+                nodes[invalid]
+            )
+            raise Exception(msg)
+        return ilay, offsets
+
+    def get_node_data(self, nodes=None, kstpkper=None, idx=None, totim=None):
+        """
+        Get the heads of a set of nodes for the specified conditions.  Only
+        the parts of the layer records that hold the nodes are read.
+
+        Parameters
+        ----------
+        nodes : int, list of ints, slice or numpy boolean array
+            The zero-based node numbers, a slice of node numbers, or a mask
+            of size nnodes.  If None, all nodes are read into a single
+            array.  (Default is None.)
+        kstpkper : tuple of ints
+            A tuple containing the time step and stress period (kstp, kper).
+            These are zero-based kstp and kper values.
+        idx : int
+            The zero-based record number.  The first record is record 0.
+        totim : float
+            The simulation time.
+
+        Returns
+        ----------
+        data : numpy array
+            One-dimensional array with the heads of the nodes.  Nodes in
+            layers that were not saved are nan.
+
+        Notes
+        -----
+        if kstpkper, idx and totim are None, will return the last entry
+
+        Examples
+        --------
+        >>> import flopy.utils.binaryfile as bf
+        >>> hdobj = bf.HeadUFile('model.hds')
+        >>> h = hdobj.get_node_data(np.arange(100, 200), totim=10.)
+
+        """
+        totim1 = self._get_totim(kstpkper=kstpkper, idx=idx, totim=totim)
+        if totim1 not in self.times:
+            msg = "totim value ({}) not found in file...".format(totim1)
+            raise Exception(msg)
+        itim = self.times.index(totim1)
+        laystrt, laynpl, recipos = self._get_node_index()
+
+        if nodes is None:
+            return self._read_nodes(recipos[itim], laystrt, laynpl)
+
+        nnodes = self.get_nnodes()
+        if isinstance(nodes, slice):
+            nodes = np.arange(nnodes)[nodes]
+        else:
+            nodes = np.asarray(nodes)
+            if nodes.dtype == bool:
+                if nodes.shape != (nnodes,):
+                    msg = "HeadUFile: mask must have size {}".format(nnodes)
+                    raise Exception(msg)
+                nodes = np.where(nodes)[0]
+        nodes = np.atleast_1d(nodes)
+        ilay, offsets = self._locate_nodes(nodes)
+        data = np.full(nodes.shape, np.nan, dtype=self.realtype)
+        for k in np.unique(ilay):
+            if recipos[itim, k] < 0:
+                continue
+            istat = np.where(ilay == k)[0]
+            data[istat] = self._read_offsets(
+                recipos[itim, k : k + 1], offsets[istat]
+            )[0]
+        return data
+
+    def _read_nodes(self, ipos, laystrt, laynpl):
+        """
+        Read the layer records at byte positions ipos into a single
+        preallocated array of all nodes.
+
+        """
+        data = np.full(
+            int(np.max(laystrt + laynpl)), np.nan, dtype=self.realtype
+        )
+        for k in range(self.nlay):
+            if ipos[k] < 0:
+                continue
+            layer = data[laystrt[k] : laystrt[k] + laynpl[k]]
+            if self.memmap:
+                layer[:] = self._read_record(ipos[k], (laynpl[k],))
+            else:
+                self.file.seek(ipos[k], 0)
+                self.file.readinto(memoryview(layer).cast("B"))
+        return data
+
     def _get_data_array(self, totim=0.0):
         """
         Get a list of 1D arrays for the
@@ -1910,6 +3124,15 @@ class HeadUFile(BinaryLayerFile):
 
         # fill a list of 1d arrays with heads from binary file
         data = self.nlay * [None]
+        if not self.memmap:
+            # read all layers into a single array of all nodes and return
+            # views of the layers
+            itim = self.times.index(totim)
+            laystrt, laynpl, recipos = self._get_node_index()
+            nodedata = self._read_nodes(recipos[itim], laystrt, laynpl)
+            for k in np.where(recipos[itim] >= 0)[0]:
+                data[k] = nodedata[laystrt[k] : laystrt[k] + laynpl[k]]
+            return data
         for idx in keyindices:
             ipos = self.iposarray[idx]
             ilay = self.recordarray["ilay"][idx]
@@ -1921,8 +3144,7 @@ class HeadUFile(BinaryLayerFile):
                     ipos
                 ) + "layer {}".format(ilay)
                 print(msg)
-            self.file.seek(ipos, 0)
-            data[ilay - 1] = binaryread(self.file, self.realtype, shape=(npl,))
+            data[ilay - 1] = self._read_record(ipos, (npl,))
         return data
 
     def get_databytes(self, header):
@@ -1948,19 +3170,18 @@ class HeadUFile(BinaryLayerFile):
 
     def get_ts(self, idx):
         """
-        Get a time series from the binary HeadUFile (not implemented).
+        Get a time series from the binary HeadUFile.
 
         Parameters
         ----------
-        idx : tuple of ints, or a list of a tuple of ints
-            idx can be (layer, row, column) or it can be a list in the form
-            [(layer, row, column), (layer, row, column), ...].  The layer,
-            row, and column values must be zero based.
+        idx : int or list of ints
+            idx can be a zero-based node number or a list of zero-based
+            node numbers.
 
         Returns
         ----------
         out : numpy array
-            Array has size (ntimes, ncells + 1).  The first column in the
+            Array has size (ntimes, nnodes + 1).  The first column in the
             data array will contain time (totim).
 
         See Also
@@ -1968,10 +3189,34 @@ class HeadUFile(BinaryLayerFile):
 
         Notes
         -----
+        Nodes are grouped by layer, and only the parts of the layer records
+        holding the requested nodes are read.  Nodes in layers that were not
+        saved for a time are nan.
 
         Examples
         --------
+        >>> import flopy.utils.binaryfile as bf
+        >>> hdobj = bf.HeadUFile('model.hds')
+        >>> ts = hdobj.get_ts([0, 5000, 100000])
 
         """
-        msg = "HeadUFile: get_ts() is not implemented"
-        raise NotImplementedError(msg)
+        nodes = np.atleast_1d(np.asarray(idx, dtype=np.int64))
+        if nodes.ndim != 1:
+            msg = "HeadUFile: get_ts() requires node numbers, not {}".format(
+                idx
+            )
+            raise Exception(msg)
+        ilay, offsets = self._locate_nodes(nodes)
+        laystrt, laynpl, recipos = self._get_node_index()
+
+        # Initialize result array and put times in first column
+        result = self._init_result(len(nodes))
+
+        for k in np.unique(ilay):
+            istat = np.where(ilay == k)[0]
+            itims = np.where(recipos[:, k] >= 0)[0]
+            if len(itims) == 0:
+                continue
+            values = self._read_offsets(recipos[itims, k], offsets[istat])
+            result[itims[:, None], istat[None, :] + 1] = values
+        return result
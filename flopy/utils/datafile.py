@@ -9,6 +9,200 @@ import flopy.utils
 from ..discretization.structuredgrid import StructuredGrid
 
 
+def _get_chunk_size(nbytes, ntimes, chunk=None, max_memory=None):
+    """
+    Get the number of times in a block of data that is read at once.
+
+    Parameters
+    ----------
+    nbytes : int
+        Number of bytes of the data for one time.
+    ntimes : int
+        Number of times in the file.
+    chunk : int
+        Number of times in a block.  (Default is None.)
+    max_memory : int
+        Maximum number of bytes in a block.  (Default is None.)
+
+    Returns
+    -------
+    chunk : int or None
+        Number of times in a block, or None if the data should not be
+        returned in blocks.
+
+    """
+    if chunk is None and max_memory is None:
+        return None
+    if chunk is None:
+        chunk = ntimes
+    if max_memory is not None:
+        chunk = min(chunk, int(max_memory) // max(int(nbytes), 1))
+    return max(int(chunk), 1)
+
+
+class DataReducer(object):
+    """
+    The DataReducer class is the abstract base class for reductions over
+    the times in a file.  A reducer is updated with consecutive blocks of
+    data, so that the data for all times are never held in memory at once.
+    Values that are nan are ignored.
+
+    Examples
+    --------
+    >>> import flopy
+    >>> hdobj = flopy.utils.HeadFile('model.hds')
+    >>> hmax = flopy.utils.RunningMax()
+    >>> for kstpkper, totim, h in hdobj.iter_data(max_memory=2**28):
+    ...     hmax.update(h)
+    >>> hmax.result
+
+    """
+
+    def __init__(self):
+        self.count = None
+
+    def update(self, data):
+        """
+        Update the reduction with a block of data.
+
+        Parameters
+        ----------
+        data : numpy array
+            Array with the data for a block of times.  The first axis is
+            the time axis.
+
+        """
+        data = np.asarray(np.ma.filled(data, np.nan), dtype=float)
+        valid = ~np.isnan(data)
+        if self.count is None:
+            self.count = np.zeros(data.shape[1:], dtype=int)
+            self._initialize(data.shape[1:])
+        self.count += valid.sum(axis=0)
+        self._update(data, valid)
+
+    def _initialize(self, shape):
+        raise NotImplementedError()
+
+    def _update(self, data, valid):
+        raise NotImplementedError()
+
+    @property
+    def result(self):
+        """
+        Get the reduced array.  Cells without values are nan.
+
+        """
+        raise NotImplementedError()
+
+
+class RunningMax(DataReducer):
+    """
+    Maximum value of each cell over all times.
+
+    """
+
+    def _initialize(self, shape):
+        self._value = np.full(shape, np.nan)
+
+    def _update(self, data, valid):
+        self._value = np.fmax(
+            self._value, np.where(valid, data, -np.inf).max(axis=0)
+        )
+
+    @property
+    def result(self):
+        return np.where(self.count > 0, self._value, np.nan)
+
+
+class RunningMin(DataReducer):
+    """
+    Minimum value of each cell over all times.
+
+    """
+
+    def _initialize(self, shape):
+        self._value = np.full(shape, np.nan)
+
+    def _update(self, data, valid):
+        self._value = np.fmin(
+            self._value, np.where(valid, data, np.inf).min(axis=0)
+        )
+
+    @property
+    def result(self):
+        return np.where(self.count > 0, self._value, np.nan)
+
+
+class RunningMean(DataReducer):
+    """
+    Mean value of each cell over all times.
+
+    """
+
+    def _initialize(self, shape):
+        self._total = np.zeros(shape)
+
+    def _update(self, data, valid):
+        self._total += np.where(valid, data, 0.0).sum(axis=0)
+
+    @property
+    def result(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 0, self._total / self.count, np.nan)
+
+
+class ExceedanceCount(DataReducer):
+    """
+    Number of times the value of each cell exceeds a threshold.
+
+    Parameters
+    ----------
+    threshold : float or numpy array
+        Threshold value, or an array of threshold values for each cell.
+    below : bool
+        If True, count the number of times the value is less than the
+        threshold.  (Default is False.)
+
+    """
+
+    def __init__(self, threshold, below=False):
+        super(ExceedanceCount, self).__init__()
+        self.threshold = threshold
+        self.below = below
+
+    def _initialize(self, shape):
+        self._exceed = np.zeros(shape, dtype=int)
+
+    def _update(self, data, valid):
+        with np.errstate(invalid="ignore"):
+            if self.below:
+                exceed = data < self.threshold
+            else:
+                exceed = data > self.threshold
+        self._exceed += (exceed & valid).sum(axis=0)
+
+    @property
+    def result(self):
+        return self._exceed
+
+
+def _reduce(iterator, reducers):
+    """
+    Update reducers with the blocks of data returned by an iter_data
+    generator.
+
+    """
+    single = isinstance(reducers, DataReducer)
+    if single:
+        reducers = [reducers]
+    for kstpkper, totim, data in iterator:
+        for reducer in reducers:
+            reducer.update(data)
+    if single:
+        return reducers[0].result
+    return [reducer.result for reducer in reducers]
+
+
 class Header(object):
     """
     The header class is an abstract base class to create headers for MODFLOW files
@@ -155,6 +349,18 @@ class LayerFile(object):
 
     """
 
+    # attributes that make up the record index of a file
+    _index_attributes = (
+        "nrow",
+        "ncol",
+        "nlay",
+        "times",
+        "kstpkper",
+        "recordarray",
+        "iposarray",
+        "totalbytes",
+    )
+
     def __init__(self, filename, precision, verbose, kwargs):
         self.filename = filename
         self.precision = precision
@@ -194,12 +400,15 @@ class LayerFile(object):
             self.mg = self.dis.parent.modelgrid
         if "modelgrid" in kwargs.keys():
             self.mg = kwargs.pop("modelgrid")
+        index = kwargs.pop("index", None)
         if len(kwargs.keys()) > 0:
             args = ",".join(kwargs.keys())
             raise Exception("LayerFile error: unrecognized kwargs: " + args)
 
-        # read through the file and build the pointer index
-        self._build_index()
+        # read through the file and build the pointer index, unless the
+        # index of a file with the same layout can be reused
+        if index is None or not self._share_index(index):
+            self._build_index()
 
         # now that we read the data and know nrow and ncol,
         # we can make a generic sr if needed
@@ -279,6 +488,110 @@ class LayerFile(object):
 
         write_grid_shapefile(filename, self.mg, attrib_dict)
 
+    def to_parquet(
+        self, filename, mflay=None, nodata=None, max_memory=2 ** 28, **kwargs
+    ):
+        """
+        Export the data for all times to a Parquet file in long format,
+        with the columns totim, kstp, kper, layer, row, column and value.
+        kstp, kper, layer, row and column are zero-based.  The data are
+        read and written in blocks of times, with one row group for each
+        block, so that queries for a range of times only read the row
+        groups they need.  Requires pyarrow.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the Parquet file.
+        mflay : integer
+           MODFLOW zero-based layer number to export.  If None, then all
+           all layers will be included. (Default is None.)
+        nodata : float
+           The nodata value in the data array, which is exported as nan.
+           (Default is None.)
+        max_memory : int
+           Maximum number of bytes of data read at once.
+           (Default is 256 MB.)
+        **kwargs : dict
+            Keyword arguments passed to pyarrow.parquet.ParquetWriter.
+
+        Returns
+        ----------
+        nrows : int
+            Number of rows written.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> hdobj.to_parquet('test_heads.parquet')
+
+        """
+        from ..export.columnar import layerfile_batches, write_parquet
+
+        return write_parquet(
+            filename,
+            layerfile_batches(
+                self, mflay=mflay, nodata=nodata, max_memory=max_memory
+            ),
+            **kwargs
+        )
+
+    def to_zarr(
+        self, store, mflay=None, nodata=None, chunks=None, max_memory=2 ** 28
+    ):
+        """
+        Export the data for all times to a Zarr store, with the array data
+        of size (ntimes, nlay, nrow, ncol) and the arrays totim, kstp and
+        kper.  The data are read and written in blocks of times.  Queries
+        only read the chunks they need, so chunks that span all times and
+        a few cells, such as (ntimes, 1, 16, 16), make cell time series
+        fast.  Requires zarr.
+
+        Parameters
+        ----------
+        store : str or zarr store
+            Path or store of the Zarr group.  An existing group is
+            overwritten.
+        mflay : integer
+           MODFLOW zero-based layer number to export.  If None, then all
+           all layers will be included. (Default is None.)
+        nodata : float
+           The nodata value in the data array, which is exported as nan.
+           (Default is None.)
+        chunks : tuple of ints
+            Chunk shape of the data array.  If None, each chunk holds one
+            layer for one time.  (Default is None.)
+        max_memory : int
+           Maximum number of bytes of data read at once.
+           (Default is 256 MB.)
+
+        Returns
+        ----------
+        group : zarr.hierarchy.Group
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('test.hds')
+        >>> nlay, nrow, ncol = hdobj.get_data().shape
+        >>> ntimes = len(hdobj.get_times())
+        >>> root = hdobj.to_zarr('test_heads.zarr',
+        ...                      chunks=(ntimes, 1, 16, 16))
+        >>> ts = root['data'][:, 0, 10, 10]
+
+        """
+        from ..export.columnar import layerfile_to_zarr
+
+        return layerfile_to_zarr(
+            self,
+            store,
+            mflay=mflay,
+            nodata=nodata,
+            chunks=chunks,
+            max_memory=max_memory,
+        )
+
     def plot(
         self,
         axes=None,
@@ -409,6 +722,47 @@ class LayerFile(object):
         )
         raise Exception(e)
 
+    def _share_index(self, index):
+        """
+        Reuse the record index of another file object of the same type,
+        instead of reading the headers of this file.  The index is only
+        reused if both files have the same size and the index passes the
+        checks in _check_index().
+
+        Parameters
+        ----------
+        index : LayerFile
+            File object with the same layout as this file.
+
+        Returns
+        -------
+        success : bool
+            True if the index was reused.
+
+        """
+        if type(index) is not type(self):
+            return False
+        self.file.seek(0, 2)
+        totalbytes = self.file.tell()
+        self.file.seek(0, 0)
+        if totalbytes != index.totalbytes or not self._check_index(index):
+            return False
+        for name in self._index_attributes:
+            value = getattr(index, name)
+            if isinstance(value, list):
+                value = list(value)
+            setattr(self, name, value)
+        if self.verbose:
+            print("Reusing index of {}".format(index.filename))
+        return True
+
+    def _check_index(self, index):
+        """
+        Check that the record index of index is valid for this file.
+
+        """
+        return True
+
     def list_records(self):
         """
         Print a list of all of the records in the file
@@ -515,6 +869,19 @@ class LayerFile(object):
         Examples
         --------
 
+        """
+        totim1 = self._get_totim(kstpkper=kstpkper, idx=idx, totim=totim)
+        data = self._get_data_array(totim1)
+        if mflay is None:
+            return data
+        else:
+            return data[mflay, :, :]
+
+    def _get_totim(self, kstpkper=None, idx=None, totim=None):
+        """
+        Get the totim value for the specified kstpkper, record number or
+        totim value.  The last totim value is returned if all are None.
+
         """
         # One-based kstp and kper for pulling out of recarray
         if kstpkper is not None:
@@ -535,12 +902,7 @@ class LayerFile(object):
             totim1 = self.recordarray["totim"][idx]
         else:
             totim1 = self.times[-1]
-
-        data = self._get_data_array(totim1)
-        if mflay is None:
-            return data
-        else:
-            return data[mflay, :, :]
+        return totim1
 
     def get_alldata(self, mflay=None, nodata=-9999):
         """
@@ -567,6 +929,8 @@ class LayerFile(object):
 
         Notes
         -----
+        Use iter_data() or reduce() for files that are too large to be held
+        in memory.
 
         Examples
         --------
@@ -580,6 +944,131 @@ class LayerFile(object):
         rv[rv == nodata] = np.nan
         return rv
 
+    def iter_data(self, mflay=None, nodata=None, chunk=None, max_memory=None):
+        """
+        Iterate over the data in the file, one time or one block of times
+        at a time, so that the data for all times are never held in memory
+        at once.
+
+        Parameters
+        ----------
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+        nodata : float
+           The nodata value in the data array.  All array values that have
+           the nodata value will be assigned np.nan.  (Default is None.)
+        chunk : int
+           Number of times in a block.  If chunk and max_memory are None,
+           the data are returned one time at a time.  (Default is None.)
+        max_memory : int
+           Maximum number of bytes in a block.  (Default is None.)
+
+        Returns
+        ----------
+        out : generator
+            If chunk and max_memory are None, yields (kstpkper, totim, data)
+            for each time, with data as returned by get_data().  Otherwise,
+            yields (kstpkper, totim, data) for each block, with a list of
+            kstpkper values, an array of totim values and an array of size
+            (ntimes, nlay, nrow, ncol) or (ntimes, nrow, ncol) if mflay is
+            specified.  Blocks of data that are returned by get_data() as
+            lists, such as the layers of a HeadUFile, are returned as lists.
+
+        See Also
+        --------
+
+        Notes
+        -----
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('model.hds')
+        >>> for kstpkper, totim, h in hdobj.iter_data(max_memory=2**28):
+        ...     print(totim, h.shape)
+
+        """
+        kstpkper = self.get_kstpkper()
+        times = list(self.times)
+        nbytes = 0
+        if len(times) > 0:
+            records = self.recordarray[self.recordarray["totim"] == times[0]]
+            nbytes = self.nlay * int(
+                np.max(records["nrow"].astype(np.int64) * records["ncol"])
+            )
+            if mflay is not None:
+                nbytes //= max(self.nlay, 1)
+            nbytes *= np.dtype(self.realtype).itemsize
+        chunk = _get_chunk_size(nbytes, len(times), chunk, max_memory)
+
+        def _get_data(totim):
+            data = self.get_data(totim=totim, mflay=mflay)
+            if nodata is not None:
+                if isinstance(data, np.ndarray):
+                    data = np.where(data == nodata, np.nan, data)
+                else:
+                    data = [np.where(d == nodata, np.nan, d) for d in data]
+            return data
+
+        if chunk is None:
+            for kk, totim in zip(kstpkper, times):
+                yield kk, totim, _get_data(totim)
+            return
+
+        for i0 in range(0, len(times), chunk):
+            i1 = min(i0 + chunk, len(times))
+            block = None
+            for n, totim in enumerate(times[i0:i1]):
+                data = _get_data(totim)
+                if not isinstance(data, np.ndarray):
+                    # layers of different size are returned as lists
+                    block = [] if block is None else block
+                    block.append(data)
+                    continue
+                if block is None:
+                    block = np.empty((i1 - i0,) + data.shape, data.dtype)
+                block[n] = data
+            yield kstpkper[i0:i1], np.array(times[i0:i1]), block
+
+    def reduce(self, reducers, mflay=None, nodata=None, max_memory=2 ** 28):
+        """
+        Reduce the data for all times in the file without holding the data
+        for all times in memory at once.
+
+        Parameters
+        ----------
+        reducers : DataReducer or list of DataReducer
+            Reducers, such as flopy.utils.RunningMax(),
+            flopy.utils.RunningMean() or flopy.utils.ExceedanceCount(),
+            that are updated with the data.
+        mflay : integer
+           MODFLOW zero-based layer number to return.  If None, then all
+           all layers will be included. (Default is None.)
+        nodata : float
+           The nodata value in the data array.  All array values that have
+           the nodata value are ignored.  (Default is None.)
+        max_memory : int
+           Maximum number of bytes in a block of data.  (Default is 256 MB.)
+
+        Returns
+        ----------
+        out : numpy array or list of numpy arrays
+            The result of each reducer.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> hdobj = flopy.utils.HeadFile('model.hds')
+        >>> hmax, nexceed = hdobj.reduce([flopy.utils.RunningMax(),
+        ...                               flopy.utils.ExceedanceCount(10.)])
+
+        """
+        return _reduce(
+            self.iter_data(mflay=mflay, nodata=nodata, max_memory=max_memory),
+            reducers,
+        )
+
     def _read_data(self, shp):
         """
         Read data from file
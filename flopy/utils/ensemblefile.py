@@ -0,0 +1,240 @@
+"""
+Module to read ensembles of MODFLOW output files with the same layout, such
+as the head and budget files of the realizations of a Monte Carlo analysis.
+The module contains one important class that can be accessed by the user.
+
+*  EnsembleFile (Ensemble of head, concentration or budget files)
+
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .binaryfile import HeadFile
+
+
+class EnsembleFile(object):
+    """
+    EnsembleFile Class.
+
+    Opens a list of output files with the same layout, reusing the record
+    index of the first file for all other files, and reads the same records
+    or time series from all files in a thread pool.  Results are stacked
+    along a new first axis with one entry for each file.
+
+    Parameters
+    ----------
+    filenames : list of str
+        Names of the output files.  All files must have the same layout.
+    filetype : class
+        Class used to read each file, such as flopy.utils.HeadFile,
+        flopy.utils.UcnFile, flopy.utils.FormattedHeadFile or
+        flopy.utils.CellBudgetFile.  Default is flopy.utils.HeadFile.
+    max_workers : int
+        Maximum number of threads used to read the files.  If None, the
+        default of concurrent.futures.ThreadPoolExecutor is used.  If 1,
+        the files are read serially.  Default is None.
+    verbose : bool
+        Write information to the screen.  Default is False.
+    **kwargs : dict
+        Keyword arguments passed to filetype for each file, such as
+        precision, text or memmap.
+
+    Attributes
+    ----------
+    files : list
+        The open file objects, one for each file.
+
+    Methods
+    -------
+
+    See Also
+    --------
+
+    Notes
+    -----
+    The files are read with one thread for each file, so each file object
+    is only used by one thread at a time.  The record index of a file is
+    only reused if the file has the same size as the first file; otherwise
+    the headers of the file are read.
+
+    Examples
+    --------
+
+    >>> import flopy
+    >>> fnames = ['real{:03d}/model.hds'.format(i) for i in range(500)]
+    >>> with flopy.utils.EnsembleFile(fnames) as ens:
+    ...     heads = ens.get_data(totim=100.)  # (nreal, nlay, nrow, ncol)
+    ...     ts = ens.get_ts((0, 10, 10))  # (nreal, ntimes, 2)
+
+    """
+
+    def __init__(
+        self,
+        filenames,
+        filetype=HeadFile,
+        max_workers=None,
+        verbose=False,
+        **kwargs
+    ):
+        if len(filenames) == 0:
+            raise ValueError("EnsembleFile error: no filenames specified")
+        self.filenames = list(filenames)
+        self.filetype = filetype
+        self.max_workers = max_workers
+        self.verbose = verbose
+        self.files = []
+        try:
+            first = filetype(self.filenames[0], verbose=verbose, **kwargs)
+            self.files.append(first)
+            self.files += self._map(
+                lambda filename: filetype(
+                    filename, verbose=verbose, index=first, **kwargs
+                ),
+                self.filenames[1:],
+            )
+        except:
+            self.close()
+            raise
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.files)
+
+    def _map(self, func, items):
+        """
+        Apply func to items in the thread pool and return the results in
+        the order of items.
+
+        """
+        if self.max_workers == 1 or len(items) < 2:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, items))
+
+    def _call(self, name, *args, **kwargs):
+        """
+        Call the method name of each file in the thread pool and stack the
+        results along a new first axis.
+
+        """
+        if self.verbose:
+            print("Calling {} for {} files".format(name, len(self.files)))
+        results = self._map(
+            lambda f: getattr(f, name)(*args, **kwargs), self.files
+        )
+        return np.stack([np.asarray(result) for result in results])
+
+    def get_times(self):
+        """
+        Get a list of unique times in the files, which are taken from the
+        first file.
+
+        Returns
+        ----------
+        out : list of floats
+            List contains unique simulation times (totim) in the files.
+
+        """
+        return self.files[0].get_times()
+
+    def get_kstpkper(self):
+        """
+        Get a list of unique stress periods and time steps in the files,
+        which are taken from the first file.
+
+        Returns
+        ----------
+        out : list of (kstp, kper) tuples
+            List of unique kstp, kper combinations in the files.  kstp and
+            kper values are zero-based.
+
+        """
+        return self.files[0].get_kstpkper()
+
+    def get_data(self, *args, **kwargs):
+        """
+        Get the data from all files.  The arguments are passed to the
+        get_data() method of each file.
+
+        Returns
+        ----------
+        data : numpy array
+            Array with the result of get_data() for each file stacked along
+            the first axis.  For head files the shape is
+            (nreal, nlay, nrow, ncol), and for budget files the shape is
+            (nreal, nrecords, ...).
+
+        Examples
+        --------
+        >>> import flopy
+        >>> ens = flopy.utils.EnsembleFile(fnames, flopy.utils.CellBudgetFile)
+        >>> q = ens.get_data(text='STORAGE', kstpkper=(0, 0))
+
+        """
+        return self._call("get_data", *args, **kwargs)
+
+    def get_alldata(self, *args, **kwargs):
+        """
+        Get the data for all times from all files.  The arguments are
+        passed to the get_alldata() method of each file.
+
+        Returns
+        ----------
+        data : numpy array
+            Array of size (nreal, ntimes, nlay, nrow, ncol), or
+            (nreal, ntimes, nrow, ncol) if mflay is specified.
+
+        """
+        return self._call("get_alldata", *args, **kwargs)
+
+    def get_record(self, *args, **kwargs):
+        """
+        Get a single record from all budget files.  The arguments are
+        passed to the get_record() method of each file.
+
+        Returns
+        ----------
+        data : numpy array
+            Array with the result of get_record() for each file stacked
+            along the first axis.
+
+        """
+        return self._call("get_record", *args, **kwargs)
+
+    def get_ts(self, *args, **kwargs):
+        """
+        Get the time series for one or more cells from all files.  The
+        arguments are passed to the get_ts() method of each file.
+
+        Returns
+        ----------
+        ts : numpy array
+            Array of size (nreal, ntimes, nstations + 1), with the times in
+            the first column of the last axis.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> ens = flopy.utils.EnsembleFile(fnames)
+        >>> ts = ens.get_ts([(0, 10, 10), (0, 20, 20)])
+        >>> ts[:, :, 1].mean(axis=0)  # ensemble mean of the first cell
+
+        """
+        return self._call("get_ts", *args, **kwargs)
+
+    def close(self):
+        """
+        Close all file handles.
+
+        """
+        for f in self.files:
+            f.close()
+        return
@@ -3,6 +3,7 @@ Module for input/output utilities
 """
 import os
 import sys
+import warnings
 import numpy as np
 
 try:
@@ -484,27 +485,30 @@ def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
 
     # else, read ascii
     else:
-
-        for ii in range(nlist):
-
-            # first line was already read
-            if ii != 0:
-                line = file_handle.readline()
-
-            if model.free_format_input:
-                # whitespace separated
-                t = line.strip().split()
-                if len(t) < ncol:
-                    t = t + (ncol - len(t)) * [0.0]
+        # read the list as one block and convert it with numpy's text
+        # reader, falling back to reading one line at a time
+        lines = [line] + [file_handle.readline() for _ in range(1, nlist)]
+        data = _read_list_block(
+            lines[:nlist], ra.dtype, model.free_format_input
+        )
+        if data is not None:
+            ra[:nlist] = data
+        else:
+            for ii, line in enumerate(lines[:nlist]):
+                if model.free_format_input:
+                    # whitespace separated
+                    t = line.strip().split()
+                    if len(t) < ncol:
+                        t = t + (ncol - len(t)) * [0.0]
+                    else:
+                        t = t[:ncol]
+                    t = tuple(t)
+                    ra[ii] = t
                 else:
-                    t = t[:ncol]
-                t = tuple(t)
-                ra[ii] = t
-            else:
-                # fixed format
-                t = read_fixed_var(line, ncol=ncol)
-                t = tuple(t)
-                ra[ii] = t
+                    # fixed format
+                    t = read_fixed_var(line, ncol=ncol)
+                    t = tuple(t)
+                    ra[ii] = t
 
     # scale the data and check
     for column_name in sfac_columns:
@@ -516,3 +520,70 @@ def ulstrd(f, nlist, ra, model, sfac_columns, ext_unit_dict):
         file_handle.close()
 
     return ra
+
+
+def _read_list_block(lines, dtype, free, length=10):
+    """
+    Convert the lines of a list to a numpy array with numpy's text reader.
+
+    Parameters
+    ----------
+    lines : list of str
+        lines of the list, one for each row
+    dtype : np.dtype
+        dtype of the list, with one numeric field for each column
+    free : bool
+        boolean indicating if the lines are free format.  Otherwise each
+        column is length characters wide.
+    length : int
+        length of each column for fixed format lines. (default is 10)
+
+    Returns
+    -------
+    out : np.ndarray or None
+        the converted list, or None if the lines can not be converted in
+        one block, for example because of short rows, blank lines or
+        values that are not numbers.  The lines then need to be read one
+        at a time.
+
+    """
+    ncol = len(dtype.names)
+    if len(lines) == 0:
+        return None
+    for name in dtype.names:
+        if dtype[name].kind not in "iuf":
+            return None
+    try:
+        if free:
+            # whitespace separated, extra values at the end of a line
+            # are ignored
+            kwargs = {"usecols": range(ncol)}
+        else:
+            # cut the lines into columns and separate them with commas
+            nrow = len(lines)
+            text = np.array(lines, dtype="S{}".format(ncol * length))
+            columns = text.view(np.uint8).reshape(nrow, ncol, length)
+            # padding, tabs and line endings are blanks, blank columns are
+            # zero
+            columns[columns < ord(" ")] = ord(" ")
+            blank = text.view("S{}".format(length)).reshape(nrow, ncol)
+            blank = blank == b" " * length
+            chars = np.full((nrow, ncol, length + 1), ord(","), np.uint8)
+            chars[:, :, :length] = columns
+            chars[blank, -2] = ord("0")
+            chars[:, -1, -1] = ord("\n")
+            lines = chars.tobytes().decode().splitlines()
+            kwargs = {"delimiter": ","}
+        with warnings.catch_warnings():
+            # values that numpy only converts with a warning, such as
+            # integers written as floats, are read one line at a time
+            warnings.simplefilter("error")
+            data = np.loadtxt(
+                lines, dtype=dtype, comments=None, ndmin=1, **kwargs
+            )
+    except (ValueError, IndexError, TypeError, UnicodeError, Warning):
+        return None
+    if data.shape[0] != len(lines):
+        # blank lines are skipped by numpy
+        return None
+    return data
@@ -6,6 +6,7 @@ important classes that can be accessed by the user.
 
 """
 
+import re
 import numpy as np
 from ..utils.datafile import Header, LayerFile
 
@@ -26,6 +27,78 @@ def is_float(s):
         return False
 
 
+def get_field_width(format_string):
+    """
+    Get the width of a value written with a Fortran format, such as
+    '(10F10.3)' or '(10(1X1PE13.5))'.
+
+    Parameters
+    ----------
+    format_string : str
+        Fortran format string
+
+    Returns
+    -------
+    width : int
+        Number of characters of each value, or None if the width could not
+        be determined.
+
+    """
+    fmt = format_string.upper()
+    m = re.search(r"[EFGD][SN]?(\d+)", fmt)
+    if m is None:
+        return None
+    width = int(m.group(1))
+    for nx in re.findall(r"(\d*)X", fmt):
+        width += int(nx) if nx else 1
+    return width
+
+
+def parse_values(buf, count=None, width=None):
+    """
+    Convert a block of formatted text to an array of floats.  Values that
+    are separated by whitespace are converted in a single vectorized
+    call.  If that fails, for example because values of a fixed-width
+    Fortran format run into each other, the lines are sliced into fields
+    of width characters.
+
+    Parameters
+    ----------
+    buf : bytes
+        Block of text with one or more lines of values.
+    count : int
+        Number of values expected in buf.  (Default is None.)
+    width : int
+        Width of each value in a fixed-width format.  (Default is None.)
+
+    Returns
+    -------
+    values : numpy array
+        One dimensional array of float64 values.
+
+    """
+    values = buf.split()
+    if count is None or len(values) == count:
+        try:
+            return np.array(values, dtype=np.float64)
+        except ValueError:
+            pass
+    if width:
+        text = b"".join(buf.splitlines())
+        if len(text) % width == 0:
+            try:
+                values = np.frombuffer(text, dtype="S{}".format(width))
+                values = values.astype(np.float64)
+                if count is None or len(values) == count:
+                    return values
+            except ValueError:
+                pass
+    raise Exception(
+        "Invalid data encountered while reading data file."
+        + " Unable to convert data to float."
+    )
+
+
 class FormattedHeader(Header):
     """
     The TextHeader class is a class to read in headers from MODFLOW
@@ -108,6 +181,15 @@ class FormattedLayerFile(LayerFile):
 
     """
 
+    _index_attributes = LayerFile._index_attributes + (
+        "header",
+        "_col_data_size",
+        "_data_size",
+        "_line_size",
+        "_line_count",
+        "_width",
+    )
+
     def __init__(self, filename, precision, verbose, kwargs):
         super(FormattedLayerFile, self).__init__(
             filename, precision, verbose, kwargs
@@ -140,6 +222,7 @@ class FormattedLayerFile(LayerFile):
         self._store_record(header_info, ipos)
 
         # Process enough data to calculate seek distance between headers
+        self._width = get_field_width(self.header.format_string)
         self._col_data_size = self._get_data_size(header_info)
         self._data_size = self._col_data_size * self.nrow
 
@@ -186,65 +269,23 @@ class FormattedLayerFile(LayerFile):
         Read 2-D data from file
 
         """
-
         nrow, ncol = shp
-        current_row = 0
-        current_col = 0
-        result = np.empty((nrow, ncol), self.realtype)
-        # Loop until all data retrieved or eof
-        while (
-            current_row < nrow or current_col < ncol
-        ) and self.file.tell() != self.totalbytes:
-            line = self.file.readline()
-
-            # Read data into 2-D array
-            arrline = line.split()
-            for val in arrline:
-                if not is_float(val):
-                    raise Exception(
-                        "Invalid data encountered while reading data file."
-                        + " Unable to convert data to float."
-                    )
-                result[current_row, current_col] = float(val)
-                current_col += 1
-                if current_col >= ncol:
-                    current_row += 1
-                    if current_row < nrow:
-                        current_col = 0
-
-        if current_row < nrow - 1 or current_col < ncol - 1:
-            raise Exception("Unexpected end of file while reading data.")
-
-        return result
+        buf = self.file.read(nrow * self._col_data_size)
+        values = parse_values(buf, nrow * ncol, self._width)
+        return values.reshape(shp).astype(self.realtype)
 
     def _read_val(self, i):
         """
-        Read ith data value from file
+        Read ith data value from file, starting at the beginning of a row.
+        Only the line holding the value is read.
 
         """
-        current_col = 0
-        result = None
-        # Loop until data retrieved or eof
-        while (
-            current_col < self.ncol - 1 or self.file.tell() == self.totalbytes
-        ) and current_col <= i:
-            line = self.file.readline()
-            arrline = line.split()
-            for val in arrline:
-                if not is_float(val):
-                    raise Exception(
-                        "Invalid data encountered while reading data file."
-                        + " Unable to convert data to float."
-                    )
-                result = float(val)
-                current_col = current_col + 1
-                if current_col > i:
-                    break
-
-        if (current_col < self.ncol - 1) and (current_col < i):
+        nline, ival = divmod(i, self._line_count)
+        self.file.seek(nline * self._line_size, 1)
+        values = parse_values(self.file.readline(), width=self._width)
+        if ival >= len(values):
             raise Exception("Unexpected end of file while reading data.")
-
-        return result
+        return values[ival]
 
     def get_ts(self, idx):
         """
@@ -282,22 +323,20 @@ class FormattedLayerFile(LayerFile):
         # Initialize result array and put times in first column
         result = self._init_result(nstation)
 
+        # time index of each record
+        itims = {totim: itim for itim, totim in enumerate(self.times)}
+        ilays = self.recordarray["ilay"] - 1
+
         istat = 1
         for k, i, j in kijlist:
             ioffset_col = i * self._col_data_size
-            for irec, header in enumerate(self.recordarray):
-                # change ilay from header to zero-based
-                ilay = header["ilay"] - 1
-                if ilay != k:
+            for irec in np.where(ilays == k)[0]:
+                itim = itims.get(self.recordarray["totim"][irec])
+                if itim is None:
                     continue
-                ipos = self.iposarray[irec]
-
-                # Calculate offset necessary to reach intended column
-                self.file.seek(ipos + ioffset_col, 0)
-
-                # Find the time index and then put value into result in the
-                # correct location.
-                itim = np.where(result[:, 0] == header["totim"])[0]
+                # Calculate offset necessary to reach intended row, and
+                # read only the line holding the intended column
+                self.file.seek(self.iposarray[irec] + ioffset_col, 0)
                 result[itim, istat] = self._read_val(j)
             istat += 1
         return result
@@ -325,6 +364,11 @@ class FormattedHeadFile(FormattedLayerFile):
         'single' or 'double'.  Default is 'single'.
     verbose : bool
         Write information to the screen.  Default is False.
+    index : FormattedHeadFile
+        Open FormattedHeadFile with the same layout as this file, such as
+        another realization of an ensemble.  Its record index is reused
+        instead of reading the headers of this file, if both files have
+        the same size.  Default is None.
 
     Attributes
     ----------
@@ -394,7 +438,11 @@ class FormattedHeadFile(FormattedLayerFile):
         # Loop through data until at end of column
         while data_count < header["ncol"]:
             column_data = self.file.readline()
-            arr_column_data = column_data.split()
+            arr_column_data = parse_values(column_data, width=self._width)
+            if data_count == 0:
+                # size and number of values of a full line of data
+                self._line_size = len(column_data)
+                self._line_count = max(len(arr_column_data), 1)
             data_count += len(arr_column_data)
 
         if data_count != header["ncol"]:
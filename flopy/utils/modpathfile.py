@@ -472,6 +472,39 @@ class PathlineFile:
 
         return pthldes
 
+    def to_parquet(self, filename, chunk=100000, **kwargs):
+        """
+        Export all pathline data to a Parquet file, with a column for each
+        field of the data returned by get_alldata().  The data are written
+        in row groups of chunk rows.  Requires pyarrow.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the Parquet file.
+        chunk : int
+            Number of rows in a row group.  (Default is 100000.)
+        **kwargs : dict
+            Keyword arguments passed to pyarrow.parquet.ParquetWriter.
+
+        Returns
+        ----------
+        nrows : int
+            Number of rows written.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> pobj = flopy.utils.PathlineFile('model.mppth')
+        >>> pobj.to_parquet('pathlines.parquet')
+
+        """
+        from ..export.columnar import recarray_batches, write_parquet
+
+        return write_parquet(
+            filename, recarray_batches(self._data, chunk), **kwargs
+        )
+
     def write_shapefile(
         self,
         pathline_data=None,
@@ -1093,6 +1126,39 @@ class EndpointFile:
         epdest = ra[inds].copy().view(np.recarray)
         return epdest
 
+    def to_parquet(self, filename, chunk=100000, **kwargs):
+        """
+        Export all endpoint data to a Parquet file, with a column for each
+        field of the data returned by get_alldata().  The data are written
+        in row groups of chunk rows.  Requires pyarrow.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the Parquet file.
+        chunk : int
+            Number of rows in a row group.  (Default is 100000.)
+        **kwargs : dict
+            Keyword arguments passed to pyarrow.parquet.ParquetWriter.
+
+        Returns
+        ----------
+        nrows : int
+            Number of rows written.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> pobj = flopy.utils.EndpointFile('model.mpend')
+        >>> pobj.to_parquet('endpoints.parquet')
+
+        """
+        from ..export.columnar import recarray_batches, write_parquet
+
+        return write_parquet(
+            filename, recarray_batches(self._data, chunk), **kwargs
+        )
+
     def write_shapefile(
         self,
         endpoint_data=None,
@@ -1,3 +1,5 @@
+import io
+import time
 import numpy as np
 
 from ..utils.utils_def import FlopyBinaryData
@@ -121,6 +123,39 @@ class ObsFiles(FlopyBinaryData):
             r = get_selection(self.data, obsname)[i0:i1]
         return r
 
+    def to_parquet(self, filename, chunk=100000, **kwargs):
+        """
+        Export the observations to a Parquet file, with the column totim
+        and a column for each observation.  The observations are written in
+        row groups of chunk times, so that queries for a range of times only
+        read the row groups they need.  Requires pyarrow.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the Parquet file.
+        chunk : int
+            Number of times in a row group.  (Default is 100000.)
+        **kwargs : dict
+            Keyword arguments passed to pyarrow.parquet.ParquetWriter.
+
+        Returns
+        ----------
+        nrows : int
+            Number of rows written.
+
+        Examples
+        --------
+        >>> obs = Mf6Obs('my_model.obs.csv', isBinary=False)
+        >>> obs.to_parquet('my_model_obs.parquet')
+
+        """
+        from ..export.columnar import recarray_batches, write_parquet
+
+        return write_parquet(
+            filename, recarray_batches(self.data, chunk), **kwargs
+        )
+
     def get_dataframe(
         self,
         start_datetime="1-1-1970",
@@ -280,6 +315,7 @@ class Mf6Obs(ObsFiles):
         super(Mf6Obs, self).__init__()
         # initialize class information
         self.verbose = verbose
+        self.isBinary = isBinary
         if isBinary:
             # --open binary head file
             self.file = open(filename, "rb")
@@ -312,14 +348,16 @@ class Mf6Obs(ObsFiles):
             # build index
             self._build_index()
 
-            self.data = None
-            self._read_data()
+            # read binary data
+            self._indexed = self.file.tell()
+            self.data = np.empty(0, dtype=self.dtype)
+            self.refresh()
         else:
-            # --open binary head file
-            self.file = open(filename, "r")
+            # --open ascii observation file
+            self.file = open(filename, "rb")
 
             # read header line
-            line = self.file.readline()
+            line = self.file.readline().decode()
             t = line.rstrip().split(",")
             self.set_float("double")
 
@@ -339,11 +377,90 @@ class Mf6Obs(ObsFiles):
             self._build_index()
 
             # read ascii data
-            self.data = np.loadtxt(
-                self.file, dtype=self.dtype, delimiter=",", ndmin=1
-            )
+            self._indexed = self.file.tell()
+            self.data = np.empty(0, dtype=self.dtype)
+            self.refresh()
         return
 
+    def refresh(self):
+        """
+        Read the observations that were written to the file since it was
+        last read, for example by a simulation that is still running.  The
+        file is only read from the end of the last complete record and a
+        partially written trailing record is not read.
+
+        Returns
+        -------
+        ntimes : int
+            The number of simulation times added to the data.
+
+        """
+        self.file.seek(0, 2)
+        totalbytes = self.file.tell()
+        self.file.seek(self._indexed, 0)
+        if self.isBinary:
+            nrec = (totalbytes - self._indexed) // self.dtype.itemsize
+            if nrec < 1:
+                return 0
+            r = self.read_record(count=nrec)
+            self._indexed += nrec * self.dtype.itemsize
+        else:
+            buf = self.file.read(totalbytes - self._indexed)
+            # only read complete lines
+            iend = buf.rfind(b"\n") + 1
+            if iend < 1:
+                return 0
+            r = np.loadtxt(
+                io.StringIO(buf[:iend].decode()),
+                dtype=self.dtype,
+                delimiter=",",
+                ndmin=1,
+            )
+            self._indexed += iend
+        self.data = np.concatenate((self.data, r))
+        return r.shape[0]
+
+    def follow(self, interval=1.0, timeout=None):
+        """
+        Generator that polls the file for new observations and yields the
+        observations for each simulation time as soon as they have been
+        completely written.
+
+        Parameters
+        ----------
+        interval : float
+            Number of seconds to wait between polls of the file.
+            (default is 1.)
+        timeout : float
+            Stop when no new observations have been written for timeout
+            seconds. If timeout is None, the generator polls until it is
+            closed. (default is None)
+
+        Returns
+        -------
+        out : generator of numpy records
+            Each record contains totim and the value of each observation.
+
+        Examples
+        --------
+        >>> import flopy
+        >>> obs = flopy.utils.Mf6Obs('model.obs.csv', isBinary=False)
+        >>> for rec in obs.follow(interval=5., timeout=600.):
+        ...     print(rec['totim'])
+
+        """
+        irec = self.data.shape[0]
+        tlast = time.time()
+        while True:
+            if self.refresh() > 0:
+                tlast = time.time()
+            while irec < self.data.shape[0]:
+                yield self.data[irec]
+                irec += 1
+            if timeout is not None and time.time() - tlast >= timeout:
+                return
+            time.sleep(interval)
+
     def _build_dtype(self):
 
         # create dtype
@@ -12,8 +12,12 @@ from __future__ import division, print_function
 import os
 import shutil
 import copy
+import hashlib
+import weakref
+from collections import OrderedDict
+from itertools import islice
 import numpy as np
-from warnings import warn
+from warnings import warn, catch_warnings, simplefilter
 from ..utils.binaryfile import BinaryHeader
 from ..utils.flopy_io import line_parse
 from ..datbase import DataType, DataInterface
@@ -545,17 +549,8 @@ class Util3d(DataInterface):
             self._model = model
             self.array_free_format = array_free_format
             for i, u2d in enumerate(self.util_2ds):
-                self.util_2ds[i] = Util2d(
-                    model,
-                    u2d.shape,
-                    u2d.dtype,
-                    u2d._array,
-                    name=u2d.name,
-                    fmtin=u2d.format.fortran,
-                    locat=locat,
-                    cnstnt=u2d.cnstnt,
-                    ext_filename=u2d.filename,
-                    array_free_format=array_free_format,
+                self.util_2ds[i] = u2d._copy(
+                    model, locat=locat, array_free_format=array_free_format
                 )
 
             return
@@ -1352,6 +1347,10 @@ class Transient2d(DataInterface):
 
     Notes
     -----
+    Stress periods with identical array values share one array. Package
+    writers that call get_kper_entry with reuse=True write a stress period
+    that repeats the previous one as reusing the previous array
+    (itmp = -1).
 
     Examples
     --------
@@ -1378,17 +1377,8 @@ class Transient2d(DataInterface):
             for attr in value.__dict__.items():
                 setattr(self, attr[0], attr[1])
             for kper, u2d in self.transient_2ds.items():
-                self.transient_2ds[kper] = Util2d(
-                    model,
-                    u2d.shape,
-                    u2d.dtype,
-                    u2d._array,
-                    name=u2d.name,
-                    fmtin=u2d.format.fortran,
-                    locat=locat,
-                    cnstnt=u2d.cnstnt,
-                    ext_filename=u2d.filename,
-                    array_free_format=array_free_format,
+                self.transient_2ds[kper] = u2d._copy(
+                    model, locat=locat, array_free_format=array_free_format
                 )
 
             self._model = model
@@ -1419,6 +1409,8 @@ class Transient2d(DataInterface):
             )
         else:
             self.ext_filename_base = self.name_base.replace(" ", "_")
+        # array values keyed on their content, shared between kpers
+        self._shared_arrays = {}
         self.transient_2ds = self.build_transient_sequence()
         return
 
@@ -1698,18 +1690,45 @@ class Transient2d(DataInterface):
 
         return export.utils.transient2d_export(f, self, **kwargs)
 
-    def get_kper_entry(self, kper):
+    def get_kper_entry(self, kper, reuse=False):
         """
         Get the file entry info for a given kper
         returns (itmp,file entry string from Util2d)
+
+        If reuse is True, a kper with the same array values and multiplier
+        as the previous kper returns (-1,''), for package files in which a
+        negative itmp reuses the array of the previous stress period.
         """
         if kper in self.transient_2ds:
+            if reuse and self.__is_repeat(kper):
+                return (-1, "")
             return (1, self.transient_2ds[kper].get_file_entry())
         elif kper < min(self.transient_2ds.keys()):
             return (1, self.get_zero_2d(kper).get_file_entry())
         else:
             return (-1, "")
 
+    def __is_repeat(self, kper):
+        """
+        check if the array for kper has the same values as for kper - 1
+        """
+        last = self.transient_2ds.get(kper - 1)
+        if last is None:
+            if kper - 1 < min(self.transient_2ds.keys()):
+                return False
+            last = self[kper - 1]
+        u2d = self.transient_2ds[kper]
+        if (
+            u2d.vtype != np.ndarray
+            or last.vtype != np.ndarray
+            or u2d.cnstnt != last.cnstnt
+        ):
+            return False
+        # identical arrays usually share one array, see _share_array
+        return u2d._array is last._array or np.array_equal(
+            u2d._array, last._array
+        )
+
     def build_transient_sequence(self):
         """
         parse self.__value into a dict{kper:Util2d}
@@ -1790,6 +1809,7 @@ class Transient2d(DataInterface):
             locat=self.locat,
             array_free_format=self.array_free_format,
         )
+        u2d._share_array(self._shared_arrays)
         return u2d
 
 
@@ -1875,6 +1895,20 @@ class Util2d(DataInterface):
 
     """
 
+    # size in characters of the blocks of text converted at once by load_txt
+    _text_chunk_size = 2 ** 20
+    # characters that separate values in text arrays
+    _blank_chars = np.zeros(256, dtype=bool)
+    _blank_chars[[0, 9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+    # characters of repeat counts in free format text arrays
+    _count_chars = np.zeros(256, dtype=bool)
+    _count_chars[np.frombuffer(b"+-0123456789", dtype=np.uint8)] = True
+    # maximum number of arrays read from file values that are kept in memory
+    lazy_cache_size = 100
+    # Util2d instances holding arrays read from file values, least recently
+    # used first
+    _lazy_cache = OrderedDict()
+
     def __init__(
         self,
         model,
@@ -1975,6 +2009,7 @@ class Util2d(DataInterface):
         if self.vtype == str:
             fmtin = "(FREE)"
         self.__value_built = None
+        self._source_filename = None
         self.cnstnt = dtype(cnstnt)
 
         self.iprn = iprn
@@ -2164,6 +2199,52 @@ class Util2d(DataInterface):
     def get_value(self):
         return copy.deepcopy(self.__value)
 
+    def _copy(self, model, locat=None, array_free_format=None):
+        """
+        Copy this array for model.  A file value is copied as a reference
+        to the file, so the file is not read.
+
+        """
+        if self.vtype == str:
+            value = self.__value
+        else:
+            value = self._array
+        u2d = Util2d(
+            model,
+            self.shape,
+            self.dtype,
+            value,
+            name=self.name,
+            fmtin=self.format.fortran,
+            locat=locat,
+            cnstnt=self.cnstnt,
+            ext_filename=self.filename,
+            array_free_format=array_free_format,
+        )
+        if self.vtype == str:
+            u2d.set_fmtin(self.format.fortran)
+            u2d._source_filename = self._source_filename
+        return u2d
+
+    def _share_array(self, arrays):
+        """
+        Replace an array value with an identical array in arrays, a dict of
+        arrays keyed on their content, or add the array value to arrays.
+
+        """
+        if self.vtype != np.ndarray:
+            return
+        value = self.__value
+        key = (value.dtype.str, value.shape)
+        key += (hashlib.sha1(value.tobytes()).hexdigest(),)
+        shared = arrays.get(key)
+        if shared is value:
+            return
+        if shared is not None and np.array_equal(shared, value):
+            self.__value = shared
+        else:
+            arrays[key] = value
+
     # overloads, tries to avoid creating arrays if possible
     def __add__(self, other):
         if self.vtype in [np.int32, np.float32] and self.vtype == other.vtype:
@@ -2308,6 +2389,8 @@ class Util2d(DataInterface):
                 filename = os.path.split(self.ext_filename)[-1]
             else:
                 filename = os.path.split(self._ext_filename)[-1]
+        elif self._source_filename is not None:
+            filename = self._source_filename
         else:
             filename = os.path.split(self.__value)[-1]
         return filename
@@ -2490,7 +2573,10 @@ class Util2d(DataInterface):
                         fortran_format=self.format.fortran,
                     )
 
-            elif self.__value != self.python_file_path:
+            elif not (
+                os.path.exists(self.python_file_path)
+                and os.path.samefile(self.__value, self.python_file_path)
+            ):
                 if os.path.exists(self.python_file_path):
                     # if the file already exists, remove it
                     if self._model.verbose:
@@ -2507,6 +2593,9 @@ class Util2d(DataInterface):
                         )
                 # copy the file to the new model location
                 try:
+                    path = os.path.dirname(self.python_file_path)
+                    if path and not os.path.isdir(path):
+                        os.makedirs(path)
                     shutil.copy2(self.__value, self.python_file_path)
                 except Exception as e:
                     raise Exception(
@@ -2598,18 +2687,22 @@ class Util2d(DataInterface):
         """
         if self.vtype == str:
             if self.__value_built is None:
-                file_in = open(self.__value, "r")
-
                 if self.format.binary:
-                    header, self.__value_built = Util2d.load_bin(
-                        self.shape, file_in, self._dtype, bintype="head"
-                    )
+                    with open(self.__value, "rb") as file_in:
+                        header, self.__value_built = Util2d.load_bin(
+                            self.shape, file_in, self._dtype, bintype="head"
+                        )
                 else:
-                    self.__value_built = Util2d.load_txt(
-                        self.shape, file_in, self._dtype, self.format.fortran
-                    ).astype(self._dtype)
-                file_in.close()
-            return self.__value_built
+                    with open(self.__value, "r") as file_in:
+                        self.__value_built = Util2d.load_txt(
+                            self.shape,
+                            file_in,
+                            self._dtype,
+                            self.format.fortran,
+                        ).astype(self._dtype)
+            value = self.__value_built
+            self._cache_value_built()
+            return value
         elif self.vtype != np.ndarray:
             if self.__value_built is None:
                 self.__value_built = (
@@ -2619,6 +2712,23 @@ class Util2d(DataInterface):
         else:
             return self.__value
 
+    def _cache_value_built(self):
+        """
+        Mark the array read from the file value as the most recently used,
+        releasing the least recently used arrays read from file values when
+        there are more than lazy_cache_size of them.
+
+        """
+        cache = Util2d._lazy_cache
+        key = id(self)
+        if key in cache:
+            cache.move_to_end(key)
+        cache[key] = weakref.ref(self)
+        while len(cache) > Util2d.lazy_cache_size:
+            u2d = cache.popitem(last=False)[1]()
+            if u2d is not None:
+                u2d.__value_built = None
+
     @staticmethod
     def load_block(shape, file_in, dtype):
         """Load block format from a MT3D file to a 2-D array
@@ -2704,14 +2814,150 @@ class Util2d(DataInterface):
         if openfile:
             file_in = open(file_in, "r")
         npl, fmt, width, decimal = ArrayFormat.decode_fortran_descriptor(fmtin)
-        items = []
-        while len(items) < num_items:
-            line = file_in.readline()
-            if len(line) == 0:
+        if npl == "free":
+            data = Util2d._load_txt_free(file_in, num_items, dtype)
+        else:
+            data = Util2d._load_txt_fixed(
+                file_in, num_items, dtype, npl, width
+            )
+        if openfile:
+            file_in.close()
+        if data.size != num_items:
+            raise ValueError(
+                "Util2d.load_txt(): expected array size {0},"
+                " but found size {1}".format(num_items, data.size)
+            )
+        return data.reshape(shape)
+
+    @staticmethod
+    def _load_txt_free(file_in, num_items, dtype):
+        """Read num_items free format values from file_in in blocks of
+        text, leaving file_in at the end of the last line of values."""
+        data = np.empty(num_items, dtype=dtype)
+        size = 0
+        while size < num_items:
+            remaining = num_items - size
+            try:
+                position = file_in.tell()
+            except (OSError, ValueError):
+                # the file position is not available, read one line
+                position = None
+            if position is None:
+                text = file_in.readline()
+            else:
+                text = file_in.read(
+                    min(Util2d._text_chunk_size, 32 * remaining)
+                )
+                if len(text) > 0 and text[-1] != "\n":
+                    # complete the last line of the block
+                    text += file_in.readline()
+            if len(text) == 0:
                 raise ValueError("Util2d.load_txt(): no data found")
+            values, num_lines = Util2d._free_text_to_values(
+                text, dtype, remaining
+            )
+            data[size : size + values.size] = values
+            size += values.size
+            if num_lines is not None and position is not None:
+                # values end before the end of the block, move the file
+                # position to the end of the last line of values
+                file_in.seek(position)
+                for _ in range(num_lines):
+                    file_in.readline()
+        return data
+
+    @staticmethod
+    def _load_txt_fixed(file_in, num_items, dtype, npl, width):
+        """Read num_items values in columns of width characters, npl
+        columns per line, from file_in."""
+        data = np.empty(num_items, dtype=dtype)
+        size = 0
+        while size < num_items:
+            remaining = num_items - size
+            # each line has at most npl values, so at least this many lines
+            # are needed
+            num_lines = -(-remaining // npl)
+            lines = list(islice(iter(file_in.readline, ""), num_lines))
+            if len(lines) < num_lines:
+                raise ValueError("Util2d.load_txt(): no data found")
+            values = Util2d._fixed_text_to_values(lines, dtype, npl, width)
+            if values is None:
+                values = Util2d._items_to_values(
+                    lines, dtype, remaining, npl, width
+                )[0]
+            values = values[:remaining]
+            data[size : size + values.size] = values
+            size += values.size
+        return data
+
+    @staticmethod
+    def _free_text_to_values(text, dtype, max_size):
+        """Convert up to max_size free format values from text.  Returns
+        the values and, if text has max_size or more values, the number of
+        lines of text spanned by the values, otherwise None."""
+        text = text.replace(",", " ")
+        try:
+            text.encode("ascii")
+            ascii_text = "\x00" not in text
+        except UnicodeError:
+            ascii_text = False
+        if not ascii_text:
+            return Util2d._items_to_values(text.split("\n"), dtype, max_size)
+        if "*" not in text:
+            with catch_warnings(record=True) as parse_warn:
+                simplefilter("always")
+                values = np.fromstring(text, dtype=dtype, sep=" ")
+            complete = len(parse_warn) == 0
+            # if the conversion stopped early, the last value may only be
+            # part of a token
+            if values.size > max_size or (
+                complete and values.size == max_size
+            ):
+                num_lines = Util2d._count_lines(text, max_size - 1)
+                return values[:max_size], num_lines
+            elif complete:
+                return values, None
+        else:
+            result = Util2d._repeat_text_to_values(text, dtype, max_size)
+            if result is not None:
+                return result
+        # text numpy can not convert, such as integers written as floats, is
+        # split into items one line at a time
+        return Util2d._items_to_values(text.split("\n"), dtype, max_size)
+
+    @staticmethod
+    def _fixed_text_to_values(lines, dtype, npl, width):
+        """Convert the values in columns of width characters, npl columns
+        per line, of lines.  Blank columns are skipped.  Returns None if
+        the values can not be converted at once."""
+        nrow = len(lines)
+        try:
+            text = np.array(lines, dtype="S{}".format(npl * width))
+        except UnicodeError:
+            return None
+        # cut the lines into columns and separate them with blanks
+        columns = text.view(np.uint8).reshape(nrow, npl, width)
+        columns[columns < ord(" ")] = ord(" ")
+        blank = text.view("S{}".format(width)) == b" " * width
+        chars = np.full((nrow, npl, width + 1), ord(" "), dtype=np.uint8)
+        chars[:, :, :width] = columns
+        with catch_warnings(record=True) as parse_warn:
+            simplefilter("always")
+            values = np.fromstring(chars.tobytes(), dtype=dtype, sep=" ")
+        # each column that is not blank must hold exactly one value
+        num_columns = blank.size - np.count_nonzero(blank)
+        if len(parse_warn) > 0 or values.size != num_columns:
+            return None
+        return values
+
+    @staticmethod
+    def _items_to_values(lines, dtype, max_size, npl="free", width=None):
+        """Split lines into items one line at a time until max_size items
+        are found and convert them.  Returns the values and, if max_size
+        items were found, the number of lines used, otherwise None."""
+        items = []
+        for num_lines, line in enumerate(lines, 1):
             if npl == "free":
-                if "," in line:
-                    line = line.replace(",", " ")
                 if "*" in line:  # use slower method for these types of lines
                     for item in line.split():
                         if "*" in item:
@@ -2725,22 +2971,90 @@ class Util2d(DataInterface):
             else:  # fixed width
                 pos = 0
                 for i in range(npl):
-                    try:
-                        item = line[pos : pos + width].strip()
-                        pos += width
-                        if item:
-                            items.append(item)
-                    except IndexError:
-                        break
-        if openfile:
-            file_in.close()
-        data = np.fromiter(items, dtype=dtype, count=num_items)
-        if data.size != num_items:
-            raise ValueError(
-                "Util2d.load_txt(): expected array size {0},"
-                " but found size {1}".format(num_items, data.size)
+                    item = line[pos : pos + width].strip()
+                    pos += width
+                    if item:
+                        items.append(item)
+            if len(items) >= max_size:
+                values = np.fromiter(items, dtype=dtype, count=max_size)
+                return values, num_lines
+        values = np.fromiter(items, dtype=dtype, count=len(items))
+        return values, None
+
+    @staticmethod
+    def _repeat_text_to_values(text, dtype, max_size):
+        """Convert up to max_size free format values with repeat counts,
+        n*value, from text.  Returns the values and, if text has max_size or
+        more values, the number of lines of text spanned by the values,
+        otherwise None.  Returns None if the values can not be converted
+        at once."""
+        chars, starts = Util2d._token_starts(text)
+        stars = np.flatnonzero(chars == ord("*"))
+        token = np.searchsorted(starts, stars, side="right") - 1
+        # each "*" is in a different token, between a count of digits and a
+        # value
+        not_count = np.r_[0, np.cumsum(~Util2d._count_chars[chars])]
+        if (
+            np.any(np.diff(token) == 0)
+            or np.any(starts[token] == stars)
+            or stars[-1] == chars.size - 1
+            or np.any(Util2d._blank_chars[chars[stars + 1]])
+            or np.any(not_count[stars] != not_count[starts[token]])
+        ):
+            return None
+        repeat = np.zeros(starts.size, dtype=bool)
+        repeat[token] = True
+        # convert counts and values as separate numbers
+        if np.dtype(dtype).kind == "f":
+            number_dtype = np.float64
+        else:
+            number_dtype = dtype
+        with catch_warnings(record=True) as parse_warn:
+            simplefilter("always")
+            numbers = np.fromstring(
+                text.replace("*", " "), dtype=number_dtype, sep=" "
             )
-        return data.reshape(shape)
+        num_converted = numbers.size
+        if len(parse_warn) > 0:
+            # the last number may only be partly converted
+            num_converted -= 1
+        # index in numbers of the value of each token, and the tokens that
+        # were converted completely
+        value_index = np.arange(starts.size) + np.cumsum(repeat)
+        num_tokens = np.searchsorted(value_index, num_converted)
+        value_index = value_index[:num_tokens]
+        repeat = repeat[:num_tokens]
+        counts = np.ones(num_tokens, dtype=int)
+        counts[repeat] = numbers[value_index[repeat] - 1]
+        if np.any(counts < 0):
+            return None
+        total = np.cumsum(counts)
+        if num_tokens > 0 and total[-1] >= max_size:
+            last = np.searchsorted(total, max_size)
+            values = np.repeat(
+                numbers[value_index[: last + 1]], counts[: last + 1]
+            )
+            num_lines = np.count_nonzero(chars[: starts[last]] == ord("\n"))
+            return values[:max_size].astype(dtype), num_lines + 1
+        elif len(parse_warn) == 0 and num_tokens == starts.size:
+            return np.repeat(numbers[value_index], counts).astype(dtype), None
+        return None
+
+    @staticmethod
+    def _token_starts(text):
+        """Characters of ascii text and the indexes where tokens separated
+        by whitespace start."""
+        chars = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        blank = Util2d._blank_chars[chars]
+        starts = np.flatnonzero(~blank & np.r_[True, blank[:-1]])
+        return chars, starts
+
+    @staticmethod
+    def _count_lines(text, index):
+        """Number of lines of text up to the line with the token at index,
+        with tokens separated by whitespace."""
+        chars, starts = Util2d._token_starts(text)
+        return np.count_nonzero(chars[: starts[index]] == ord("\n")) + 1
 
     @staticmethod
     def write_txt(
@@ -3046,6 +3360,7 @@ class Util2d(DataInterface):
             fname = fname.replace("'", "")
             fname = fname.replace('"', "")
             fname = fname.replace("\\", os.path.sep)
+            source_filename = fname
             fname = os.path.join(model.model_ws, fname)
             # load_txt(shape, file_in, dtype, fmtin):
             assert os.path.exists(fname), (
@@ -3054,28 +3369,44 @@ class Util2d(DataInterface):
                 + str(fname)
                 + " not found"
             )
-            if str("binary") not in str(cr_dict["fmtin"].lower()):
-                f = open(fname, "r")
-                data = Util2d.load_txt(
-                    shape=shape, file_in=f, dtype=dtype, fmtin=cr_dict["fmtin"]
+            u2d = None
+            if getattr(model, "lazy_load", False):
+                u2d = cls._load_file_reference(
+                    model,
+                    shape,
+                    dtype,
+                    name,
+                    fname,
+                    source_filename,
+                    cr_dict,
+                    array_free_format,
                 )
-            else:
-                f = open(fname, "rb")
-                header_data, data = Util2d.load_bin(
-                    shape, f, dtype, bintype="Head"
+            if u2d is None:
+                if str("binary") not in str(cr_dict["fmtin"].lower()):
+                    f = open(fname, "r")
+                    data = Util2d.load_txt(
+                        shape=shape,
+                        file_in=f,
+                        dtype=dtype,
+                        fmtin=cr_dict["fmtin"],
+                    )
+                else:
+                    f = open(fname, "rb")
+                    header_data, data = Util2d.load_bin(
+                        shape, f, dtype, bintype="Head"
+                    )
+                f.close()
+                u2d = cls(
+                    model,
+                    shape,
+                    dtype,
+                    data,
+                    name=name,
+                    iprn=cr_dict["iprn"],
+                    fmtin="(FREE)",
+                    cnstnt=cr_dict["cnstnt"],
+                    array_free_format=array_free_format,
                 )
-            f.close()
-            u2d = cls(
-                model,
-                shape,
-                dtype,
-                data,
-                name=name,
-                iprn=cr_dict["iprn"],
-                fmtin="(FREE)",
-                cnstnt=cr_dict["cnstnt"],
-                array_free_format=array_free_format,
-            )
 
         elif cr_dict["type"] == "internal":
             data = Util2d.load_txt(shape, f_handle, dtype, cr_dict["fmtin"])
@@ -3125,7 +3456,7 @@ class Util2d(DataInterface):
             )
             # track this unit number so we can remove it from the external
             # file list later
-            model.pop_key_list.append(cr_dict["nunit"])
+            model.add_pop_key_list(cr_dict["nunit"])
         elif cr_dict["type"] == "block":
             data = Util2d.load_block(shape, f_handle, dtype)
             u2d = cls(
@@ -3143,6 +3474,42 @@ class Util2d(DataInterface):
 
         return u2d
 
+    @classmethod
+    def _load_file_reference(
+        cls,
+        model,
+        shape,
+        dtype,
+        name,
+        fname,
+        source_filename,
+        cr_dict,
+        array_free_format,
+    ):
+        """
+        Create a Util2d instance that keeps a reference to an open/close
+        file instead of reading it.  The file is read when the array is
+        used, and copied when the array is written unchanged.  Returns None
+        if the file format cannot be written back.
+
+        """
+        u2d = cls(
+            model,
+            shape,
+            dtype,
+            fname,
+            name=name,
+            iprn=cr_dict["iprn"],
+            cnstnt=cr_dict["cnstnt"],
+            array_free_format=array_free_format,
+        )
+        try:
+            u2d.set_fmtin(cr_dict["fmtin"])
+        except Exception:
+            return None
+        u2d._source_filename = source_filename
+        return u2d
+
     @staticmethod
     def parse_control_record(
         line,
@@ -10,6 +10,7 @@ util_list module.  Contains the mflist class.
 from __future__ import division, print_function
 
 import os
+import hashlib
 import warnings
 import numpy as np
 from ..datbase import DataInterface, DataListInterface, DataType
@@ -54,6 +55,11 @@ class MfList(DataInterface, DataListInterface):
 
     Notes
     -----
+    Stress periods with identical recarray content share one recarray,
+    and a stress period with the same data as the previous one is written
+    with itmp = -1. A stress period gets its own copy of a shared recarray
+    when the recarray is returned by [] or data, so changing the returned
+    recarray only changes that stress period.
 
     Examples
     --------
@@ -93,6 +99,10 @@ class MfList(DataInterface, DataListInterface):
         self.__binary = binary
         self.__vtype = {}
         self.__data = {}
+        # recarrays keyed on their content, with the stress periods that
+        # share them, and the key of the recarray shared by each kper
+        self.__shared = {}
+        self.__shared_keys = {}
         if data is not None:
             self.__cast_data(data)
         self.__df = None
@@ -163,10 +173,10 @@ class MfList(DataInterface, DataListInterface):
         )
         assert isinstance(other, MfList), msg
 
-        other_kpers = list(other.data.keys())
+        other_kpers = list(other.__data.keys())
         other_kpers.sort()
 
-        self_kpers = list(self.data.keys())
+        self_kpers = list(self.__data.keys())
         self_kpers.sort()
 
         new_dict = {}
@@ -212,19 +222,21 @@ class MfList(DataInterface, DataListInterface):
             [(k, d) for k, d in self.dtype.descr if k not in fields]
         )
         spd = {}
-        for k, v in self.data.items():
+        for k, v in self.__data.items():
             # because np 1.9 doesn't support indexing by list of columns
-            newarr = np.array([self.data[k][n] for n in names]).transpose()
+            newarr = np.array([self.__data[k][n] for n in names]).transpose()
             newarr = np.array(list(map(tuple, newarr)), dtype=dtype).view(
                 np.recarray
             )
             for n in dtype.names:
-                newarr[n] = self.data[k][n]
+                newarr[n] = self.__data[k][n]
             spd[k] = newarr
         return MfList(self.package, spd, dtype=dtype)
 
     @property
     def data(self):
+        for kper in list(self.__shared_keys):
+            self.__unshare(kper)
         return self.__data
 
     @property
@@ -243,7 +255,7 @@ class MfList(DataInterface, DataListInterface):
 
     # Get the itmp for a given kper
     def get_itmp(self, kper):
-        if kper not in list(self.__data.keys()):
+        if kper not in self.__data:
             return None
         if self.__vtype[kper] is None:
             return -1
@@ -428,8 +440,7 @@ class MfList(DataInterface, DataListInterface):
             + "self dtype: "
             + str(self.dtype)
         )
-        self.__data[kper] = d
-        self.__vtype[kper] = np.recarray
+        self.__share_recarray(kper, d, False)
 
     def __cast_ndarray(self, kper, d):
         d = np.atleast_2d(d)
@@ -445,14 +456,59 @@ class MfList(DataInterface, DataListInterface):
             # warnings.warn("MfList: ndarray dtype does not match self " +\
             #               "dtype, trying to cast")
         try:
-            self.__data[kper] = np.core.records.fromarrays(
-                d.transpose(), dtype=self.dtype
-            )
+            d = np.core.records.fromarrays(d.transpose(), dtype=self.dtype)
         except Exception as e:
             raise Exception(
                 "MfList error: casting ndarray to recarray: " + str(e)
             )
+        self.__share_recarray(kper, d, True)
+
+    def __share_recarray(self, kper, d, private):
+        # Store the recarray for kper, sharing one recarray between stress
+        # periods with identical content. A recarray that is not private,
+        # such as one passed in by the user, is copied before it is shared.
+        self.__unshare(kper, copy=False)
+        self.__data[kper] = d
         self.__vtype[kper] = np.recarray
+        # object fields hold references, not content
+        if d.dtype.hasobject:
+            return
+        buffer = d.tobytes()
+        key = (d.shape, hashlib.sha1(buffer).hexdigest())
+        shared, kpers = self.__shared.get(key, (None, None))
+        if shared is d:
+            return
+        if shared is None or shared.tobytes() != buffer:
+            if private:
+                self.__shared[key] = (d, {kper})
+                self.__shared_keys[kper] = key
+            else:
+                self.__shared[key] = (d, None)
+            return
+        if kpers is None:
+            shared = d if private else d.copy()
+            kpers = set()
+            self.__shared[key] = (shared, kpers)
+        self.__data[kper] = shared
+        kpers.add(kper)
+        self.__shared_keys[kper] = key
+
+    def __unshare(self, kper, copy=True):
+        # Stop sharing the recarray of kper with other stress periods, so
+        # that it can be returned or replaced, and return the data of kper.
+        # If copy is True and other stress periods still share the
+        # recarray, kper gets its own copy.
+        key = self.__shared_keys.pop(kper, None)
+        if key is not None:
+            shared, kpers = self.__shared[key]
+            kpers.discard(kper)
+            if not kpers:
+                # the recarray is no longer shared, and it is visible
+                # outside of the MfList once it is returned
+                del self.__shared[key]
+            elif copy:
+                self.__data[kper] = shared.copy()
+        return self.__data.get(kper)
 
     def get_dataframe(self, squeeze=True):
         """
@@ -492,17 +548,17 @@ class MfList(DataInterface, DataListInterface):
         # find relevant variable names
         # may have to iterate over the first stress period
         for per in range(self._model.nper):
-            if hasattr(self.data[per], "dtype"):
+            if hasattr(self.__data[per], "dtype"):
                 varnames = list(
-                    [n for n in self.data[per].dtype.names if n not in names]
+                    [n for n in self.__data[per].dtype.names if n not in names]
                 )
                 break
 
         # create list of dataframes for each stress period
         # each with index of k, i, j
         dfs = []
-        for per in self.data.keys():
-            recs = self.data[per]
+        for per in self.__data.keys():
+            recs = self.__data[per]
             if recs is None or len(recs) == 0:
                 # add an empty dataframe if a stress period is
                 # empty (e.g. no pumping during a predevelopment
@@ -548,13 +604,14 @@ class MfList(DataInterface, DataListInterface):
         )
         # If we already have something for this kper, then add to it
         if kper in list(self.__data.keys()):
+            self.__unshare(kper, copy=False)
             if self.vtype[kper] == int:
                 # If a 0 or -1, reset
                 self.__data[kper] = self.get_empty(1)
                 self.__vtype[kper] = np.recarray
             elif self.vtype[kper] == str:
                 # If filename, load into recarray
-                d = self.__fromfile(self.data[kper])
+                d = self.__fromfile(self.__data[kper])
                 d.resize(d.shape[0], d.shape[1])
                 self.__data[kper] = d
                 self.__vtype[kper] = np.recarray
@@ -591,26 +648,27 @@ class MfList(DataInterface, DataListInterface):
                 "MfList error: _getitem__() passed invalid kper index:"
                 + str(kper)
             )
-        if kper not in list(self.data.keys()):
+        if kper not in list(self.__data.keys()):
             if kper == 0:
                 return self.get_empty()
             else:
-                return self.data[self.__find_last_kper(kper)]
+                return self.__unshare(self.__find_last_kper(kper))
         if self.vtype[kper] == int:
-            if self.data[kper] == 0:
+            if self.__data[kper] == 0:
                 return self.get_empty()
             else:
-                return self.data[self.__find_last_kper(kper)]
+                return self.__unshare(self.__find_last_kper(kper))
         if self.vtype[kper] == str:
-            return self.__fromfile(self.data[kper])
+            return self.__fromfile(self.__data[kper])
         if self.vtype[kper] == np.recarray:
-            return self.data[kper]
+            return self.__unshare(kper)
 
     def __setitem__(self, kper, data):
         if kper in list(self.__data.keys()):
             if self._model.verbose:
                 print("removing existing data for kper={}".format(kper))
-            self.data.pop(kper)
+            self.__unshare(kper, copy=False)
+            self.__data.pop(kper)
         # If data is a list, then all we can do is try to cast it to
         # an ndarray, then cast again to a recarray
         if isinstance(data, list):
@@ -652,7 +710,7 @@ class MfList(DataInterface, DataListInterface):
         return d
 
     def get_filenames(self):
-        kpers = list(self.data.keys())
+        kpers = list(self.__data.keys())
         kpers.sort()
         filenames = []
         first = kpers[0]
@@ -693,7 +751,7 @@ class MfList(DataInterface, DataListInterface):
         assert hasattr(f, "read"), (
             "MfList.write() error: " + "f argument must be a file handle"
         )
-        kpers = list(self.data.keys())
+        kpers = list(self.__data.keys())
         kpers.sort()
         first = kpers[0]
         if single_per is None:
@@ -703,12 +761,15 @@ class MfList(DataInterface, DataListInterface):
                 single_per = [single_per]
             loop_over_kpers = single_per
 
+        # recarray used by the last stress period that was written,
+        # only tracked when the whole sequence is written
+        last_data = None
         for kper in loop_over_kpers:
             # Fill missing early kpers with 0
             if kper < first:
                 itmp = 0
                 kper_vtype = int
-            elif kper in kpers:
+            elif kper in self.__data:
                 kper_data = self.__data[kper]
                 kper_vtype = self.__vtype[kper]
                 if kper_vtype == str:
@@ -718,8 +779,16 @@ class MfList(DataInterface, DataListInterface):
                     itmp = self.get_itmp(kper)
                 if kper_vtype == np.recarray:
                     itmp = kper_data.shape[0]
+                    # reuse the data of the previous stress period
+                    if self.__is_repeat(kper_data, last_data):
+                        itmp = -1
+                        kper_vtype = int
+                    elif single_per is None:
+                        last_data = kper_data
                 elif (kper_vtype == int) or (kper_vtype is None):
                     itmp = kper_data
+                if itmp >= 0 and kper_vtype != np.recarray:
+                    last_data = None
             # Fill late missing kpers with -1
             else:
                 itmp = -1
@@ -777,6 +846,18 @@ class MfList(DataInterface, DataListInterface):
                     f.write(" (BINARY)")
                 f.write("\n")
 
+    @staticmethod
+    def __is_repeat(data, last_data):
+        # check if the recarray data has the same content as last_data
+        if last_data is None:
+            return False
+        if data is last_data:
+            return True
+        return (
+            data.shape == last_data.shape
+            and data.tobytes() == last_data.tobytes()
+        )
+
     def __tofile(self, f, data):
         # Write the recarray (data) to the file (or file handle) f
         assert isinstance(data, np.recarray), (
@@ -815,7 +896,7 @@ class MfList(DataInterface, DataListInterface):
                 "MfList.check_kij(): unable to get dis info from " + "model"
             )
             return
-        for kper in list(self.data.keys()):
+        for kper in list(self.__data.keys()):
             out_idx = []
             data = self[kper]
             if data is not None:
@@ -847,12 +928,12 @@ class MfList(DataInterface, DataListInterface):
                     warnings.warn(warn_str)
 
     def __find_last_kper(self, kper):
-        kpers = list(self.data.keys())
+        kpers = list(self.__data.keys())
         kpers.sort()
         last = 0
         for kkper in kpers[::-1]:
             # if this entry is valid
-            if self.vtype[kkper] != int or self.data[kkper] != -1:
+            if self.vtype[kkper] != int or self.__data[kkper] != -1:
                 last = kkper
                 if kkper <= kper:
                     break
@@ -867,13 +948,13 @@ class MfList(DataInterface, DataListInterface):
         [lnames.append(name.lower()) for name in names]
         if "k" not in lnames or "j" not in lnames:
             raise NotImplementedError("MfList.get_indices requires kij")
-        kpers = list(self.data.keys())
+        kpers = list(self.__data.keys())
         kpers.sort()
         indices = []
         for i, kper in enumerate(kpers):
             kper_vtype = self.__vtype[kper]
             if (kper_vtype != int) or (kper_vtype is not None):
-                d = self.data[kper]
+                d = self.__data[kper]
                 if not indices:
                     indices = list(zip(d["k"], d["i"], d["j"]))
                 else:
@@ -887,7 +968,7 @@ class MfList(DataInterface, DataListInterface):
         assert attr in self.dtype.names
         if idx_val is not None:
             assert idx_val[0] in self.dtype.names
-        kpers = list(self.data.keys())
+        kpers = list(self.__data.keys())
         kpers.sort()
         values = []
         for kper in range(0, max(self._model.nper, max(kpers))):
@@ -1108,8 +1189,8 @@ class MfList(DataInterface, DataListInterface):
                 arrays[name] = arr.copy()
 
         # if this kper is not found
-        if kper not in self.data.keys():
-            kpers = list(self.data.keys())
+        if kper not in self.__data.keys():
+            kpers = list(self.__data.keys())
             kpers.sort()
             # if this kper is before the first entry,
             # (maybe) mask and return
@@ -1122,7 +1203,7 @@ class MfList(DataInterface, DataListInterface):
             else:
                 kper = self.__find_last_kper(kper)
 
-        sarr = self.data[kper]
+        sarr = self.__data[kper]
 
         if np.isscalar(sarr):
             # if there are no entries for this kper